@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create Checker tables."""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision = "b6f3c2a1d9e4"
+down_revision = "081eb89a9035"
+branch_labels = ()
+depends_on = ()
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "geo_checker_links_status",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("url_hash", sa.String(length=64), nullable=False),
+        sa.Column("url", sa.Text(), nullable=False),
+        sa.Column("is_available", sa.Boolean(), nullable=False),
+        sa.Column(
+            "last_checked",
+            sa.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+            nullable=False,
+        ),
+        sa.Column(
+            "next_check",
+            sa.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+            nullable=False,
+        ),
+        sa.Column("consecutive_failures", sa.Integer(), nullable=False),
+        sa.Column("consecutive_successes", sa.Integer(), nullable=False),
+        sa.Column("etag", sa.String(length=255), nullable=True),
+        sa.Column("last_modified", sa.String(length=255), nullable=True),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_geo_checker_links_status")),
+        sa.UniqueConstraint(
+            "url_hash", name=op.f("uq_geo_checker_links_status_url_hash")
+        ),
+    )
+    op.create_index(
+        op.f("ix_geo_checker_links_status_next_check"),
+        "geo_checker_links_status",
+        ["next_check"],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index(
+        op.f("ix_geo_checker_links_status_next_check"),
+        table_name="geo_checker_links_status",
+    )
+    op.drop_table("geo_checker_links_status")
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create Checker runs tables."""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision = "c41d8e7f2a95"
+down_revision = "b6f3c2a1d9e4"
+branch_labels = ()
+depends_on = ()
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "geo_checker_runs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("checker", sa.String(length=64), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+            nullable=False,
+        ),
+        sa.Column(
+            "completed",
+            sa.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+            nullable=True,
+        ),
+        sa.Column("stats", sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_geo_checker_runs")),
+    )
+    op.create_index(
+        op.f("ix_geo_checker_runs_checker"),
+        "geo_checker_runs",
+        ["checker"],
+        unique=False,
+    )
+    op.create_table(
+        "geo_checker_shards",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("run_id", sa.Integer(), nullable=False),
+        sa.Column("shard", sa.Integer(), nullable=False),
+        sa.Column("first_owner", sa.Integer(), nullable=True),
+        sa.Column("last_owner", sa.Integer(), nullable=True),
+        sa.Column(
+            "started",
+            sa.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+            nullable=True,
+        ),
+        sa.Column(
+            "finished",
+            sa.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+            nullable=True,
+        ),
+        sa.Column("stats", sa.JSON(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["run_id"],
+            ["geo_checker_runs.id"],
+            name=op.f("fk_geo_checker_shards_run_id_geo_checker_runs"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_geo_checker_shards")),
+        sa.UniqueConstraint(
+            "run_id", "shard", name=op.f("uq_geo_checker_shards_run_id")
+        ),
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_table("geo_checker_shards")
+    op.drop_index(op.f("ix_geo_checker_runs_checker"), table_name="geo_checker_runs")
+    op.drop_table("geo_checker_runs")
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create Checker owners state table."""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision = "d8a3e5b9c0f1"
+down_revision = "c41d8e7f2a95"
+branch_labels = ()
+depends_on = ()
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "geo_checker_owners_state",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("checker", sa.String(length=64), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "watermark",
+            sa.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+            nullable=False,
+        ),
+        sa.Column("state_hash", sa.String(length=64), nullable=False),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_geo_checker_owners_state")),
+        sa.UniqueConstraint(
+            "checker", "owner_id", name=op.f("uq_geo_checker_owners_state_checker")
+        ),
+    )
+    op.create_index(
+        op.f("ix_geo_checker_owners_state_watermark"),
+        "geo_checker_owners_state",
+        ["watermark"],
+        unique=False,
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_index(
+        op.f("ix_geo_checker_owners_state_watermark"),
+        table_name="geo_checker_owners_state",
+    )
+    op.drop_table("geo_checker_owners_state")
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create Checker reports table."""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+# revision identifiers, used by Alembic.
+revision = "e5c1a7f3b2d8"
+down_revision = "d8a3e5b9c0f1"
+branch_labels = ()
+depends_on = ()
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "geo_checker_reports",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("run_id", sa.Integer(), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created",
+            sa.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"),
+            nullable=False,
+        ),
+        sa.Column("payload", sa.JSON(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["run_id"],
+            ["geo_checker_runs.id"],
+            name=op.f("fk_geo_checker_reports_run_id_geo_checker_runs"),
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_geo_checker_reports")),
+        sa.UniqueConstraint(
+            "run_id", "owner_id", name=op.f("uq_geo_checker_reports_run_id")
+        ),
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_table("geo_checker_reports")
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Create Checker locks table."""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f2b7d4c9e1a3"
+down_revision = "e5c1a7f3b2d8"
+branch_labels = ()
+depends_on = ()
+
+
+def upgrade():
+    """Upgrade database."""
+    op.create_table(
+        "geo_checker_locks",
+        sa.Column("checker", sa.String(length=64), nullable=False),
+        sa.PrimaryKeyConstraint("checker", name=op.f("pk_geo_checker_locks")),
+    )
+
+
+def downgrade():
+    """Downgrade database."""
+    op.drop_table("geo_checker_locks")
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Geo Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Identity map for records loaded by the GEO RDM Records proxies."""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_identity_map = ContextVar("geo_rdm_records_identity_map", default=None)
+
+
+def current_identity_map():
+    """Get the active identity map.
+
+    Returns:
+        dict: Active identity map or ``None`` if no identity map is active.
+    """
+    return _identity_map.get()
+
+
+@contextmanager
+def records_identity_map():
+    """Activate an identity map for the records loaded by the proxies.
+
+    While the identity map is active, each record is loaded only once, even
+    if it is referenced by many proxies (e.g., the same resource resolved in
+    the validation and in the publication of a package). Nested calls reuse
+    the identity map created by the outermost call.
+
+    Note:
+        This function can also be used as a decorator.
+    """
+    identity_map = _identity_map.get()
+
+    if identity_map is not None:
+        yield identity_map
+        return
+
+    token = _identity_map.set({})
+
+    try:
+        yield _identity_map.get()
+    finally:
+        _identity_map.reset(token)
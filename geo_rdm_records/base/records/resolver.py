@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Geo Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Bulk record resolver for the GEO RDM Records."""
+
+from invenio_pidstore.models import PersistentIdentifier, PIDStatus
+
+
+def _load_records(record_cls, pids):
+    """Load the records associated with the given PIDs (one query).
+
+    Args:
+        record_cls (invenio_records.Record): Record class used to load the records.
+
+        pids (dict): PIDs indexed by the object uuid.
+
+    Returns:
+        dict: Records indexed by the PID value.
+    """
+    if not pids:
+        return {}
+
+    pid_field = record_cls.pid.field
+    records = record_cls.get_records(list(pids.keys()))
+
+    resolved = {}
+    for record in records:
+        pid = pids[record.id]
+
+        # same behavior of the ``pid.resolve``: storing the pid in the record cache
+        pid_field._set_cache(record, pid)
+        resolved[pid.pid_value] = record
+
+    return resolved
+
+
+def resolve_records(ids, record_cls, draft_cls=None):
+    """Resolve many records (or drafts) using their PID values.
+
+    This is a bulk version of the ``pid.resolve(id_, registered_only=False)``
+    with fallback to the draft class. Instead of one lookup per record, it
+    uses one query for the PIDs, one for the records and one for the drafts.
+
+    Args:
+        ids (Iterable[str]): PID values of the records (e.g., ``['0pfec-m8509']``).
+
+        record_cls (invenio_records.Record): Record class used to load the records.
+
+        draft_cls (invenio_records.Record): Draft class used when a record is not
+                                            published. If ``None``, drafts are not loaded.
+
+    Returns:
+        dict: Resolved records indexed by the PID value. Values that can't be
+              resolved are not included in the result.
+    """
+    ids = list(dict.fromkeys(ids))
+
+    if not ids:
+        return {}
+
+    pids = PersistentIdentifier.query.filter(
+        PersistentIdentifier.pid_type == record_cls.pid.field._pid_type,
+        PersistentIdentifier.pid_value.in_(ids),
+        PersistentIdentifier.status != PIDStatus.DELETED,
+    ).all()
+
+    pids = {pid.object_uuid: pid for pid in pids if pid.object_uuid}
+
+    # 1. Published records
+    resolved = _load_records(record_cls, pids)
+
+    # 2. Drafts (only for the PIDs without published records)
+    if draft_cls is not None:
+        pids = {
+            object_uuid: pid
+            for object_uuid, pid in pids.items()
+            if pid.pid_value not in resolved
+        }
+
+        resolved.update(_load_records(draft_cls, pids))
+
+    return resolved
@@ -7,9 +7,13 @@
 
 """Record proxy for system fields."""
 
+from collections.abc import MutableSequence
+
 from invenio_pidstore.errors import PIDDoesNotExistError
 from sqlalchemy.orm.exc import NoResultFound
 
+from geo_rdm_records.base.records.identity_map import current_identity_map
+from geo_rdm_records.base.records.resolver import resolve_records
 from geo_rdm_records.class_factory import ClassFactory
 
 
@@ -80,33 +84,100 @@ class BaseRecordProxy:
         """Load defined classes from the ``ClassFactory``."""
         return ClassFactory.resolve(value) if type(value) == str else value
 
+    def _identity_key(self):
+        """Key used to store the record in the identity map."""
+        draft_cls = self.draft_cls if self.allow_drafts else None
+
+        return self.record_cls, draft_cls, self.is_parent, self.record_id
+
+    def _set_entity(self, entity):
+        """Store the resolved record in the proxy and in the identity map."""
+        self._entity = entity
+
+        identity_map = current_identity_map()
+
+        if identity_map is not None and entity is not None:
+            identity_map[self._identity_key()] = entity
+
     #
     # Data handling interface
     #
     def resolve(self):
         """Resolve the record entity (e.g., RDMRecord)."""
         if self._entity is None and self.record_id is not None:
+            identity_map = current_identity_map() or {}
+            entity = identity_map.get(self._identity_key())
+
+            if entity is not None:
+                self._entity = entity
+
             # If parent is used, then return it
-            if self.is_parent:
-                self._entity = self.record_cls.parent_record_cls.pid.resolve(
-                    self.record_id, registered_only=False
+            elif self.is_parent:
+                self._set_entity(
+                    self.record_cls.parent_record_cls.pid.resolve(
+                        self.record_id, registered_only=False
+                    )
                 )
 
             else:
                 try:
-                    self._entity = self.record_cls.pid.resolve(
-                        self.record_id, registered_only=False
+                    self._set_entity(
+                        self.record_cls.pid.resolve(
+                            self.record_id, registered_only=False
+                        )
                     )
                 except NoResultFound:
                     if self.allow_drafts:
-                        self._entity = self.draft_cls.pid.resolve(
-                            self.record_id, registered_only=False
+                        self._set_entity(
+                            self.draft_cls.pid.resolve(
+                                self.record_id, registered_only=False
+                            )
                         )
                 except PIDDoesNotExistError:
                     self._entity = None
 
         return self._entity
 
+    @classmethod
+    def resolve_many(cls, proxies):
+        """Resolve the record entity of many proxies at once.
+
+        The records are loaded in bulk (one query for the records and one for
+        the drafts). Records already available in the active identity map are
+        not loaded again.
+
+        Args:
+            proxies (Iterable[BaseRecordProxy]): Proxies to be resolved. All proxies
+                                                 must use the same configuration
+                                                 (classes and flags).
+        """
+        identity_map = current_identity_map() or {}
+
+        pending = []
+        for proxy in proxies:
+            if proxy._entity is None and proxy.record_id is not None:
+                entity = identity_map.get(proxy._identity_key())
+
+                if entity is not None:
+                    proxy._entity = entity
+                else:
+                    pending.append(proxy)
+
+        if not pending:
+            return
+
+        proxy = pending[0]
+        ids = [proxy.record_id for proxy in pending]
+
+        if proxy.is_parent:
+            records = resolve_records(ids, proxy.record_cls.parent_record_cls)
+        else:
+            draft_cls = proxy.draft_cls if proxy.allow_drafts else None
+            records = resolve_records(ids, proxy.record_cls, draft_cls)
+
+        for proxy in pending:
+            proxy._set_entity(records.get(proxy.record_id))
+
     def dump(self):
         """Dump the record as a dictionary."""
         res = {}
@@ -121,10 +192,13 @@ class BaseRecordProxy:
     #
     def __hash__(self):
         """Return hash(self)."""
-        return self.record_id
+        return hash(self.record_id)
 
     def __eq__(self, other):
         """Return self == other."""
+        if not isinstance(other, BaseRecordProxy):
+            return NotImplemented
+
         return self.record_id == other.record_id
 
     def __ne__(self, other):
@@ -140,8 +214,18 @@ class BaseRecordProxy:
         return repr(self.resolve())
 
 
-class BaseRecordsProxy(list):
-    """A list of records."""
+class BaseRecordsProxy(MutableSequence):
+    """A list of records.
+
+    Note:
+        The records are stored in an insertion-ordered dictionary indexed by
+        the record id, so ``append``, ``remove`` and membership tests are
+        constant-time operations. For the positional access, an ordered list
+        of the records is kept next to the dictionary: it is rebuilt (once) only
+        after a removal or a positional change. So, reading by position is
+        constant-time, while ``insert``, ``pop(i)`` and the assignment/deletion
+        by position are linear (as in a ``list``).
+    """
 
     record_proxy_cls = BaseRecordProxy
     """Class used to proxy the records from the database."""
@@ -150,34 +234,196 @@ class BaseRecordsProxy(list):
         """Initializer."""
         self.record_proxy_cls = record_proxy_cls or self.record_proxy_cls
 
+        self._records = {}  # record_id -> record_proxy
+        self._ordered = []  # records in order (``None`` when must be rebuilt)
+
         for record in records or []:
             self.add(record)
 
+    #
+    # Auxiliary methods
+    #
+    def _proxy(self, record):
+        """Get the record proxy of the given record."""
+        if isinstance(record, self.record_proxy_cls):
+            return record
+
+        return self.record_proxy_cls(record)
+
+    def _ordered_records(self):
+        """Get the ordered list of records (rebuilt only if needed)."""
+        if self._ordered is None:
+            self._ordered = list(self._records.values())
+
+        return self._ordered
+
+    def _replace(self, records):
+        """Replace all records by the given (ordered) records."""
+        self._records = {}
+        self._ordered = []
+
+        self.extend(records)
+
+    #
+    # Data handling interface
+    #
     def add(self, record):
         """Alias for self.append(record)."""
         self.append(record)
 
     def append(self, record):
         """Add a new record to the list of records."""
-        record_proxy = self.record_proxy_cls(record)
+        record_proxy = self._proxy(record)
+
+        if record_proxy.record_id not in self._records:
+            self._records[record_proxy.record_id] = record_proxy
 
-        if record_proxy not in self:
-            super().append(record_proxy)
+            if self._ordered is not None:
+                self._ordered.append(record_proxy)
 
     def extend(self, records):
         """Add all new items from another list to the current list."""
         for record in records:
             self.add(record)
 
+    def insert(self, index, record):
+        """Insert a new record before the index."""
+        record_proxy = self._proxy(record)
+
+        if record_proxy.record_id not in self._records:
+            records = list(self._ordered_records())
+            records.insert(index, record_proxy)
+
+            self._replace(records)
+
     def remove(self, record):
         """Remove the specified record from the list of records."""
-        record_proxy = record
+        record_proxy = self._proxy(record)
+
+        try:
+            del self._records[record_proxy.record_id]
+        except KeyError as e:
+            raise ValueError(f"{record_proxy.record_id} is not in the list") from e
+
+        self._ordered = None
+
+    def pop(self, index=-1):
+        """Remove and return the record at the index (default last)."""
+        record_proxy = self._ordered_records()[index]
+        self.remove(record_proxy)
+
+        return record_proxy
+
+    def index(self, record, start=0, stop=None):
+        """Return the first index of the record."""
+        record_id = self._proxy(record).record_id
+
+        if record_id not in self._records:
+            raise ValueError(f"{record_id} is not in the list")
+
+        records = self._ordered_records()
+        stop = len(records) if stop is None else stop
+
+        for index in range(len(records))[start:stop]:
+            if records[index].record_id == record_id:
+                return index
+
+        raise ValueError(f"{record_id} is not in the list")
+
+    def reverse(self):
+        """Reverse the records in place."""
+        self._replace(list(reversed(self._ordered_records())))
 
-        if type(record) != self.record_proxy_cls:
-            record_proxy = self.record_proxy_cls(record)
+    def clear(self):
+        """Remove all records from the list."""
+        self._records.clear()
+        self._ordered = []
+
+    def resolve_all(self, raise_error=False):
+        """Resolve all records in bulk.
+
+        Args:
+            raise_error (bool): Flag to raise an error when a record can't be resolved.
+
+        Returns:
+            list: Resolved records (e.g., RDMRecord). Records that can't be
+                  resolved are represented as ``None``.
+
+        Raises:
+            PIDDoesNotExistError: When ``raise_error`` is ``True`` and a record
+                                  can't be resolved.
+        """
+        self.record_proxy_cls.resolve_many(self)
+
+        records = [record._entity for record in self]
+
+        if raise_error:
+            for record_proxy, record in zip(self, records):
+                if record is None:
+                    record_cls = record_proxy.record_cls
+
+                    if record_proxy.is_parent:
+                        record_cls = record_cls.parent_record_cls
+
+                    raise PIDDoesNotExistError(
+                        record_cls.pid.field._pid_type, record_proxy.record_id
+                    )
 
-        super().remove(record_proxy)
+        return records
 
     def dump(self):
         """Dump the records."""
         return [record.dump() for record in self]
+
+    #
+    # Dunder methods
+    #
+    def __contains__(self, record):
+        """Return record in self."""
+        return self._proxy(record).record_id in self._records
+
+    def __iter__(self):
+        """Return iter(self).
+
+        Note:
+            The iteration runs over the ordered list of records. Removals only mark
+            the list to be rebuilt, so records can be removed while iterating.
+        """
+        return iter(self._ordered_records())
+
+    def __len__(self):
+        """Return len(self)."""
+        return len(self._records)
+
+    def __getitem__(self, index):
+        """Return self[index]."""
+        return self._ordered_records()[index]
+
+    def __setitem__(self, index, record):
+        """Set self[index] to record."""
+        records = list(self._ordered_records())
+
+        if isinstance(index, slice):
+            records[index] = [self._proxy(item) for item in record]
+        else:
+            records[index] = self._proxy(record)
+
+        self._replace(records)
+
+    def __delitem__(self, index):
+        """Delete self[index]."""
+        records = list(self._ordered_records())
+        del records[index]
+
+        self._replace(records)
+
+    def __eq__(self, other):
+        """Return self == other."""
+        if isinstance(other, (BaseRecordsProxy, list)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return repr(list(self))
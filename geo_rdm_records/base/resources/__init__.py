@@ -7,7 +7,11 @@
 
 """Base resources for the GEO RDM Records."""
 
-from .args import GEOSearchRequestArgsSchema
+from .args import GEOCursorSearchRequestArgsSchema, GEOSearchRequestArgsSchema
 from .config import BaseGEOResourceConfig
 
-__all__ = ("BaseGEOResourceConfig", "GEOSearchRequestArgsSchema")
+__all__ = (
+    "BaseGEOResourceConfig",
+    "GEOCursorSearchRequestArgsSchema",
+    "GEOSearchRequestArgsSchema",
+)
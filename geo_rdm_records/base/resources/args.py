@@ -12,10 +12,11 @@ from marshmallow import fields, post_load
 
 
 class GEOSearchRequestArgsSchema(SearchRequestArgsSchema):
-    """Extend schema with `CSL` and `Bounding box` fields."""
+    """Extend schema with `CSL`, `Bounding box` and hits tracking fields."""
 
     style = fields.Str()
     locale = fields.Str()
+    track_total_hits = fields.Str()
 
     filters = ["bbox"]
     """Filters."""
@@ -35,3 +36,9 @@ class GEOSearchRequestArgsSchema(SearchRequestArgsSchema):
             else:
                 data["facets"][k] = original_data.getlist(k)
         return data
+
+
+class GEOCursorSearchRequestArgsSchema(GEOSearchRequestArgsSchema):
+    """Extend schema with the `cursor` field (cursor-based pagination)."""
+
+    cursor = fields.Str()
@@ -9,9 +9,12 @@
 
 from invenio_drafts_resources.services.records.config import SearchOptions
 from invenio_rdm_records.services import config as rdm_config
-from invenio_records_resources.services.base.config import FromConfigSearchOptions
+from invenio_records_resources.services.base.config import (
+    FromConfig,
+    FromConfigSearchOptions,
+)
 
-from .params import BoundingBoxParam, FacetsParam
+from .params import BoundingBoxParam, CursorParam, FacetsParam, TrackTotalHitsParam
 
 
 class GEOSearchOptionsMixin:
@@ -29,6 +32,7 @@ class GEOSearchOptionsMixin:
             [
                 *SearchOptions.params_interpreters_cls,
                 BoundingBoxParam.factory("metadata.locations.features.geometry"),
+                TrackTotalHitsParam,
             ],
         )
     )
@@ -38,7 +42,8 @@ class GEOSearchOptions(GEOSearchOptionsMixin, rdm_config.RDMSearchOptions):
     """Search options for record search."""
 
     params_interpreters_cls = rdm_config.RDMSearchOptions.params_interpreters_cls + [
-        BoundingBoxParam.factory("metadata.locations.features.geometry")
+        BoundingBoxParam.factory("metadata.locations.features.geometry"),
+        TrackTotalHitsParam,
     ]
 
 
@@ -47,7 +52,10 @@ class GEOSearchDraftsOptions(GEOSearchOptionsMixin, rdm_config.RDMSearchDraftsOp
 
     params_interpreters_cls = (
         rdm_config.RDMSearchDraftsOptions.params_interpreters_cls
-        + [BoundingBoxParam.factory("metadata.locations.features.geometry")]
+        + [
+            BoundingBoxParam.factory("metadata.locations.features.geometry"),
+            TrackTotalHitsParam,
+        ]
     )
 
 
@@ -58,10 +66,27 @@ class GEOSearchVersionsOptions(
 
     params_interpreters_cls = (
         rdm_config.RDMSearchVersionsOptions.params_interpreters_cls
-        + [BoundingBoxParam.factory("metadata.locations.features.geometry")]
+        + [
+            BoundingBoxParam.factory("metadata.locations.features.geometry"),
+            TrackTotalHitsParam,
+        ]
     )
 
 
+class GEOCursorSearchOptions(GEOSearchOptions):
+    """Search options for record search (with cursor-based pagination)."""
+
+    params_interpreters_cls = GEOSearchOptions.params_interpreters_cls + [CursorParam]
+
+
+class GEOCursorSearchDraftsOptions(GEOSearchDraftsOptions):
+    """Search options for draft search (with cursor-based pagination)."""
+
+    params_interpreters_cls = GEOSearchDraftsOptions.params_interpreters_cls + [
+        CursorParam
+    ]
+
+
 class BaseGEOServiceConfig(rdm_config.RDMRecordServiceConfig):
     """GEO record draft service config."""
 
@@ -85,6 +110,9 @@ class BaseGEOServiceConfig(rdm_config.RDMRecordServiceConfig):
         search_option_cls=GEOSearchVersionsOptions,
     )
 
+    # Hits tracking policy of each search endpoint (exact count by default)
+    search_track_total_hits = FromConfig("GEO_RDM_SEARCH_TRACK_TOTAL_HITS", default={})
+
     # Indices used to suggest related content
     indices_more_like_this = []
 
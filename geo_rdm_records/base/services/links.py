@@ -9,9 +9,14 @@
 
 from copy import deepcopy
 
+from invenio_records_resources.services.base.links import (
+    ConditionalLink,
+    Link,
+)
 from invenio_records_resources.services.base.links import (
     LinksTemplate as BaseLinksTemplate,
 )
+from invenio_records_resources.services.base.links import preprocess_vars
 
 from geo_rdm_records.modules.marketplace.records.api import (
     GEOMarketplaceItem,
@@ -45,36 +50,167 @@ class LinksRegistryType:
     @classmethod
     def guess_type(cls, obj, error=True):
         """Guess object type based on the types available."""
-        for key in cls.supported_types.keys():
-            if isinstance(obj, cls.supported_types.get(key)):
+        # fast path: objects from the supported classes
+        for key, types in cls.supported_types.items():
+            if type(obj) in types:
+                return key
+
+        # slow path: objects from subclasses
+        for key, types in cls.supported_types.items():
+            if isinstance(obj, types):
                 return key
 
         if error:
             raise RuntimeError("Not able to mutate the link: Type not supported")
 
 
+def cursor_pagination_links(tpl):
+    """Create cursor pagination links (self/next) from the same template.
+
+    Note:
+        The links are expanded with a ``CursorPagination`` object.
+    """
+    return {
+        "self": Link(tpl),
+        "next": Link(
+            tpl,
+            when=lambda pagination, ctx: pagination.has_next,
+            vars=lambda pagination, vars: vars["args"].update(
+                {"cursor": pagination.next_cursor}
+            ),
+        ),
+    }
+
+
+class CompiledLink:
+    """Link prepared to be expanded many times.
+
+    The conditions of the ``ConditionalLink`` objects are evaluated only once
+    for each object and the template variables are created with a shallow copy
+    of the context (instead of the deep copy done by the ``Link.expand``).
+
+    Note:
+        The compiled expansion reads the attributes of the ``Link`` and
+        ``ConditionalLink`` classes (e.g., ``_uritemplate``). Links with custom
+        ``should_render``/``expand`` methods, or without these attributes (e.g.,
+        in other versions of ``invenio-records-resources``), are expanded with
+        their own public methods. Also, the ``vars`` functions must not change
+        nested values of the context, as it is shared by all objects.
+    """
+
+    conditional_attrs = ("_condition", "_if_link", "_else_link")
+    """Attributes used to compile ``ConditionalLink`` objects."""
+
+    link_attrs = ("_when_func", "_vars_func", "_uritemplate")
+    """Attributes used to compile ``Link`` objects."""
+
+    def __init__(self, link):
+        """Initializer.
+
+        Args:
+            link (Union[Link, ConditionalLink]): Link to be compiled.
+        """
+        self._link = link
+
+        self._is_conditional = isinstance(link, ConditionalLink) and all(
+            hasattr(link, attr) for attr in self.conditional_attrs
+        )
+
+        if self._is_conditional:
+            self._condition = link._condition
+            self._if_link = CompiledLink(link._if_link)
+            self._else_link = CompiledLink(link._else_link)
+
+        self._is_default = (
+            isinstance(link, Link)
+            and type(link).should_render is Link.should_render
+            and type(link).expand is Link.expand
+            and all(hasattr(link, attr) for attr in self.link_attrs)
+        )
+
+    def expand(self, obj, ctx):
+        """Expand the link.
+
+        Returns:
+            str: Expanded link or ``None`` if it must not be rendered.
+        """
+        if self._is_conditional:
+            link = self._if_link if self._condition(obj, ctx) else self._else_link
+            return link.expand(obj, ctx)
+
+        link = self._link
+
+        if not self._is_default:
+            return link.expand(obj, ctx) if link.should_render(obj, ctx) else None
+
+        if link._when_func and not link._when_func(obj, ctx):
+            return None
+
+        vars = dict(ctx)
+
+        link.vars(obj, vars)
+        if link._vars_func:
+            link._vars_func(obj, vars)
+
+        return link._uritemplate.expand(**preprocess_vars(vars))
+
+
 class MutableLinksTemplate(BaseLinksTemplate):
-    """Templates for generating links for an object."""
+    """Templates for generating links for an object.
+
+    Links are compiled once and the context of each type is created once per
+    call, so many objects can be expanded together (see ``expand_many``).
+    """
 
     def __init__(self, links, types_registry, context=None):
         """Initializer."""
         super().__init__(links, context)
 
         self.types_registry = types_registry
+        self._compiled_links = {
+            key: CompiledLink(link) for key, link in self._links.items()
+        }
 
     def expand(self, identity, obj):
         """Expand all the link templates."""
-        # defining the object type
-        obj_type = self.types_registry.guess_type(obj, error=True)
+        return self.expand_many(identity, [obj])[0]
+
+    def expand_many(self, identity, objs):
+        """Expand all the link templates of many objects.
 
-        # updating the context with the type
+        Args:
+            identity (flask_principal.Identity): User identity.
+
+            objs (list): Objects (records or drafts) to be expanded.
+
+        Returns:
+            list: Links of each object.
+        """
         ctx = deepcopy(self.context)
-        ctx.update(dict(entity=obj_type, identity=identity))
+        ctx["identity"] = identity
+
+        # the context is created only once for each type.
+        types_ctx = {}
+
+        results = []
+
+        for obj in objs:
+            # defining the object type
+            obj_type = self.types_registry.guess_type(obj, error=True)
+
+            obj_ctx = types_ctx.get(obj_type)
+            if obj_ctx is None:
+                obj_ctx = types_ctx[obj_type] = {**ctx, "entity": obj_type}
+
+            # expanding links
+            links = {}
+
+            for key, link in self._compiled_links.items():
+                value = link.expand(obj, obj_ctx)
+
+                if value is not None:
+                    links[key] = value
 
-        # expanding links
-        links = {}
+            results.append(links)
 
-        for key, link in self._links.items():
-            if link.should_render(obj, ctx):
-                links[key] = link.expand(obj, ctx)
-        return links
+        return results
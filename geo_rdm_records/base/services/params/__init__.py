@@ -8,6 +8,23 @@
 """GEO RDM Records Services Params interpreters."""
 
 from .facets import FacetsParam
-from .search import BoundingBoxParam
+from .search import (
+    BoundingBoxParam,
+    CursorParam,
+    TrackTotalHitsParam,
+    close_point_in_time,
+    decode_cursor,
+    encode_cursor,
+    is_new_cursor,
+)
 
-__all__ = ("FacetsParam", "BoundingBoxParam")
+__all__ = (
+    "FacetsParam",
+    "BoundingBoxParam",
+    "CursorParam",
+    "TrackTotalHitsParam",
+    "close_point_in_time",
+    "decode_cursor",
+    "encode_cursor",
+    "is_new_cursor",
+)
@@ -7,11 +7,15 @@
 
 """GEO RDM Records Search Params."""
 
+import base64
+import json
 from functools import partial
 
+from flask import current_app
 from geojson import Point
 from invenio_records_resources.services.errors import QuerystringValidationError
 from invenio_records_resources.services.records.params.base import ParamInterpreter
+from invenio_search import current_search_client
 
 
 def _validate_point_coordinates(point):
@@ -130,3 +134,203 @@ class BoundingBoxParam(ParamInterpreter):
                 }
             )
         return search
+
+
+def parse_track_total_hits(value):
+    """Parse a hits tracking policy.
+
+    Args:
+        value (Union[bool, int, str]): Hits tracking policy. It can be ``true`` (exact count),
+                                       ``false`` (no count) or the maximum number of hits counted.
+
+    Returns:
+        Union[bool, int]: Value of the ``track_total_hits`` search parameter.
+
+    Example:
+        >>> parse_track_total_hits("1000")
+        1000
+    """
+    if isinstance(value, (bool, int)):
+        return value
+
+    value = str(value).strip().lower()
+
+    if value in ("true", "false"):
+        return value == "true"
+
+    try:
+        value = int(value)
+    except ValueError:
+        raise QuerystringValidationError(
+            "The hits tracking must be `true`, `false` or a positive number."
+        )
+
+    if value <= 0:
+        raise QuerystringValidationError(
+            "The maximum number of hits tracked must be a positive number."
+        )
+
+    return value
+
+
+def clamp_track_total_hits(value, maximum):
+    """Limit a hits tracking policy to the maximum allowed.
+
+    Args:
+        value (Union[bool, int]): Hits tracking policy requested.
+
+        maximum (Union[bool, int]): Hits tracking policy of the endpoint (maximum allowed).
+
+    Returns:
+        Union[bool, int]: Hits tracking policy that can be used.
+
+    Example:
+        >>> clamp_track_total_hits(True, 10000)
+        10000
+    """
+    if maximum is True or value is False:
+        return value
+
+    if maximum is False:
+        return False
+
+    if value is True:
+        return maximum
+
+    return min(value, maximum)
+
+
+class TrackTotalHitsParam(ParamInterpreter):
+    """Evaluates the 'track_total_hits' parameter.
+
+    Note:
+        The parameter overrides the hits tracking policy of the endpoint
+        (see ``BaseSearchMultiIndexService.track_total_hits``), but it can't
+        count more hits than the endpoint policy allows.
+    """
+
+    def apply(self, identity, search, params):
+        """Evaluate the `track_total_hits` parameter on the query string."""
+        track_total_hits = params.get("track_total_hits")
+
+        if track_total_hits is not None:
+            maximum = search.to_dict().get("track_total_hits", True)
+
+            search = search.extra(
+                track_total_hits=clamp_track_total_hits(
+                    parse_track_total_hits(track_total_hits), maximum
+                )
+            )
+
+        return search
+
+
+def encode_cursor(pit_id, search_after):
+    """Create an opaque cursor token.
+
+    Args:
+        pit_id (str): Point in time ID.
+
+        search_after (list): Sort values of the last hit returned.
+
+    Returns:
+        str: Cursor token.
+    """
+    cursor = json.dumps(dict(pit=pit_id, after=search_after), separators=(",", ":"))
+    return base64.urlsafe_b64encode(cursor.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """Read an opaque cursor token.
+
+    Args:
+        cursor (str): Cursor token (created by ``encode_cursor``).
+
+    Returns:
+        tuple: Point in time ID and the sort values of the last hit returned.
+    """
+    try:
+        cursor = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        pit_id, search_after = cursor["pit"], cursor["after"]
+    except (ValueError, TypeError, KeyError):
+        raise QuerystringValidationError("Invalid cursor.")
+
+    # only the ``*`` cursor can open a new point in time.
+    if not isinstance(pit_id, str) or not pit_id or not isinstance(search_after, list):
+        raise QuerystringValidationError("Invalid cursor.")
+
+    return pit_id, search_after
+
+
+def is_new_cursor(cursor):
+    """Check if a cursor starts a new walk (opening a new point in time).
+
+    Args:
+        cursor (str): Cursor token (``None`` outside the cursor mode).
+
+    Returns:
+        bool: True if the cursor is ``*`` (or empty).
+    """
+    return cursor in ("", "*")
+
+
+def close_point_in_time(pit_id):
+    """Delete a point in time (PIT) that is no longer used.
+
+    Args:
+        pit_id (str): Point in time ID.
+
+    Note:
+        PITs already expired (or deleted) are ignored.
+    """
+    current_search_client.delete_point_in_time(body={"pit_id": [pit_id]}, ignore=[404])
+
+
+class CursorParam(ParamInterpreter):
+    """Evaluates the 'cursor' parameter.
+
+    In the cursor mode, the search uses a point in time (PIT) of the indices and
+    the ``search_after`` of the last hit returned, instead of the ``from`` offset.
+    So, the cost of a page doesn't depend on how deep it is. To start a walk, the
+    cursor must be ``*``. The next cursors are available in the ``next`` link.
+
+    Note:
+        This interpreter must run after the sort and pagination interpreters. The
+        permission to open new PITs (``search_cursor``) is checked by the services,
+        which also delete the PIT once the last page is returned.
+    """
+
+    tiebreaker = {"uuid": {"order": "asc", "unmapped_type": "keyword"}}
+    """Sort used to break ties between hits with the same sort values."""
+
+    def apply(self, identity, search, params):
+        """Evaluate the `cursor` parameter on the query string."""
+        cursor = params.get("cursor")
+
+        if cursor is None:
+            return search
+
+        keep_alive = current_app.config["GEO_RDM_SEARCH_CURSOR_KEEP_ALIVE"]
+
+        if is_new_cursor(cursor):
+            pit = current_search_client.create_point_in_time(
+                index=",".join(search._index), keep_alive=keep_alive
+            )
+            pit_id, search_after = pit["pit_id"], None
+        else:
+            pit_id, search_after = decode_cursor(cursor)
+
+        # searches using a PIT can't define the indices and the preference.
+        search = (
+            search.index()
+            .params(preference=None)
+            .sort(*(search._sort or ["_score"]), self.tiebreaker)
+            .extra(pit=dict(id=pit_id, keep_alive=keep_alive))
+        )
+
+        search = search[0 : params["size"]]
+
+        if search_after:
+            search = search.extra(search_after=search_after)
+
+        return search
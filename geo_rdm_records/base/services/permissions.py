@@ -69,6 +69,8 @@ class BaseGEOPermissionPolicy(RecordPermissionPolicy):
     #
     # Allow searching of records
     can_search = can_all
+    # Allow starting cursor-based searches (each one opens a point in time)
+    can_search_cursor = can_authenticated
 
     # Allow reading metadata of a record
     can_read = [
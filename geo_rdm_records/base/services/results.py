@@ -7,10 +7,13 @@
 
 """GEO RDM Records Services results."""
 
+from invenio_records_resources.pagination import Pagination
 from invenio_records_resources.services.records.results import (
     RecordList as BaseRecordList,
 )
 
+from geo_rdm_records.base.records.types import GEORecordTypes
+from geo_rdm_records.base.services.params import decode_cursor, encode_cursor
 from geo_rdm_records.modules.marketplace.records.api import (
     GEOMarketplaceItem,
     GEOMarketplaceItemDraft,
@@ -36,47 +39,262 @@ class ResultRegistryType:
         ),
     }
 
+    types_keys = {
+        GEORecordTypes.package: "packages",
+        GEORecordTypes.resource: "records",
+        GEORecordTypes.marketplace_item: "marketplace-items",
+    }
+    """Supported types indexed by the record type (``parent.type``)."""
+
+    @classmethod
+    def _guess_key(cls, obj):
+        """Guess the object type key using the ``$schema`` (slow path)."""
+        schema_ = obj.get("$schema", "")
+        schema_parent_ = obj.get("parent", {}).get("$schema", "")
+
+        for key in cls.supported_types.keys():
+            if key in schema_ or key in schema_parent_:
+                return key
+
+    @classmethod
+    def guess_class(cls, obj, error=True):
+        """Guess object class based on the types available.
+
+        The type is defined by the ``parent.type`` field. The ``$schema`` is
+        used only for objects without this field.
+        """
+        key = cls.types_keys.get(obj.get("parent", {}).get("type"))
+
+        if key is None:
+            key = cls._guess_key(obj)
+
+        if key is None:
+            if error:
+                raise RuntimeError("Not able to mutate the record: Type not supported")
+
+            return None
+
+        cls_type = "record" if obj.get("is_published", False) else "draft"
+        return cls.supported_types[key][cls_type]
+
     @classmethod
     def guess_type(cls, obj, error=True):
         """Guess object type based on the types available."""
-        for key in cls.supported_types.keys():
-            cls_type = "draft"
+        record_cls = cls.guess_class(obj, error=error)
 
-            schema_ = obj.get("$schema", "")
-            schema_parent_ = obj.get("parent", {}).get("$schema", "")
+        if record_cls is not None:
+            # creating the object
+            return record_cls.loads(obj)
 
-            if key in schema_ or key in schema_parent_:
-                if obj.get("is_published", False):
-                    cls_type = "record"
 
-                # creating the object
-                return cls.supported_types[key][cls_type].loads(obj)
+class CursorPagination:
+    """Pagination of the searches using cursors (``search_after`` and PIT)."""
+
+    def __init__(self, size, cursor, next_cursor=None):
+        """Initializer.
+
+        Args:
+            size (int): Page size.
+
+            cursor (str): Cursor of the current page.
+
+            next_cursor (str): Cursor of the next page (``None`` for the last page).
+        """
+        self.size = size
+        self.cursor = cursor
+        self.next_cursor = next_cursor
 
-        if error:
-            raise RuntimeError("Not able to mutate the record: Type not supported")
+    @property
+    def has_next(self):
+        """True if there is a next page."""
+        return self.next_cursor is not None
+
+    @classmethod
+    def from_results(cls, results, size, cursor):
+        """Create the pagination of a search result.
+
+        Args:
+            results (invenio_search.engine.dsl.response.Response): Search result.
+
+            size (int): Page size.
+
+            cursor (str): Cursor of the current page.
+
+        Returns:
+            CursorPagination: Pagination of the search result.
+        """
+        hits = results.hits
+        next_cursor = None
+
+        if len(hits) == size:
+            pit_id = getattr(results, "pit_id", None)
+
+            if pit_id is None:  # PIT ID from the current cursor
+                pit_id, _ = decode_cursor(cursor)
+
+            next_cursor = encode_cursor(pit_id, list(hits[-1].meta.sort))
+
+        return cls(size, cursor, next_cursor)
 
 
 class MutableRecordList(BaseRecordList):
-    """List of records result."""
+    """List of records result.
+
+    Note:
+        The search can be done without the exact count of hits (see the
+        ``track_total_hits`` policy of the search services). In this case, the
+        ``total`` is a lower bound of the number of hits, and the pagination
+        assumes there is a next page when the current one is full.
+    """
+
+    #
+    # Auxiliary methods
+    #
+    def _hits_total(self):
+        """Get the hits total from the search engine (``None`` if not tracked)."""
+        return getattr(self._results.hits, "total", None)
+
+    def _hits_seen(self):
+        """Get the number of hits until the current page (inclusive)."""
+        hits = len(self._results.hits)
+
+        if not self._params:
+            return hits
+
+        return (self._params.get("page", 1) - 1) * self._params["size"] + hits
+
+    #
+    # Properties
+    #
+    @property
+    def total(self):
+        """Get total number of hits (lower bound if the total is not exact)."""
+        if not hasattr(self._results, "hits"):
+            # handle scan(): returns a generator
+            return None
+
+        total = self._hits_total()
+        hits_seen = self._hits_seen()
+
+        if total is None:
+            return hits_seen
+
+        return max(total["value"], hits_seen)
+
+    @property
+    def is_total_exact(self):
+        """Check if the total number of hits is exact."""
+        if not hasattr(self._results, "hits"):
+            return False
+
+        total = self._hits_total()
+        return total is not None and total["relation"] == "eq"
+
+    @property
+    def pagination(self):
+        """Create a pagination object."""
+        size = self._params["size"]
+        page = self._params.get("page", 1)
+
+        cursor = self._params.get("cursor")
+
+        if cursor is not None:
+            return CursorPagination.from_results(self._results, size, cursor)
+
+        max_results = self.total
+
+        # without the exact total, a full page may be followed by other pages.
+        if not self.is_total_exact and len(self._results.hits) == size:
+            max_results = max(max_results, page * size + 1)
+
+        return Pagination(size, page, max_results)
 
     @property
     def hits(self):
-        """Iterator over the hits."""
+        """Iterator over the hits.
+
+        Note:
+            The schema is created once and reused by all hits. Only the ``record``
+            in the schema context is changed for each hit. Also, the links of
+            all hits are expanded together.
+
+        ToDo:
+            Each hit is still loaded as a record (``Record.loads``), running the
+            ``post_load`` of all system fields. Projecting the hits straight from
+            the ``_source`` dict (loading the records only for the expandable
+            fields) is not implemented: the item schemas (e.g., ``files``,
+            ``versions`` and ``access``) and the links templates (e.g., ``pid``
+            and ``is_published``) read the record system fields, so it needs a
+            projection schema for the ``_source`` dicts.
+        """
+        context = self._schema._build_context(dict(identity=self._identity))
+        schema = self._schema.schema(context=context)
+
+        records = []
+        projections = []
+
         for hit in self._results:
             # Load dump
             record = self._service.results_registry_type.guess_type(hit.to_dict())
 
             # Project the record
-            projection = self._schema.dump(
-                record,
-                context=dict(
-                    identity=self._identity,
-                    record=record,
-                ),
-            )
-            if self._links_item_tpl:
-                projection["links"] = self._links_item_tpl.expand(
-                    self._identity, record
-                )
-
-            yield projection
+            context["record"] = record
+
+            records.append(record)
+            projections.append(schema.dump(record))
+
+        if self._links_item_tpl:
+            links = self._links_item_tpl.expand_many(self._identity, records)
+
+            for projection, projection_links in zip(projections, links):
+                projection["links"] = projection_links
+
+        yield from projections
+
+    def to_dict(self):
+        """Return result as a dictionary."""
+        res = super().to_dict()
+
+        if not self.is_total_exact:
+            res["hits"]["total_relation"] = "gte"
+
+        return res
+
+
+class CachedRecordList:
+    """List of records result loaded from a cache (already serialized)."""
+
+    def __init__(self, data):
+        """Initializer.
+
+        Args:
+            data (dict): Serialized result (output of the ``RecordList.to_dict``).
+        """
+        self._data = data
+
+    def __len__(self):
+        """Return the total number of hits."""
+        return self.total
+
+    def __iter__(self):
+        """Iterator over the hits."""
+        return self.hits
+
+    @property
+    def total(self):
+        """Get total number of hits."""
+        return self._data["hits"]["total"]
+
+    @property
+    def aggregations(self):
+        """Get the search result aggregations."""
+        return self._data.get("aggregations")
+
+    @property
+    def hits(self):
+        """Iterator over the hits."""
+        return iter(self._data["hits"]["hits"])
+
+    def to_dict(self):
+        """Return result as a dictionary."""
+        return self._data
@@ -17,6 +17,8 @@ from invenio_records_resources.services import LinksTemplate
 from invenio_requests.services.results import EntityResolverExpandableField
 from invenio_search import current_search_client
 
+from .params import close_point_in_time, is_new_cursor
+
 
 class BaseSearchMultiIndexService(BaseRecordService):
     """Search records across multiple indices."""
@@ -35,6 +37,20 @@ class BaseSearchMultiIndexService(BaseRecordService):
             ParentCommunitiesExpandableField("parent.communities.default"),
         ]
 
+    def track_total_hits(self, endpoint):
+        """Get the hits tracking policy of a search endpoint.
+
+        Args:
+            endpoint (str): Name of the endpoint (e.g., ``search``).
+
+        Returns:
+            Union[bool, int]: ``True`` to count all hits, ``False`` to not count them
+                              or the maximum number of hits counted.
+        """
+        policies = getattr(self.config, "search_track_total_hits", None) or {}
+
+        return policies.get(endpoint, True)
+
     #
     # Auxiliary methods
     #
@@ -48,6 +64,7 @@ class BaseSearchMultiIndexService(BaseRecordService):
         extra_filter=None,
         indices=None,
         index=None,
+        track_total_hits=True,
     ):
         """Instantiate a search class."""
         if permission_action:
@@ -78,7 +95,7 @@ class BaseSearchMultiIndexService(BaseRecordService):
 
         # Extras
         extras = {}
-        extras["track_total_hits"] = True
+        extras["track_total_hits"] = track_total_hits
         search = search.extra(**extras)
 
         return search
@@ -93,6 +110,7 @@ class BaseSearchMultiIndexService(BaseRecordService):
         extra_filter=None,
         permission_action="read",
         indices=None,
+        track_total_hits=True,
     ):
         """Factory for creating a Search DSL instance."""
         search = self.create_search(
@@ -103,6 +121,7 @@ class BaseSearchMultiIndexService(BaseRecordService):
             preference=preference,
             extra_filter=extra_filter,
             indices=indices,
+            track_total_hits=track_total_hits,
         )
 
         # Run search args evaluator
@@ -123,9 +142,17 @@ class BaseSearchMultiIndexService(BaseRecordService):
         permission_action="read",
         indices=None,
         index=None,
+        track_total_hits=None,
         **kwargs,
     ):
-        """Create the Elasticsearch DSL."""
+        """Create the Elasticsearch DSL.
+
+        Note:
+            When ``track_total_hits`` is not defined, the policy of the
+            endpoint with the same name of the ``action`` is used. Starting
+            a cursor walk (``cursor=*``) requires the ``search_cursor`` permission,
+            since each walk opens a point in time in the search cluster.
+        """
         # Merge params
         # NOTE: We allow using both the params variable, as well as kwargs. The
         # params is used by the resource, and kwargs is used to have an easier
@@ -133,6 +160,9 @@ class BaseSearchMultiIndexService(BaseRecordService):
         # .search(idty, params={'q': '...'}).
         params.update(kwargs)
 
+        if is_new_cursor(params.get("cursor")):
+            self.require_permission(identity, "search_cursor")
+
         # Create an Elasticsearch DSL
         search = self.search_request(
             identity,
@@ -143,6 +173,11 @@ class BaseSearchMultiIndexService(BaseRecordService):
             extra_filter=extra_filter,
             permission_action=permission_action,
             indices=indices,
+            track_total_hits=(
+                self.track_total_hits(action)
+                if track_total_hits is None
+                else track_total_hits
+            ),
         )
 
         # Run components
@@ -151,6 +186,27 @@ class BaseSearchMultiIndexService(BaseRecordService):
                 search = getattr(component, action)(identity, search, params)
         return search
 
+    def _execute_search(self, search, params):
+        """Execute a search.
+
+        In the cursor mode, the point in time (PIT) is deleted when the last page is
+        returned (i.e., there is no next cursor), instead of waiting for it to expire.
+        """
+        search_result = search.execute()
+
+        if (
+            params.get("cursor") is not None
+            and len(search_result.hits) < params["size"]
+        ):
+            pit_id = getattr(search_result, "pit_id", None)
+
+            if pit_id is None:  # PIT ID from the search request
+                pit_id = search.to_dict()["pit"]["id"]
+
+            close_point_in_time(pit_id)
+
+        return search_result
+
 
 class BaseRelatedRecordsSearchService(
     BaseRDMRecordService, BaseSearchMultiIndexService
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Geo Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Unit of work operations for the GEO RDM Records."""
+
+from invenio_records_resources.services.uow import Operation
+from invenio_search import current_search_client
+from invenio_search.engine import search
+from invenio_search.utils import build_alias_name
+
+
+class RecordBulkIndexOp(Operation):
+    """Record bulk indexing operation.
+
+    Indexes (and removes from the index) many records using a single bulk
+    request, instead of one request per record as in the ``RecordIndexOp``
+    and ``RecordDeleteOp`` operations.
+
+    Note:
+        The documents are prepared by the indexer (``_prepare_record``), so they
+        are the same documents created by ``RecordIndexer.index`` (including the
+        ``before_record_index`` signal). The indexer has no public method to
+        prepare a document without sending it.
+    """
+
+    def __init__(self, indexer, index_refresh=False):
+        """Initializer.
+
+        Args:
+            indexer (invenio_indexer.api.RecordIndexer): Indexer used to prepare
+                                                         the documents.
+
+            index_refresh (bool): Flag indicating if the indexes must be refreshed.
+        """
+        self._indexer = indexer
+        self._index_refresh = index_refresh
+
+        # records are identified by the index and the id, as a record and its
+        # draft share the same id (in different indexes).
+        self._records = {}
+        self._deleted = {}
+
+    #
+    # Auxiliary methods
+    #
+    def _key(self, record):
+        """Key of a record in the operation (index and id)."""
+        return self._indexer.record_to_index(record), str(record.id)
+
+    def _action(self, key, record, op_type):
+        """Create the bulk action of a record."""
+        index, id_ = key
+
+        action = {
+            "_op_type": op_type,
+            "_index": build_alias_name(index),
+            "_id": id_,
+        }
+
+        if op_type == "index":
+            action.update(
+                {
+                    "_version": record.revision_id,
+                    "_version_type": self._indexer._version_type,
+                    "_source": self._indexer._prepare_record(record, index),
+                }
+            )
+
+        return action
+
+    #
+    # High-level API
+    #
+    def index(self, record):
+        """Add a record to be indexed."""
+        key = self._key(record)
+
+        self._deleted.pop(key, None)
+        self._records[key] = record
+
+    def delete(self, record):
+        """Add a record to be removed from the index."""
+        key = self._key(record)
+
+        self._records.pop(key, None)
+        self._deleted[key] = record
+
+    def on_commit(self, uow):
+        """Run the bulk operation."""
+        # removals are sent first
+        actions = [
+            *[
+                self._action(key, record, "delete")
+                for key, record in self._deleted.items()
+            ],
+            *[
+                self._action(key, record, "index")
+                for key, record in self._records.items()
+            ],
+        ]
+
+        if not actions:
+            return
+
+        _, errors = search.helpers.bulk(
+            current_search_client,
+            actions,
+            refresh=self._index_refresh,
+            raise_on_error=False,
+        )
+
+        # same behavior of the ``RecordDeleteOp``: records not indexed are ignored.
+        errors = [
+            error
+            for error in errors
+            if not (error.get("delete") and error["delete"].get("status") == 404)
+        ]
+
+        if errors:
+            raise search.helpers.BulkIndexError(
+                f"{len(errors)} document(s) failed to index.", errors
+            )
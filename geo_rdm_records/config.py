@@ -173,6 +173,30 @@ RDM_SEARCH_PACKAGE_RESOURCE_DRAFTS = {
     "sort": ["bestmatch", "updated-desc", "updated-asc", "newest", "oldest", "version"],
 }
 
+GEO_RDM_SEARCH_TRACK_TOTAL_HITS = {"search": 10000}
+"""Hits tracking policy of each search endpoint: ``True`` (exact count), ``False``
+(no count) or the maximum number of hits counted. Endpoints not listed use the exact
+count. Requests can change it using the ``track_total_hits`` parameter."""
+
+GEO_RDM_SEARCH_CACHE_CONFIG = {
+    "enabled": False,
+    "backend": "local",
+    "redis_url": None,
+    "ttl": 60,
+    "refresh_interval": 1,
+    "max_entries": 1024,
+}
+"""Cache of the public (anonymous) multi-index searches (disabled by default). Use the
+``redis`` backend (with ``redis_url``) to share the cache between processes. Entries are
+invalidated each time a published record is indexed. With the ``local`` backend (per-process
+LRU cache), only the process indexing the record is invalidated and the other processes may
+return outdated results until the entries expire (``ttl``)."""
+
+GEO_RDM_SEARCH_CURSOR_KEEP_ALIVE = "5m"
+"""Time to keep the point in time (PIT) of the cursor-based searches (between pages). The
+PIT is deleted when the last page is returned, and only users with the ``search_cursor``
+permission (authenticated users by default) can start new cursor-based searches."""
+
 #
 # Review
 #
@@ -195,8 +219,16 @@ GEO_RDM_NOTIFICATION_DEFAULT_RECEIVER_EMAILS = []
 #
 # Checker configuration
 #
-GEO_RDM_CHECKER_LINKS_RETRY_CONFIG = {"retries": 5, "backoff_factor": 0.3}
-"""Retry configurations (based on retry-requests library)."""
+GEO_RDM_CHECKER_LINKS_RETRY_CONFIG = {
+    "retries": 5,
+    "backoff_factor": 0.3,
+    "connect_retries": 1,
+    "read_retries": 2,
+    "status_retries": 3,
+    "status_to_retry": [429, 500, 502, 503, 504],
+}
+"""Retry configurations (based on urllib3 Retry). Connection errors (e.g., DNS failures),
+read errors (e.g., timeouts) and HTTP errors have separate retry budgets."""
 
 GEO_RDM_CHECKER_LINKS_REQUEST_CONFIG = {
     "timeout": 10,
@@ -208,6 +240,43 @@ GEO_RDM_CHECKER_LINKS_REQUEST_CONFIG = {
 }
 """Request configuration (based on requests (get method) library."""
 
+GEO_RDM_CHECKER_LINKS_ENGINE_CONFIG = {
+    "max_workers": 16,
+    "max_connections_per_host": 2,
+    "politeness_delay": 0.5,
+}
+"""Link checker engine configuration (concurrency and politeness per host)."""
+
+GEO_RDM_CHECKER_LINKS_TRANSPORT_CONFIG = {"type": "session"}
+"""Link checker transport configuration. Use ``session`` for real requests, ``replay``
+(with ``fixtures``) to replay recorded responses or ``simulated`` to simulate servers
+(e.g., in tests and benchmarks without network)."""
+
+GEO_RDM_CHECKER_LINKS_STATUS_CONFIG = {
+    "enabled": True,
+    "healthy_interval": 7,
+    "max_healthy_interval": 60,
+    "failure_interval": 1,
+    "max_failure_interval": 14,
+    "flapping_interval": 1,
+}
+"""Links status store configuration (intervals, in days, to re-check each link)."""
+
+GEO_RDM_CHECKER_LINKS_FIELDS = [
+    "metadata.description",
+    "metadata.additional_descriptions.description",
+    "metadata.related_identifiers.identifier",
+    "metadata.identifiers.identifier",
+    "metadata.references.reference",
+    "metadata.rights.link",
+    "metadata.rights.description",
+    "metadata.locations.features.place",
+    "metadata.locations.features.description",
+    "metadata.funding.award.identifiers.identifier",
+    "metadata.marketplace.launch_url",
+]
+"""Records fields (dotted paths) where the links are searched by the links checker."""
+
 GEO_RDM_CHECKER_LINKS_REPORT_TITLE = _(
     "GEO Knowledge Hub - Links status from your records"
 )
@@ -219,6 +288,33 @@ GEO_RDM_CHECKER_OUTDATED_REPORT_TITLE = _("GEO Knowledge Hub - Your records stat
 GEO_RDM_CHECKER_OUTDATED_CRITERIA = 6 * 365 / 12
 """Criteria used to set if a record is outdated."""
 
+GEO_RDM_CHECKER_OUTDATED_INCREMENTAL = False
+"""Enable the incremental mode of the outdated records checker (only owners with
+changes since the last run are checked and reported)."""
+
+GEO_RDM_CHECKER_RUNS_CONFIG = {
+    "shards": 8,
+    "shard_timeout": 6 * 60 * 60,
+    "run_timeout": 24 * 60 * 60,
+}
+"""Checkers runs configuration (number of shards and the timeouts, in seconds, of a shard
+and of a run). Runs not completed before the ``run_timeout`` are no longer resumed."""
+
+GEO_RDM_CHECKER_METRICS_CONFIG = {"output_dir": None, "prometheus": False}
+"""Checkers metrics configuration. The run summaries are always stored in the database
+and, optionally, written as JSON in ``output_dir``. When ``prometheus`` is ``True`` (and
+``prometheus_client`` is installed), the metrics are also exported as Prometheus counters."""
+
+GEO_RDM_CHECKER_REPORTS_DELIVERY_CONFIG = {
+    "batch_size": 50,
+    "render_workers": 4,
+    "max_retries": 3,
+    "retry_delay": 5 * 60,
+}
+"""Checkers reports delivery configuration (reports per batch, workers rendering the
+reports and retries, with delay in seconds, of the batches not delivered). Reports are
+rendered in threads."""
+
 GEO_RDM_CHECKER_ALLOWED_EMAILS = []
 """Owners that can receive emails from checker (If empty, all owner are allowed)."""
 
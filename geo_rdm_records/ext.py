@@ -7,6 +7,7 @@
 
 """GEO RDM Records extension definition."""
 
+from invenio_indexer.signals import before_record_index
 from invenio_rdm_records.services.pids import PIDManager, PIDsService
 from invenio_rdm_records.services.review.service import ReviewService
 from invenio_records_resources.resources.files import FileResource
@@ -55,6 +56,7 @@ from .modules.packages.services.secret_links import SecretLinkService
 from .modules.packages.services.service import GEOPackageRecordService
 from .modules.search.resources.config import SearchRecordResourceConfig
 from .modules.search.resources.resource import SearchRecordResource
+from .modules.search.services.cache import create_search_cache
 from .modules.search.services.config import SearchRecordServiceConfig
 from .modules.search.services.service import SearchRecordService
 
@@ -120,7 +122,20 @@ class GEORDMRecords(object):
         )
 
         # Search service (Packages and records)
-        self.service_search = SearchRecordService(config=service_configs.search)
+        # only the published records invalidate the cache
+        search_types = service_configs.search.results_registry_type.supported_types
+
+        self.search_cache = create_search_cache(
+            app.config["GEO_RDM_SEARCH_CACHE_CONFIG"],
+            record_types=[types["record"] for types in search_types.values()],
+        )
+        self.service_search = SearchRecordService(
+            config=service_configs.search, cache=self.search_cache
+        )
+
+        if self.search_cache is not None:
+            # new published content must be visible in the public searches
+            before_record_index.connect(self.search_cache.invalidate_record)
 
         # Assistance requests service
         self.service_requests_notification = RequestNotificationService(
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Checker runs (shards and checkpoints) utility module."""
+
+import json
+import math
+import os
+from datetime import datetime, timedelta
+
+from invenio_accounts.models import User
+from invenio_db import db
+from invenio_search.engine import dsl
+from pydash import py_
+from sqlalchemy.exc import IntegrityError
+
+from geo_rdm_records.modules.checker.base.records import OWNER_FIELD
+from geo_rdm_records.modules.checker.models import (
+    GEOCheckerLock,
+    GEOCheckerRun,
+    GEOCheckerShard,
+)
+
+
+#
+# Utilities
+#
+def _owners_ranges(shards):
+    """Split the owners (users) in contiguous ranges of IDs.
+
+    Args:
+        shards (int): Number of ranges.
+
+    Returns:
+        list: List of tuples with the first and the last owner of each range. The
+              first and the last ranges are open, so owners created during the run
+              are also checked.
+    """
+    users = [user_id for (user_id,) in db.session.query(User.id).order_by(User.id)]
+
+    if not users:
+        return [(None, None)]
+
+    chunks = py_.chunk(users, math.ceil(len(users) / max(shards, 1)))
+    ranges = [[chunk[0], chunk[-1]] for chunk in chunks]
+
+    ranges[0][0] = None
+    ranges[-1][1] = None
+
+    return [tuple(range_) for range_ in ranges]
+
+
+def _merge_stats(stats):
+    """Merge (sum) many statistics objects (nested objects are merged recursively)."""
+    merged = {}
+
+    for stat in stats:
+        for key, value in (stat or {}).items():
+            if isinstance(value, dict):
+                merged[key] = _merge_stats([merged.get(key), value])
+            else:
+                merged[key] = merged.get(key, 0) + value
+
+    return merged
+
+
+def _owners_filter(first_owner, last_owner):
+    """Create the filter to select the records of the owners in a range of IDs.
+
+    The owners are indexed as keywords, so a single ``range`` query would compare
+    the IDs as strings (e.g., ``"10" < "9"``). As the string order is the same
+    as the numeric order for IDs with the same number of digits, the range is
+    split by the number of digits of the IDs.
+
+    Args:
+        first_owner (int): First owner of the range. If ``None``, the range is open.
+
+        last_owner (int): Last owner of the range. If ``None``, the range is open.
+
+    Returns:
+        invenio_search.engine.dsl.query.Query: Owners filter.
+    """
+    first_owner = 0 if first_owner is None else first_owner
+
+    first_digits = len(str(first_owner))
+    last_digits = first_digits if last_owner is None else len(str(last_owner))
+
+    queries = []
+
+    for digits in range(first_digits, last_digits + 1):
+        bounds = {}
+
+        if digits == first_digits:
+            bounds["gte"] = str(first_owner)
+
+        if last_owner is not None and digits == last_digits:
+            bounds["lte"] = str(last_owner)
+
+        queries.append(
+            dsl.Q("regexp", **{OWNER_FIELD: f"[0-9]{{{digits}}}"})
+            & dsl.Q("range", **{OWNER_FIELD: bounds})
+        )
+
+    # open range: owners with more digits than the first owner
+    if last_owner is None:
+        queries.append(
+            dsl.Q("regexp", **{OWNER_FIELD: f"[0-9]{{{first_digits + 1},}}"})
+        )
+
+    return dsl.Q("bool", should=queries, minimum_should_match=1)
+
+
+def _lock_checker(checker):
+    """Lock the runs of a checker until the end of the transaction.
+
+    The lock row of the checker is created on the first dispatch. When two
+    dispatches create it at the same time, one of them fails with an integrity
+    error (ignored) and waits for the lock of the row created by the other.
+    """
+    lock = GEOCheckerLock.query.filter_by(checker=checker).with_for_update()
+
+    if lock.one_or_none() is None:
+        try:
+            with db.session.begin_nested():
+                db.session.add(GEOCheckerLock(checker=checker))
+        except IntegrityError:
+            pass
+
+        lock.one()
+
+
+def _get_shard(run_id, shard):
+    """Get a shard of a run."""
+    return GEOCheckerShard.query.filter_by(run_id=run_id, shard=shard).one()
+
+
+#
+# High-level functions
+#
+def start_run(checker, shards, run_timeout=None):
+    """Start (or resume) a checker run.
+
+    If the last run of the checker was not completed (e.g., a worker crashed), it
+    is resumed, so only its pending shards are processed again.
+
+    Args:
+        checker (str): Name of the checker.
+
+        shards (int): Number of shards used when a new run is created.
+
+        run_timeout (int): Time (in seconds) after which a run that was not
+                           completed is no longer resumed. If ``None``, the
+                           runs are always resumed.
+
+    Returns:
+        GEOCheckerRun: Checker run.
+
+    Note:
+        The lock row of the checker (``GEOCheckerLock``) is locked while the run
+        is selected or created, so concurrent dispatches don't create two runs: the
+        second dispatch waits for the first one to commit and then resumes its run.
+    """
+    _lock_checker(checker)
+
+    now = datetime.utcnow()
+
+    # locking read (refreshing the loaded runs): the runs committed while
+    # waiting for the lock are visible.
+    run = (
+        GEOCheckerRun.query.filter_by(checker=checker)
+        .order_by(GEOCheckerRun.created.desc())
+        .with_for_update()
+        .populate_existing()
+        .first()
+    )
+
+    run_is_stale = (
+        run is not None
+        and run_timeout is not None
+        and run.created < now - timedelta(seconds=run_timeout)
+    )
+
+    if run is None or run.completed is not None or run_is_stale:
+        run = GEOCheckerRun(checker=checker, created=now)
+        run.shards = [
+            GEOCheckerShard(shard=shard, first_owner=first_owner, last_owner=last_owner)
+            for shard, (first_owner, last_owner) in enumerate(_owners_ranges(shards))
+        ]
+
+        db.session.add(run)
+
+    # releasing the lock
+    db.session.commit()
+
+    return run
+
+
+def pending_shards(run, shard_timeout):
+    """List the shards of a run that must be processed.
+
+    Args:
+        run (GEOCheckerRun): Checker run.
+
+        shard_timeout (int): Time (in seconds) after which a started shard that
+                             was not finished is considered failed.
+
+    Returns:
+        list: Numbers of the pending shards.
+    """
+    timeout = datetime.utcnow() - timedelta(seconds=shard_timeout)
+
+    return [
+        shard.shard
+        for shard in run.shards
+        if shard.finished is None and (shard.started is None or shard.started < timeout)
+    ]
+
+
+def start_shard(run_id, shard):
+    """Start the processing of a shard.
+
+    Args:
+        run_id (int): Run ID.
+
+        shard (int): Shard number.
+
+    Returns:
+        invenio_search.engine.dsl.query.Query: Filter to select the records of the
+                                               shard owners.
+    """
+    shard = _get_shard(run_id, shard)
+
+    shard.started = datetime.utcnow()
+    db.session.commit()
+
+    return _owners_filter(shard.first_owner, shard.last_owner)
+
+
+def get_shard_owners(run_id, shard):
+    """Get the range of owners of a shard.
+
+    Args:
+        run_id (int): Run ID.
+
+        shard (int): Shard number.
+
+    Returns:
+        tuple: First and last owner of the shard (``None`` for open ranges).
+    """
+    shard = _get_shard(run_id, shard)
+
+    return shard.first_owner, shard.last_owner
+
+
+def finish_shard(run_id, shard, stats):
+    """Finish the processing of a shard (checkpoint).
+
+    Args:
+        run_id (int): Run ID.
+
+        shard (int): Shard number.
+
+        stats (dict): Statistics of the shard.
+    """
+    shard = _get_shard(run_id, shard)
+
+    shard.stats = stats
+    shard.finished = datetime.utcnow()
+
+    db.session.commit()
+
+
+def finish_run(run_id, output_dir=None):
+    """Finish a checker run.
+
+    Args:
+        run_id (int): Run ID.
+
+        output_dir (str): Directory where the run summary (JSON) is written. If
+                          ``None``, the summary is only stored in the database.
+
+    Returns:
+        dict: Aggregated statistics of all shards of the run.
+    """
+    run = GEOCheckerRun.query.get(run_id)
+
+    run.stats = _merge_stats([shard.stats for shard in run.shards])
+    run.completed = datetime.utcnow()
+
+    db.session.commit()
+
+    if output_dir:
+        summary = dict(
+            id=run.id,
+            checker=run.checker,
+            created=run.created.isoformat(),
+            completed=run.completed.isoformat(),
+            shards=len(run.shards),
+            stats=run.stats,
+        )
+
+        summary_file = os.path.join(output_dir, f"{run.checker}-{run.id}.json")
+
+        with open(summary_file, "w") as summary_output:
+            json.dump(summary, summary_output, indent=2)
+
+    return run.stats
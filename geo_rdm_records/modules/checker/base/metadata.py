@@ -11,36 +11,76 @@ from invenio_access.permissions import system_identity
 from invenio_rdm_records.proxies import current_rdm_records_service
 
 from geo_rdm_records.base.records.types import GEORecordTypes
+from geo_rdm_records.modules.checker.base.records import get_records_by_ids
 from geo_rdm_records.proxies import current_geo_packages_service
 
 
+def _service(type_):
+    """Get the service of a record type."""
+    if type_ == GEORecordTypes.package:
+        return current_geo_packages_service
+
+    return current_rdm_records_service
+
+
+def index_records_metadata(metadata_cache):
+    """Index the already loaded metadata by the record ID.
+
+    Args:
+        metadata_cache (dict): Dict containing already loaded metadata of
+                               ``packages`` and ``resources``.
+
+    Returns:
+        dict: Metadata of ``packages`` and ``resources`` indexed by the record ID.
+    """
+    return {
+        key: {record["id"]: record for record in metadata_cache.get(key, [])}
+        for key in ["packages", "resources"]
+    }
+
+
+def load_records_metadata(ids, cache_, type_):
+    """Load the metadata of the records not available in the cache.
+
+    The missing records are read in a single (batched) search.
+
+    Args:
+        ids (Iterable[str]): Records IDs.
+
+        cache_ (dict): Metadata indexed by the record ID. The loaded metadata is
+                       included in this dict.
+
+        type_ (str): Type of record.
+
+    Returns:
+        dict: Cache with the loaded metadata.
+    """
+    missing_ids = [rid_ for rid_ in dict.fromkeys(ids) if rid_ not in cache_]
+
+    if missing_ids:
+        records = get_records_by_ids(_service(type_), missing_ids)
+        cache_.update({record["id"]: record for record in records})
+
+    return cache_
+
+
 def expand_record_metadata(rid_, cache_, type_):
     """Read metadata of a record.
 
     Args:
         rid_ (str): Record ID.
 
-        cache_ (dict): Dict containing already loaded metadata.
+        cache_ (dict): Dict containing already loaded metadata (indexed by the record ID).
 
         type_ (str): Type of record.
 
     Returns:
         dict: Record metadata.
     """
-    result_data = list(filter(lambda x: x["id"] == rid_, cache_))
-
-    if not result_data:
-        if type_ == GEORecordTypes.package:
-            result_data = current_geo_packages_service.read(
-                identity=system_identity, id_=rid_
-            ).to_dict()
-
-        else:
-            result_data = current_rdm_records_service.read(
-                identity=system_identity, id_=rid_
-            ).to_dict()
+    result_data = cache_.get(rid_)
 
-    else:
-        result_data = result_data[0]
+    if result_data is None:
+        result_data = _service(type_).read(identity=system_identity, id_=rid_).to_dict()
+        cache_[rid_] = result_data
 
     return result_data
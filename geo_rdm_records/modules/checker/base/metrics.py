@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Checkers run metrics module."""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover
+    prometheus_client = None
+
+LATENCY_BUCKETS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+"""Upper bounds (in seconds) of the hosts latency histogram buckets."""
+
+_prometheus_metrics = {}
+"""Prometheus metrics (created only when ``prometheus_client`` is available)."""
+
+
+def _prometheus_metric(type_, name, documentation, labels):
+    """Get (or create) a Prometheus metric."""
+    if name not in _prometheus_metrics:
+        _prometheus_metrics[name] = type_(name, documentation, labels)
+
+    return _prometheus_metrics[name]
+
+
+class RunMetrics:
+    """Metrics of a checker run.
+
+    Collects the time spent in each phase of a run (e.g., search, extraction,
+    network), counters (e.g., number of URLs and cache hits) and a latency
+    histogram for each host.
+
+    Note:
+        Counters and latencies can be updated from many threads.
+    """
+
+    def __init__(self, checker):
+        """Initializer.
+
+        Args:
+            checker (str): Name of the checker.
+        """
+        self.checker = checker
+
+        self._phases = {}
+        self._counters = {}
+        self._hosts = {}
+
+        self._lock = threading.Lock()
+
+    #
+    # Collection API
+    #
+    @contextmanager
+    def phase(self, name):
+        """Measure the time spent in a step of the run (accumulated in many calls).
+
+        Args:
+            name (str): Name of the phase.
+        """
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name, seconds):
+        """Add time to a phase.
+
+        Args:
+            name (str): Name of the phase.
+
+            seconds (float): Time spent (in seconds).
+        """
+        with self._lock:
+            self._phases[name] = self._phases.get(name, 0.0) + seconds
+
+    def timed(self, iterable, name):
+        """Measure the time spent producing the items of an iterable (e.g., a search).
+
+        Args:
+            iterable (Iterable): Iterable measured (e.g., generator).
+
+            name (str): Name of the phase.
+
+        Yields:
+            object: Items of the iterable.
+        """
+        iterator = iter(iterable)
+
+        while True:
+            with self.phase(name):
+                item = next(iterator, StopIteration)
+
+            if item is StopIteration:
+                return
+
+            yield item
+
+    def incr(self, name, value=1):
+        """Increment a counter.
+
+        Args:
+            name (str): Name of the counter.
+
+            value (int): Value added to the counter.
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe_host(self, host, seconds):
+        """Register the latency of a request to a host.
+
+        Args:
+            host (str): Host name.
+
+            seconds (float): Request latency (in seconds).
+        """
+        bucket = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        bucket = (
+            str(LATENCY_BUCKETS[bucket]) if bucket < len(LATENCY_BUCKETS) else "+Inf"
+        )
+
+        with self._lock:
+            histogram = self._hosts.setdefault(host, {})
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+
+    #
+    # Output API
+    #
+    def summary(self):
+        """Summary of the run.
+
+        Returns:
+            dict: Run summary (``phases``, ``counters`` and ``hosts``). The times are
+                  in seconds and the hosts histograms use the bucket upper bounds as keys.
+        """
+        with self._lock:
+            return dict(
+                phases={key: round(value, 3) for key, value in self._phases.items()},
+                counters=dict(self._counters),
+                hosts={key: dict(value) for key, value in self._hosts.items()},
+            )
+
+    def export_prometheus(self):
+        """Export the run metrics as Prometheus counters (if ``prometheus_client`` is installed)."""
+        if prometheus_client is None:
+            return
+
+        phases = _prometheus_metric(
+            prometheus_client.Counter,
+            "geo_checker_phase_seconds",
+            "Time spent in each phase of the checkers.",
+            ["checker", "phase"],
+        )
+        counters = _prometheus_metric(
+            prometheus_client.Counter,
+            "geo_checker_events",
+            "Events counted by the checkers.",
+            ["checker", "name"],
+        )
+
+        summary = self.summary()
+
+        for name, value in summary["phases"].items():
+            phases.labels(self.checker, name).inc(value)
+
+        for name, value in summary["counters"].items():
+            counters.labels(self.checker, name).inc(value)
@@ -7,44 +7,158 @@
 
 """Records manipulation utility module."""
 
+import heapq
+from itertools import groupby
+
 from invenio_access.permissions import system_identity
 from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_search.engine import dsl
+from pydash import py_
 
-from geo_rdm_records.modules.packages.records.api import GEOPackageRecord
-from geo_rdm_records.modules.rdm.records.api import GEORecord
 from geo_rdm_records.proxies import current_geo_packages_service
 
+#
+# Streaming
+#
+OWNER_FIELD = "parent.access.owned_by.user"
+"""Field with the owner of a record in the search index."""
+
 
-def get_records_by_owner(owner_id, **kwargs):
-    """Get all records associated with an owner.
+def _scan_records_by_owner(service, extra_filter=None):
+    """Scan all records from a service index, sorted by owner.
 
     Args:
-        owner_id (int): Owner ID
+        service (invenio_records_resources.services.RecordService): Service used to
+                                                                    search the records.
 
-        **kwargs (dict): Extra parameters for the services search methods.
+        extra_filter (invenio_search.engine.dsl.query.Query): Extra filter to the search.
 
-    Returns:
-        tuple: Tuple containing a list of records and its metadata.
+    Yields:
+        tuple: Tuple containing the owner ID and the records' metadata of the owner.
     """
-    search_params = {"q": f"parent.access.owned_by.user: {owner_id}"}
+    search = service._search(
+        "scan", system_identity, {}, None, extra_filter=extra_filter
+    )
+    search = search.sort(OWNER_FIELD).params(preserve_order=True)
 
-    # searching all records (packages and resources) and its metadata
-    packages_metadata = list(
-        current_geo_packages_service.search(
-            system_identity, params=search_params, **kwargs
+    hits = groupby(search.scan(), key=lambda hit: py_.get(hit.to_dict(), OWNER_FIELD))
+
+    for owner_id, owner_hits in hits:
+        if owner_id is None:
+            continue
+
+        # projecting the hits in the same format used by the service search
+        owner_hits = service.result_list(
+            service,
+            system_identity,
+            list(owner_hits),
+            links_item_tpl=service.links_item_tpl,
         ).hits
+
+        yield str(owner_id), list(owner_hits)
+
+
+def get_owners(extra_filter=None):
+    """Get the owners of the records (packages and resources) selected by a filter.
+
+    Args:
+        extra_filter (invenio_search.engine.dsl.query.Query): Extra filter to the search.
+
+    Returns:
+        set: Owners IDs (as strings).
+    """
+    owners = set()
+
+    for service in [current_geo_packages_service, current_rdm_records_service]:
+        search = service._search(
+            "scan", system_identity, {}, None, extra_filter=extra_filter
+        )
+        search = search.source([OWNER_FIELD])
+
+        for hit in search.scan():
+            owner_id = py_.get(hit.to_dict(), OWNER_FIELD)
+
+            if owner_id is not None:
+                owners.add(str(owner_id))
+
+    return owners
+
+
+def iter_records_metadata_by_owner(extra_filter=None):
+    """Iterate over the metadata of all records grouped by owner.
+
+    The packages and the resources indices are scanned only once (sorted by owner)
+    and merged, so each owner group is produced without extra searches.
+
+    Args:
+        extra_filter (invenio_search.engine.dsl.query.Query): Extra filter to the search.
+
+    Yields:
+        tuple: Tuple containing the owner ID and the records' metadata.
+    """
+    packages = (
+        (owner_id, "packages", hits)
+        for owner_id, hits in _scan_records_by_owner(
+            current_geo_packages_service, extra_filter
+        )
     )
 
-    resources_metadata = list(
-        current_rdm_records_service.search(
-            system_identity, params=search_params, **kwargs
-        ).hits
+    resources = (
+        (owner_id, "resources", hits)
+        for owner_id, hits in _scan_records_by_owner(
+            current_rdm_records_service, extra_filter
+        )
     )
 
-    # reading reference from database
-    records_obj = [
-        *list(map(lambda x: GEOPackageRecord.pid.resolve(x["id"]), packages_metadata)),
-        *list(map(lambda x: GEORecord.pid.resolve(x["id"]), resources_metadata)),
-    ]
+    owners = groupby(
+        heapq.merge(packages, resources, key=lambda x: x[0]), key=lambda x: x[0]
+    )
+
+    for owner_id, owner_groups in owners:
+        records_metadata = dict(packages=[], resources=[])
+
+        for _, type_, hits in owner_groups:
+            records_metadata[type_].extend(hits)
+
+        records_owner_id = int(owner_id) if owner_id.isdigit() else owner_id
+
+        yield records_owner_id, records_metadata
+
+
+def get_records_by_ids(service, ids, chunk_size=1000):
+    """Get the metadata of many records using their IDs.
+
+    Args:
+        service (invenio_records_resources.services.RecordService): Service used to
+                                                                    search the records.
+
+        ids (list): Records IDs.
+
+        chunk_size (int): Maximum number of IDs used in each search.
+
+    Returns:
+        list: Records' metadata (in the same format used by the service search).
+    """
+    results = []
+
+    for chunk in py_.chunk(ids, chunk_size):
+        # records are selected by ID: the versions filter of the service must
+        # not hide the records that are not the latest version.
+        search = service._search(
+            "scan",
+            system_identity,
+            {"allversions": True},
+            None,
+            extra_filter=dsl.Q("terms", id=chunk),
+        )
+
+        results.extend(
+            service.result_list(
+                service,
+                system_identity,
+                list(search.scan()),
+                links_item_tpl=service.links_item_tpl,
+            ).hits
+        )
 
-    return records_obj, dict(packages=packages_metadata, resources=resources_metadata)
+    return results
@@ -7,12 +7,19 @@
 
 """Report utility module."""
 
+import json
+import smtplib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from flask import current_app
+from flask_mail import Message
 from invenio_access.permissions import system_identity
-from invenio_mail.api import TemplatedMessage
+from invenio_db import db
 from invenio_users_resources.proxies import current_users_service
+from pydash import py_
+
+from geo_rdm_records.modules.checker.models import GEOCheckerReport
 
 
 #
@@ -44,62 +51,227 @@ def _check_owner_can_receive_report(owner_profile):
     return is_active and is_email_confirmed and is_authorized
 
 
-def _build_report_message(
-    records, records_owner_profile, report_title, report_template
-):
-    """Build a report message.
+def _read_owners_profiles(owners):
+    """Read the profiles of many owners with a single search.
 
     Args:
-        records (dict): Object containing records with extra information
-                        (e.g., link status, record update status).
+        owners (list): Owners' IDs.
+
+    Returns:
+        dict: Owners' profiles indexed by the owner ID (as string).
+    """
+    owners = list(dict.fromkeys(str(owner) for owner in owners))
 
-        records_owner_profile (dict): Dict with the profile of the records' owner.
+    if not owners:
+        return {}
 
-        report_title (str): Report's e-mails title.
+    profiles = current_users_service.read_many(system_identity, ids=owners).hits
 
-        report_template (str): Report's e-mails template.
+    return {str(profile["id"]): profile for profile in profiles}
+
+
+def _read_reports(run_id, owners):
+    """Read the reports of many owners stored by a run.
+
+    Args:
+        run_id (int): Run ID.
+
+        owners (list): Owners' IDs.
 
     Returns:
-        invenio_mail.api.TemplatedMessage: Email message.
+        list: List of tuples with the owner ID and its records.
     """
-    # formatting the user e-mail.
-    records_owner_email = [records_owner_profile["email"]]
+    entries = GEOCheckerReport.query.filter(
+        GEOCheckerReport.run_id == run_id,
+        GEOCheckerReport.owner_id.in_([int(owner) for owner in owners]),
+    ).order_by(GEOCheckerReport.owner_id)
+
+    return [(entry.owner_id, entry.payload) for entry in entries]
+
+
+def _delete_reports(run_id, owners):
+    """Delete the reports of many owners stored by a run."""
+    if owners:
+        GEOCheckerReport.query.filter(
+            GEOCheckerReport.run_id == run_id,
+            GEOCheckerReport.owner_id.in_([int(owner) for owner in owners]),
+        ).delete(synchronize_session=False)
 
+    db.session.commit()
+
+
+#
+# Rendering
+#
+def _render_report_messages(reports, profiles, report_configuration, max_workers):
+    """Render the report messages using a pool of threads.
+
+    Args:
+        reports (list): List of tuples with the owner ID and its records.
+
+        profiles (dict): Owners' profiles indexed by the owner ID (as string).
+
+        report_configuration (dict): Report configuration.
+
+        max_workers (int): Maximum number of threads rendering the messages.
+
+    Returns:
+        list: List of tuples with the report and its message.
+
+    Note:
+        The template is loaded from the application environment, which caches the
+        compiled templates, so it is compiled only once.
+    """
+    app = current_app._get_current_object()
+
+    template = app.jinja_env.get_template(report_configuration["report_template"])
     report_date = datetime.now().strftime("%B %d, %Y")
 
-    return TemplatedMessage(
-        subject=report_title,
-        template_html=report_template,
-        recipients=records_owner_email,
-        ctx={**records, "report_date": report_date},
-    )
+    def _render(records):
+        with app.app_context():
+            return template.render(**records, report_date=report_date)
+
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        htmls = executor.map(_render, [records for _, records in reports])
+
+        return [
+            (
+                report,
+                Message(
+                    subject=report_configuration["report_title"],
+                    recipients=[profiles[str(report[0])]["email"]],
+                    html=html,
+                ),
+            )
+            for report, html in zip(reports, htmls)
+        ]
 
 
 #
 # High-level functions.
 #
-def send_report(records, records_owner, report_configuration):
-    """Send a report to Knowledge Provider.
+def queue_reports(run_id, reports, report_configuration):
+    """Queue reports to be delivered by the reports delivery task.
+
+    The checking work is not blocked by the e-mails delivery: reports are stored
+    in the database and only the owners' IDs are sent, in batches, to the
+    ``send_checker_reports`` task.
 
     Args:
-        records (dict): Object containing records with extra information
-                        (e.g., link status, record update status).
+        run_id (int): ID of the run that created the reports.
 
-        records_owner (int): Record owner's ID.
+        reports (list): List of tuples with the owner ID and its records.
 
-        report_configuration (dict): Report configuration
+        report_configuration (dict): Report configuration.
     """
-    # reading owner profile
-    owner_profile = current_users_service.read(system_identity, records_owner).to_dict()
+    from geo_rdm_records.modules.checker.tasks import send_checker_reports
+
+    batch_size = current_app.config["GEO_RDM_CHECKER_REPORTS_DELIVERY_CONFIG"][
+        "batch_size"
+    ]
+
+    now = datetime.utcnow()
+    owners = [int(records_owner) for records_owner, _ in reports]
+
+    # reports of a shard processed again (e.g., after a crash) are replaced
+    for chunk in py_.chunk(owners, 1000):
+        GEOCheckerReport.query.filter(
+            GEOCheckerReport.run_id == run_id, GEOCheckerReport.owner_id.in_(chunk)
+        ).delete(synchronize_session=False)
+
+    db.session.add_all(
+        [
+            GEOCheckerReport(
+                run_id=run_id,
+                owner_id=int(records_owner),
+                created=now,
+                # values not supported in JSON (e.g., dates) are stored as strings
+                payload=json.loads(json.dumps(records, default=str)),
+            )
+            for records_owner, records in reports
+        ]
+    )
+    db.session.commit()
+
+    # the title can be a lazy string, which can't be serialized in the task.
+    report_configuration = {
+        **report_configuration,
+        "report_title": str(report_configuration["report_title"]),
+    }
+
+    for batch in py_.chunk(owners, batch_size):
+        send_checker_reports.delay(run_id, batch, report_configuration)
+
+
+def deliver_reports(run_id, owners, report_configuration):
+    """Deliver the reports of many owners using a single SMTP connection.
+
+    Args:
+        run_id (int): ID of the run that created the reports.
+
+        owners (list): Owners' IDs.
+
+        report_configuration (dict): Report configuration.
+
+    Returns:
+        list: Owners' IDs whose reports could not be delivered.
+
+    Note:
+        Delivered reports (and reports of owners that can't receive them) are
+        removed from the database. The other reports are kept to be retried.
+    """
+    render_workers = current_app.config["GEO_RDM_CHECKER_REPORTS_DELIVERY_CONFIG"][
+        "render_workers"
+    ]
+
+    # rebuilding the reports stored by the run
+    reports = _read_reports(run_id, owners)
+
+    # reading all owners profiles at once
+    profiles = _read_owners_profiles([records_owner for records_owner, _ in reports])
+
+    # checking if the owners can receive a report
+    reports = [
+        (records_owner, records)
+        for records_owner, records in reports
+        if str(records_owner) in profiles
+        and _check_owner_can_receive_report(profiles[str(records_owner)])
+    ]
+
+    if not reports:
+        _delete_reports(run_id, owners)
+        return []
+
+    # building the messages
+    messages = _render_report_messages(
+        reports, profiles, report_configuration, render_workers
+    )
+
+    # sending the messages
+    processed = 0
+    failed_owners = []
+
+    try:
+        with current_app.extensions["mail"].connect() as connection:
+            for report, message in messages:
+                try:
+                    connection.send(message)
+
+                except smtplib.SMTPRecipientsRefused:
+                    current_app.logger.warning(
+                        "Checker report refused for owner %s", report[0]
+                    )
+
+                except (smtplib.SMTPException, OSError):
+                    failed_owners.append(report[0])
+
+                processed += 1
 
-    # checking if the owner can receive a report
-    can_receive_report = _check_owner_can_receive_report(owner_profile)
+    except (smtplib.SMTPException, OSError):
+        # connection failure: reports not processed must be delivered again
+        failed_owners.extend(report[0] for report, _ in messages[processed:])
 
-    if can_receive_report:
-        # building the message
-        report_message = _build_report_message(
-            records, owner_profile, **report_configuration
-        )
+    failed = set(failed_owners)
+    _delete_reports(run_id, [owner for owner in owners if int(owner) not in failed])
 
-        # sending the message
-        current_app.extensions["mail"].send(report_message)
+    return failed_owners
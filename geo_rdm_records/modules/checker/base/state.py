@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Checkers owners state store module."""
+
+import hashlib
+import json
+
+from invenio_db import db
+from pydash import py_
+from sqlalchemy import func
+
+from geo_rdm_records.modules.checker.models import GEOCheckerOwnerState
+
+
+def hash_state(state):
+    """Calculate the hash of an owner state.
+
+    Args:
+        state (list): JSON-serializable objects describing the owner state
+                      (e.g., records IDs and flags). The order is not relevant.
+
+    Returns:
+        str: SHA-256 of the state.
+    """
+    state = sorted(json.dumps(item, sort_keys=True, default=str) for item in state)
+
+    return hashlib.sha256("\n".join(state).encode("utf-8")).hexdigest()
+
+
+class OwnersStateStore:
+    """Persistent store of the owners state evaluated by a checker.
+
+    For each owner, the store keeps a watermark (date of the last evaluation)
+    and the hash of the last state, so owners can be selected (and reported)
+    only when their state changes.
+    """
+
+    def __init__(self, checker, owners_range=None, chunk_size=1000):
+        """Initializer.
+
+        Args:
+            checker (str): Name of the checker.
+
+            owners_range (tuple): First and last owner (``None`` for open ranges)
+                                  handled by the store (e.g., owners of a shard).
+                                  If ``None``, all owners are handled.
+
+            chunk_size (int): Maximum number of owners loaded in each query.
+        """
+        self._checker = checker
+        self._owners_range = owners_range or (None, None)
+        self._chunk_size = chunk_size
+        self._entries = {}
+
+    def _filters(self):
+        """Filters selecting the owners handled by the store."""
+        first_owner, last_owner = self._owners_range
+
+        filters = [GEOCheckerOwnerState.checker == self._checker]
+
+        if first_owner is not None:
+            filters.append(GEOCheckerOwnerState.owner_id >= first_owner)
+
+        if last_owner is not None:
+            filters.append(GEOCheckerOwnerState.owner_id <= last_owner)
+
+        return filters
+
+    def watermark(self):
+        """Get the oldest watermark of the owners handled by the store.
+
+        Returns:
+            datetime.datetime: Oldest watermark (UTC) or ``None`` if no owner was
+                               evaluated yet.
+        """
+        return (
+            db.session.query(func.min(GEOCheckerOwnerState.watermark))
+            .filter(*self._filters())
+            .scalar()
+        )
+
+    def load(self, owners):
+        """Load the state of many owners.
+
+        Args:
+            owners (Iterable[int]): Owners IDs.
+        """
+        owners = [owner for owner in owners if owner not in self._entries]
+
+        for chunk in py_.chunk(owners, self._chunk_size):
+            entries = GEOCheckerOwnerState.query.filter(
+                GEOCheckerOwnerState.checker == self._checker,
+                GEOCheckerOwnerState.owner_id.in_(chunk),
+            )
+
+            for entry in entries:
+                self._entries[entry.owner_id] = entry
+
+    def update(self, owner, state_hash, now):
+        """Update the state of an owner.
+
+        Args:
+            owner (int): Owner ID (must be already loaded).
+
+            state_hash (str): Hash of the current owner state.
+
+            now (datetime.datetime): Evaluation date (UTC).
+
+        Returns:
+            bool: Flag indicating if the owner state changed.
+        """
+        entry = self._entries.get(owner)
+
+        if entry is None:
+            entry = GEOCheckerOwnerState(checker=self._checker, owner_id=owner)
+            self._entries[owner] = entry
+
+        changed = entry.state_hash != state_hash
+
+        entry.state_hash = state_hash
+        entry.watermark = now
+
+        db.session.add(entry)
+
+        return changed
+
+    def touch(self, now, exclude=None):
+        """Move the watermark of the owners (handled by the store) without changes.
+
+        Args:
+            now (datetime.datetime): New watermark (UTC).
+
+            exclude (Iterable): Owners IDs that must not be updated (e.g., owners
+                                with changes that will be evaluated).
+        """
+        query = GEOCheckerOwnerState.query.filter(
+            *self._filters(),
+            GEOCheckerOwnerState.watermark < now,
+        )
+
+        if exclude:
+            query = query.filter(
+                GEOCheckerOwnerState.owner_id.notin_([int(owner) for owner in exclude])
+            )
+
+        query.update({GEOCheckerOwnerState.watermark: now}, synchronize_session=False)
+
+    def commit(self):
+        """Commit the modified states."""
+        db.session.commit()
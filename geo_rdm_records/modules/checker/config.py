@@ -18,7 +18,26 @@ def get_links_checker_config():
     # Requests
     requests_config = current_app.config["GEO_RDM_CHECKER_LINKS_REQUEST_CONFIG"]
 
-    return dict(requests_config=requests_config, retry_config=retry_config)
+    # Engine
+    engine_config = current_app.config["GEO_RDM_CHECKER_LINKS_ENGINE_CONFIG"]
+
+    # Links status store
+    store_config = current_app.config["GEO_RDM_CHECKER_LINKS_STATUS_CONFIG"]
+
+    # Transport
+    transport_config = current_app.config["GEO_RDM_CHECKER_LINKS_TRANSPORT_CONFIG"]
+
+    # Links fields
+    links_fields = current_app.config["GEO_RDM_CHECKER_LINKS_FIELDS"]
+
+    return dict(
+        links_fields=links_fields,
+        requests_config=requests_config,
+        retry_config=retry_config,
+        engine_config=engine_config,
+        store_config=store_config,
+        transport_config=transport_config,
+    )
 
 
 def get_outdated_records_checker_config():
@@ -26,8 +45,12 @@ def get_outdated_records_checker_config():
     # Outdated criteria
     outdated_criteria = current_app.config["GEO_RDM_CHECKER_OUTDATED_CRITERIA"]
 
+    # Incremental mode
+    incremental = current_app.config["GEO_RDM_CHECKER_OUTDATED_INCREMENTAL"]
+
     return dict(
         outdated_criteria=outdated_criteria,
+        incremental=incremental,
     )
 
 
@@ -51,3 +74,24 @@ def get_outdated_report_config():
     report_title = current_app.config["GEO_RDM_CHECKER_OUTDATED_REPORT_TITLE"]
 
     return dict(report_title=report_title, report_template=report_template)
+
+
+def get_runs_config():
+    """Get configuration object for the checkers runs (shards)."""
+    runs_config = current_app.config["GEO_RDM_CHECKER_RUNS_CONFIG"]
+
+    return dict(
+        shards=runs_config["shards"],
+        shard_timeout=runs_config["shard_timeout"],
+        run_timeout=runs_config.get("run_timeout"),
+    )
+
+
+def get_metrics_config():
+    """Get configuration object for the checkers metrics."""
+    metrics_config = current_app.config["GEO_RDM_CHECKER_METRICS_CONFIG"]
+
+    return dict(
+        output_dir=metrics_config.get("output_dir"),
+        prometheus=metrics_config.get("prometheus", False),
+    )
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Link checker benchmark module.
+
+Runs the links validation pipeline (extraction, deduplication, checking and
+status building) over generated records, using an offline transport, so the
+engine configuration can be tuned without network access. To run it:
+
+    ``python -m geo_rdm_records.modules.checker.links.checker.benchmark --records 1000``
+"""
+
+import argparse
+import json
+import random
+import time
+
+from geo_rdm_records.config import GEO_RDM_CHECKER_LINKS_FIELDS
+from geo_rdm_records.modules.checker.base.metrics import RunMetrics
+
+from .check import checker_validate_links
+from .engine import LinkCheckerEngine
+
+
+def generate_records(records=100, links=5, hosts=50, shared_links=0.2, seed=0):
+    """Generate records metadata with links.
+
+    Args:
+        records (int): Number of records.
+
+        links (int): Number of links in each record.
+
+        hosts (int): Number of distinct hosts used in the links.
+
+        shared_links (float): Fraction of the links shared between records.
+
+        seed (int): Seed of the generator.
+
+    Returns:
+        list: Records metadata (in the same format of the search hits).
+    """
+    generator = random.Random(seed)
+    shared_pool = [
+        f"https://host-{generator.randrange(hosts)}.org/shared/{idx}"
+        for idx in range(max(int(records * links * shared_links), 1))
+    ]
+
+    results = []
+    for record_idx in range(records):
+        record_links = []
+
+        for link_idx in range(links):
+            if generator.random() < shared_links:
+                record_links.append(generator.choice(shared_pool))
+            else:
+                host = generator.randrange(hosts)
+                record_links.append(
+                    f"https://host-{host}.org/record/{record_idx}/{link_idx}"
+                )
+
+        results.append(
+            {
+                "id": f"record-{record_idx}",
+                "metadata": {
+                    "related_identifiers": [
+                        {"identifier": link, "scheme": "url"} for link in record_links
+                    ]
+                },
+            }
+        )
+
+    return results
+
+
+def run_benchmark(records, engine_config=None, transport_config=None, fields=None):
+    """Run the links validation pipeline over records.
+
+    Args:
+        records (list): Records metadata (see ``generate_records``).
+
+        engine_config (dict): Engine configurations (``max_workers``,
+                              ``max_connections_per_host`` and ``politeness_delay``).
+
+        transport_config (dict): Transport configurations. By default, a simulated
+                                 transport is used.
+
+        fields (list): Fields (dotted paths) where the links are searched. By default,
+                       the default ``GEO_RDM_CHECKER_LINKS_FIELDS`` are used, so the
+                       benchmark runs without an application.
+
+    Returns:
+        dict: Benchmark results (elapsed time and the run metrics summary).
+    """
+    metrics = RunMetrics("benchmark")
+    transport_config = transport_config or {"type": "simulated"}
+
+    start = time.perf_counter()
+
+    with LinkCheckerEngine(
+        engine_config=engine_config,
+        transport_config=transport_config,
+        metrics=metrics,
+    ) as engine:
+        results = checker_validate_links(
+            records, engine=engine, fields=fields or GEO_RDM_CHECKER_LINKS_FIELDS
+        )
+
+    elapsed = time.perf_counter() - start
+
+    return dict(
+        elapsed=round(elapsed, 3),
+        records=len(records),
+        broken_links=sum(
+            not status["is_available"]
+            for record in results
+            for status in record["links_status"]
+        ),
+        metrics=metrics.summary(),
+    )
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(
+        description="GEO RDM Records link checker benchmark"
+    )
+
+    parser.add_argument("--records", type=int, default=100)
+    parser.add_argument("--links", type=int, default=5)
+    parser.add_argument("--hosts", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-workers", type=int, default=16)
+    parser.add_argument("--max-connections-per-host", type=int, default=2)
+    parser.add_argument("--politeness-delay", type=float, default=0.0)
+    parser.add_argument("--min-latency", type=float, default=0.05)
+    parser.add_argument("--max-latency", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.1)
+    parser.add_argument(
+        "--fixtures", help="JSON file with recorded responses (replay transport)"
+    )
+
+    args = parser.parse_args()
+
+    records = generate_records(args.records, args.links, args.hosts, seed=args.seed)
+
+    if args.fixtures:
+        transport_config = dict(type="replay", fixtures=args.fixtures)
+    else:
+        transport_config = dict(
+            type="simulated",
+            latency=(args.min_latency, args.max_latency),
+            error_rate=args.error_rate,
+            seed=args.seed,
+        )
+
+    results = run_benchmark(
+        records,
+        engine_config=dict(
+            max_workers=args.max_workers,
+            max_connections_per_host=args.max_connections_per_host,
+            politeness_delay=args.politeness_delay,
+        ),
+        transport_config=transport_config,
+    )
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
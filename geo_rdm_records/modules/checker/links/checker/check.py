@@ -9,78 +9,157 @@
 
 from urllib.parse import urlparse
 
+from invenio_records.api import Record
+from pydash import py_
+
+from .engine import LinkCheckerEngine
 from .metadata import extract_links_from_record
-from .network import is_link_available
+
+VALID_SCHEMES = ["http", "https"]
+"""Schemes of the links tested by the checker."""
+
+
+def _record_id(record):
+    """Get the ID of a record (object or metadata)."""
+    if isinstance(record, Record):
+        return record.pid.pid_value
+
+    return record["id"]
 
 
-def _check_links(record_links, **kwargs):
-    """Check links from a given record.
+def _link_candidates(link):
+    """Generate the URLs used to test a link.
 
     Args:
-        record_links (list): List of links from a given record.
+        link (str): Link extracted from a record.
+
+    Returns:
+        list: URLs to be tested (in order). An empty list means the link is not tested.
+    """
+    link_parse = urlparse(link)
+
+    # currently, only http-https are tested
+    if link_parse.scheme in VALID_SCHEMES:
+        return [link]
 
-        **kwargs: Extra configurations for the `is_link_available` function.
+    # testing `www` websites with no scheme
+    elif link.lower().startswith("www"):
+        return [urlparse(f"{scheme}://{link}").geturl() for scheme in VALID_SCHEMES]
+
+    return []
+
+
+def extract_records_links(records, fields=None):
+    """Extract the links from records.
+
+    Args:
+        records (list): List of ``invenio_records.api.Record`` objects or records
+                        metadata (e.g., search hits).
+
+        fields (list): Fields (dotted paths) where the links are searched. If
+                       ``None``, the default links fields are used.
 
     Returns:
-        list: List with the links' status.
+        dict: Links of each record (``record_id -> list``).
     """
-    valid_schemes = ["http", "https"]
-    record_links_status = []
+    return {
+        _record_id(record): extract_links_from_record(record, fields)
+        for record in records
+    }
+
 
-    for link in record_links:
-        link_tested = False
-        link_is_available = False
+def checker_check_links(links, engine):
+    """Check the status of many links at once.
 
-        link_parse = urlparse(link)
+    Args:
+        links (Iterable[str]): Links to be checked. Duplicated links are checked only once.
 
-        # currently, only http-https are tested
-        if link_parse.scheme in valid_schemes:
-            link_tested = True
-            link_is_available = is_link_available(link, **kwargs)
+        engine (LinkCheckerEngine): Engine used to check the links.
 
-        # testing `www` websites with no scheme
-        elif link.startswith("www"):
-            for valid_scheme in valid_schemes:
-                if not link_is_available:
-                    try:
-                        link_with_scheme = urlparse(f"{valid_scheme}://{link}")
-                        link_with_scheme = link_with_scheme.geturl()
+    Returns:
+        dict: Dict with the links' status (``link -> dict``).
+    """
+    links = py_.uniq(links)
 
-                        link_is_available = is_link_available(
-                            link_with_scheme, **kwargs
-                        )
+    links_candidates = {link: _link_candidates(link) for link in links}
+    links_status = {
+        link: dict(link=link, is_available=False, is_tested=bool(candidates))
+        for link, candidates in links_candidates.items()
+    }
 
-                        link_tested = True
-                    except:  # noqa
-                        pass
+    # checking the candidates in rounds: the next candidate of a link is
+    # only tested when the previous one is not available.
+    round_ = 0
+    pending = [link for link, candidates in links_candidates.items() if candidates]
 
-        record_links_status.append(
-            dict(link=link, is_available=link_is_available, is_tested=link_tested)
-        )
+    while pending:
+        urls = {link: links_candidates[link][round_] for link in pending}
+        urls_status = engine.check_links(urls.values())
 
-    return record_links_status
+        for link, url in urls.items():
+            links_status[link]["is_available"] = urls_status[url]
 
+        round_ += 1
+        pending = [
+            link
+            for link in pending
+            if not links_status[link]["is_available"]
+            and len(links_candidates[link]) > round_
+        ]
+
+    return links_status
 
-def checker_validate_links(records, **kwargs):
-    """Check links from records.
+
+def build_links_status(record_id, record_links, links_status):
+    """Build the links status object of a record.
 
     Args:
-        records (list): List of ``invenio_records.api.Record`` objects.
+        record_id (str): Record ID.
+
+        record_links (list): Links of the record.
 
-        **kwargs: Extra configurations for the `is_link_available` function.
+        links_status (dict): Status of the links (``link -> dict``).
 
     Returns:
-        list: List with the links' status.
+        dict: Record links status object.
     """
-    result = []
+    return dict(
+        id=record_id,
+        links_status=[dict(links_status[link]) for link in record_links],
+    )
 
-    for record in records:
-        record_id = record.pid.pid_value
 
-        # extracting the links and checking its status
-        record_links = extract_links_from_record(record)
-        record_links_status = _check_links(record_links, **kwargs)
+def checker_validate_links(records, engine=None, fields=None, **kwargs):
+    """Check links from records.
 
-        result.append(dict(id=record_id, links_status=record_links_status))
+    Args:
+        records (list): List of ``invenio_records.api.Record`` objects or records
+                        metadata (e.g., search hits).
+
+        fields (list): Fields (dotted paths) where the links are searched. If not
+                       defined, the ``GEO_RDM_CHECKER_LINKS_FIELDS`` are used.
+
+        engine (LinkCheckerEngine): Engine used to check the links. If not defined,
+                                    a new engine is created using ``kwargs``.
+
+        **kwargs: Extra configurations for the ``LinkCheckerEngine``.
 
-    return result
+    Returns:
+        list: List with the links' status.
+
+    Note:
+        The links from all records are deduplicated before any request is made.
+    """
+    records_links = extract_records_links(records, fields=fields)
+    links = py_.flatten(list(records_links.values()))
+
+    if engine is None:
+        with LinkCheckerEngine(**kwargs) as engine:
+            links_status = checker_check_links(links, engine)
+    else:
+        links_status = checker_check_links(links, engine)
+
+    return [
+        build_links_status(record_id, record_links, links_status)
+        for record_id, record_links in records_links.items()
+    ]
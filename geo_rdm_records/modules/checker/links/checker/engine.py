@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Checker engine module."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from .network import check_link
+from .store import LinkStatusStore
+from .transport import create_transport
+
+
+class HostThrottle:
+    """Politeness control for the requests sent to a host.
+
+    Limits the number of concurrent requests to a host and keeps a minimum
+    delay between two consecutive requests to it. Also, it remembers if the
+    host supports ``HEAD`` requests.
+    """
+
+    def __init__(self, max_connections=2, delay=0.0):
+        """Initializer.
+
+        Args:
+            max_connections (int): Maximum number of concurrent requests to the host.
+
+            delay (float): Minimum delay (in seconds) between two requests to the host.
+        """
+        self._delay = delay
+        self._next_request_at = 0.0
+
+        self.head_supported = None
+
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(max_connections)
+
+    def __enter__(self):
+        """Wait until a request can be sent to the host."""
+        self._semaphore.acquire()
+
+        if self._delay:
+            with self._lock:
+                now = time.monotonic()
+                wait = self._next_request_at - now
+
+                self._next_request_at = max(now, self._next_request_at) + self._delay
+
+            if wait > 0:
+                time.sleep(wait)
+
+        return self
+
+    def __exit__(self, *args):
+        """Release the host slot."""
+        self._semaphore.release()
+
+
+class LinkCheckerEngine:
+    """Concurrent link checker.
+
+    All links are checked using a bounded thread pool that shares a single
+    session (and connection pool). Each URL is checked only once by the engine:
+    the results are stored and reused by the next calls.
+
+    When the links status store is enabled (``store_config``), only the URLs
+    that are due are checked. For the other URLs, the last known status is used.
+    """
+
+    default_engine_config = dict(
+        max_workers=16,
+        max_connections_per_host=2,
+        politeness_delay=0.0,
+    )
+    """Default engine configuration."""
+
+    def __init__(
+        self,
+        requests_config=None,
+        retry_config=None,
+        cache_config=None,
+        engine_config=None,
+        store_config=None,
+        transport_config=None,
+        metrics=None,
+    ):
+        """Initializer.
+
+        Args:
+            requests_config (dict): ``requests.get`` configurations
+
+            retry_config (dict): Retry configurations (see ``create_session``).
+
+            cache_config (dict): ``requests_cache.CachedSession`` configurations.
+
+            engine_config (dict): Engine configurations (``max_workers``,
+                                  ``max_connections_per_host`` and ``politeness_delay``).
+
+            store_config (dict): Links status store configurations. The store is used
+                                 only if ``enabled`` is ``True``.
+
+            transport_config (dict): Transport configurations (see ``create_transport``).
+                                     By default, a real HTTP session is used.
+
+            metrics (RunMetrics): Metrics of the run (counters and hosts latency).
+        """
+        self._requests_config = requests_config or {}
+        self._engine_config = {**self.default_engine_config, **(engine_config or {})}
+
+        max_workers = self._engine_config["max_workers"]
+
+        self._session = create_transport(
+            transport_config,
+            retry_config,
+            cache_config,
+            pool_config=dict(pool_connections=max_workers, pool_maxsize=max_workers),
+        )
+
+        self._hosts = {}
+        self._hosts_lock = threading.Lock()
+
+        self._results = {}
+        self._metrics = metrics
+
+        self._store = None
+        if store_config and store_config.get("enabled"):
+            self._store = LinkStatusStore(store_config)
+
+    #
+    # Auxiliary methods
+    #
+    def _host_throttle(self, url):
+        """Get the politeness control of the URL host."""
+        host = urlparse(url).netloc.lower()
+
+        with self._hosts_lock:
+            if host not in self._hosts:
+                self._hosts[host] = HostThrottle(
+                    self._engine_config["max_connections_per_host"],
+                    self._engine_config["politeness_delay"],
+                )
+
+            return self._hosts[host]
+
+    def _check(self, url, validators=None):
+        """Check a single URL respecting the host politeness.
+
+        Hosts known to not support ``HEAD`` requests are checked directly with ``GET``.
+        """
+        with self._host_throttle(url) as host:
+            start = time.perf_counter()
+
+            result = check_link(
+                url,
+                requests_config=self._requests_config,
+                session=self._session,
+                validators=validators,
+                head=host.head_supported is not False,
+            )
+
+            if result["head_supported"] is not None:
+                host.head_supported = result["head_supported"]
+
+            if self._metrics is not None:
+                self._metrics.observe_host(
+                    urlparse(url).netloc.lower(), time.perf_counter() - start
+                )
+                self._metrics.incr("cache_hits", int(result["from_cache"]))
+
+            return result
+
+    def _load_from_store(self, urls):
+        """Use the stored status of the URLs that are not due.
+
+        Returns:
+            list: URLs that must be checked.
+        """
+        self._store.load(urls)
+
+        pending = []
+        for url in urls:
+            if self._store.is_due(url):
+                pending.append(url)
+            else:
+                self._results[url] = self._store.status(url)["is_available"]
+
+        return pending
+
+    #
+    # High-level API
+    #
+    def check_links(self, urls):
+        """Check many links concurrently.
+
+        Args:
+            urls (Iterable[str]): URLs to be checked. Duplicated URLs are checked only once.
+
+        Returns:
+            dict: Availability of each URL (``url -> bool``).
+        """
+        urls = list(dict.fromkeys(urls))
+        pending = [url for url in urls if url not in self._results]
+
+        if pending and self._store is not None:
+            pending = self._load_from_store(pending)
+
+        if self._metrics is not None:
+            self._metrics.incr("urls", len(urls))
+            self._metrics.incr("urls_checked", len(pending))
+
+        if pending:
+            max_workers = min(self._engine_config["max_workers"], len(pending))
+            validators = [
+                self._store.status(url) if self._store is not None else None
+                for url in pending
+            ]
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = executor.map(self._check, pending, validators)
+
+                for url, result in zip(pending, results):
+                    self._results[url] = result["is_available"]
+
+                    if self._store is not None:
+                        self._store.update(url, result)
+
+            if self._store is not None:
+                self._store.commit()
+
+        return {url: self._results[url] for url in urls}
+
+    def close(self):
+        """Close the engine session."""
+        self._session.close()
+
+    #
+    # Dunder methods
+    #
+    def __enter__(self):
+        """Return self."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the engine."""
+        self.close()
@@ -7,52 +7,118 @@
 
 """Checker metadata management module."""
 
+import html
 import re
+from urllib.parse import urlsplit, urlunsplit
 
-from pydash import py_
+from flask import current_app
 
+_URL_PATTERN = re.compile(r'https?://[^\s<>"\',]+|www\.[^\s<>"\',]+', re.IGNORECASE)
+"""Pattern used to find links (http-based and ``www.`` prefixed) in a text."""
 
-def _extract_links(record_document):
+_URL_TRAILING_CHARS = ").;:!?]}'\""
+"""Characters removed from the end of the links (e.g., punctuation of a sentence)."""
+
+
+def _normalize_link(link):
+    """Normalize a link, so equivalent links can be deduplicated.
+
+    Note:
+        Trailing punctuation and the fragment are removed, and the scheme
+        and the host are lowercased (they are case-insensitive).
+    """
+    link = link.rstrip(_URL_TRAILING_CHARS)
+
+    if not link.lower().startswith(("http://", "https://")):
+        return link
+
+    scheme, netloc, path, query, _ = urlsplit(link)
+    return urlunsplit((scheme.lower(), netloc.lower(), path, query, ""))
+
+
+def _iter_field_values(value, path):
+    """Iterate over the text values of a field.
+
+    Args:
+        value (Union[dict, list, str]): Document (or part of it) being traversed.
+
+        path (list): Remaining keys of the field path. Lists are traversed
+                     transparently and, at the end of the path, all nested
+                     text values are used.
+
+    Yields:
+        str: Text values of the field.
+    """
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_field_values(item, path)
+
+    elif isinstance(value, dict):
+        if path:
+            if path[0] in value:
+                yield from _iter_field_values(value[path[0]], path[1:])
+        else:
+            for item in value.values():
+                yield from _iter_field_values(item, path)
+
+    elif isinstance(value, str) and not path:
+        yield value
+
+
+def _extract_links(text):
     """Extract all links from a string.
 
     Args:
-        record_document (str): Record document as a string.
+        text (str): Text where the links are searched (HTML is accepted).
 
-    Returns:
-        list: List containing all links found in the record document.
+    Yields:
+        str: Normalized links found in the text.
 
     Note:
         Only http-based links are extracted.
     """
-    # Regex pattern for extracting URLs
-    url_pattern = r'https?://[^\s<>"\',]+|www\.[^\s<>"\',]+'
+    for match in _URL_PATTERN.finditer(html.unescape(text)):
+        link = _normalize_link(match.group())
 
-    # Find all non-overlapping matches of the pattern in the string
-    return py_.map(
-        re.findall(url_pattern, record_document),
-        lambda x: x.strip(").").replace("&nbsp;", ""),
-    )
+        if link:
+            yield link
 
 
-def extract_links_from_record(record):
-    """Extract all links available in a record.
+def iter_links_from_record(record, fields=None):
+    """Iterate over the links available in a record.
 
     Args:
-        record (invenio_records.api.Record): Record object
+        record (Union[invenio_records.api.Record, dict]): Record object or record
+                                                          metadata (e.g., search hit).
 
-    Returns:
-        list: List containing all links found in the record document.
+        fields (list): Fields (dotted paths) where the links are searched. If
+                       ``None``, the ``GEO_RDM_CHECKER_LINKS_FIELDS`` are used.
+
+    Yields:
+        str: Links found in the record (duplicated links are yielded only once).
     """
-    record_dump = record.dumps()
+    seen = set()
+    fields = fields or current_app.config["GEO_RDM_CHECKER_LINKS_FIELDS"]
 
-    #  Remove `parent` as it refers only to internal configurations
-    record_dump["parent"] = {}
+    for field in fields:
+        for value in _iter_field_values(record, field.split(".")):
+            for link in _extract_links(value):
+                if link not in seen:
+                    seen.add(link)
+                    yield link
 
-    # Prepare dump to be analyzed
-    record_metadata_as_string = str(record_dump)
 
-    # Extracting links
-    record_links = _extract_links(record_metadata_as_string)
+def extract_links_from_record(record, fields=None):
+    """Extract all links available in a record.
+
+    Args:
+        record (Union[invenio_records.api.Record, dict]): Record object or record
+                                                          metadata (e.g., search hit).
+
+        fields (list): Fields (dotted paths) where the links are searched. If
+                       ``None``, the ``GEO_RDM_CHECKER_LINKS_FIELDS`` are used.
 
-    # Removing duplicates
-    return py_.uniq(record_links)
+    Returns:
+        list: List containing all links found in the record document.
+    """
+    return list(iter_links_from_record(record, fields))
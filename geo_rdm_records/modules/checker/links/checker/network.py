@@ -9,43 +9,81 @@
 
 from datetime import timedelta
 
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError
 from requests_cache import CachedSession
-from retry_requests import retry
+from urllib3.util.retry import Retry
 
 
-def is_link_available(
-    url: str,
-    requests_config=None,
-    retry_config=None,
-    cache_config=None,
+def _create_retry(
+    retries=3,
+    backoff_factor=0.3,
+    connect_retries=None,
+    read_retries=None,
+    status_retries=None,
+    status_to_retry=(429, 500, 502, 503, 504),
 ):
-    """Check if a link is available.
+    """Create the retry strategy used by the session.
 
     Args:
-        url (str): URL to be checked.
+        retries (int): Maximum number of retries (all errors).
 
-        requests_config (dict): ``requests.get`` configurations
+        backoff_factor (float): Factor used to compute the delay between retries.
 
-        retry_config (dict): ``retry_requests.retry`` configurations
+        connect_retries (int): Retries of connection errors (e.g., DNS failures and
+                               refused connections). If ``None``, ``retries`` is used.
 
-        cache_config (dict): ``requests_cache.CachedSession`` configurations.
+        read_retries (int): Retries of read errors (e.g., timeouts). If ``None``,
+                            ``retries`` is used.
 
-    Note:
-        By default, the following cases are used to define a link as unavailable:
-            - Case 1: Delay to answer longer than 10 seconds;
-            - Case 2: No access to the server or a dropped connection;
-            - Case 3: An HTTP error (validated with `requests.Response.raise_for_status`)
+        status_retries (int): Retries of HTTP errors in ``status_to_retry``. If
+                              ``None``, ``retries`` is used.
 
-        To change the value of ``Case 1``, you can use the Request config (``requests_config``). Also,
-        to change the value of ``Case 2`` and ``Case 3``, you can use the Retry config (``retry_config``).
+        status_to_retry (Iterable[int]): HTTP status codes retried. Other HTTP errors
+                                         (e.g., ``404``) are not retried.
 
-        In the current version, only http(s) links are validated.
+    Returns:
+        urllib3.util.retry.Retry: Retry strategy.
     """
-    is_available = False
 
+    def _budget(value):
+        return retries if value is None else value
+
+    return Retry(
+        total=retries,
+        connect=_budget(connect_retries),
+        read=_budget(read_retries),
+        status=_budget(status_retries),
+        backoff_factor=backoff_factor,
+        status_forcelist=status_to_retry,
+    )
+
+
+def create_session(retry_config=None, cache_config=None, pool_config=None):
+    """Create a session to check links.
+
+    Args:
+        retry_config (dict): Retry configurations (see ``_create_retry``).
+
+        cache_config (dict): ``requests_cache.CachedSession`` configurations.
+
+        pool_config (dict): ``requests.adapters.HTTPAdapter`` pool configurations
+                            (e.g., ``pool_connections``, ``pool_maxsize``).
+
+    Returns:
+        requests_cache.CachedSession: Session with retry and cache support.
+
+    Note:
+        The session can be shared between threads, allowing many links to be checked
+        using the same connection pool.
+
+    Note:
+        By default, only ``HEAD`` responses are cached, so the streamed ``GET``
+        responses are never read to be stored.
+    """
     cache_config = {} if cache_config is None else cache_config
     retry_config = {} if retry_config is None else retry_config
-    requests_config = {} if requests_config is None else requests_config
+    pool_config = {} if pool_config is None else pool_config
 
     # building the session object
     session = CachedSession(
@@ -53,22 +91,146 @@ def is_link_available(
         cache_control=False,
         expire_after=timedelta(days=30),
         allowable_codes=[200, 400],
-        **cache_config
+        **{"allowable_methods": ["HEAD"], **cache_config}
     )
 
-    session = retry(session, **retry_config)
+    # mounting the adapter with the retry strategy and the connection pool
+    adapter = HTTPAdapter(max_retries=_create_retry(**retry_config), **pool_config)
+
+    for prefix in ["http://", "https://"]:
+        session.mount(prefix, adapter)
+
+    return session
+
+
+def _request(request_method, url, requests_config):
+    """Send a request, reading only the response headers.
+
+    Returns:
+        requests.Response: Response (already closed, with the content not consumed).
+    """
+    response = request_method(url, stream=True, **requests_config)
+    response.close()
+
+    response.raise_for_status()
+
+    return response
+
+
+def check_link(url, requests_config=None, session=None, validators=None, head=True):
+    """Check a link, collecting its cache validators.
+
+    Args:
+        url (str): URL to be checked.
+
+        requests_config (dict): ``requests.get`` configurations
+
+        session (requests.Session): Session used to check the link.
 
-    for request_method in [session.head, session.get]:
-        # avoid requests using another method for a link that is already validated
-        if is_available:
-            continue
+        validators (dict): Cache validators from a previous check (``etag`` and
+                           ``last_modified``). When defined, conditional requests
+                           are used (a ``304 Not Modified`` is an available link).
 
+        head (bool): Flag indicating if a ``HEAD`` request is tried before the ``GET``.
+                     Use ``False`` for hosts known to not support ``HEAD``.
+
+    Returns:
+        dict: Link status (``is_available``, ``etag``, ``last_modified``,
+              ``head_supported`` and ``from_cache``). The ``head_supported`` is
+              ``None`` when it is not possible to know if the host supports
+              ``HEAD`` requests.
+
+    Note:
+        The ``GET`` request is streamed and closed after the headers are received,
+        so the response body (e.g., a large dataset) is never downloaded.
+    """
+    result = dict(
+        is_available=False,
+        etag=None,
+        last_modified=None,
+        head_supported=None,
+        from_cache=False,
+    )
+
+    validators = {} if validators is None else validators
+    requests_config = {} if requests_config is None else requests_config
+
+    # conditional request headers
+    headers = {**requests_config.get("headers", {})}
+
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    requests_config = {**requests_config, "headers": headers}
+
+    head_rejected = False
+    request_methods = ["head", "get"] if head else ["get"]
+
+    for request_method in request_methods:
         try:
-            request_method(url, **requests_config).raise_for_status()
-            is_available = True
+            response = _request(getattr(session, request_method), url, requests_config)
+
+            result.update(
+                is_available=True,
+                etag=response.headers.get("ETag", validators.get("etag")),
+                last_modified=response.headers.get(
+                    "Last-Modified", validators.get("last_modified")
+                ),
+                from_cache=getattr(response, "from_cache", False),
+            )
+
+            if head:
+                result["head_supported"] = not head_rejected
+
+            # avoid requests using another method for a link that is already validated
+            break
+
+        except HTTPError:
+            head_rejected = request_method == "head"
 
         except:  # noqa
             # If there is any request-related error, the link is not available
-            is_available = False
+            result["is_available"] = False
+
+    return result
+
+
+def is_link_available(
+    url: str,
+    requests_config=None,
+    retry_config=None,
+    cache_config=None,
+    session=None,
+):
+    """Check if a link is available.
+
+    Args:
+        url (str): URL to be checked.
+
+        requests_config (dict): ``requests.get`` configurations
+
+        retry_config (dict): Retry configurations (see ``create_session``).
+
+        cache_config (dict): ``requests_cache.CachedSession`` configurations.
+
+        session (requests.Session): Session used to check the link. If not defined, a new
+                                    session is created using ``retry_config`` and ``cache_config``.
+
+    Note:
+        By default, the following cases are used to define a link as unavailable:
+            - Case 1: Delay to answer longer than 10 seconds;
+            - Case 2: No access to the server or a dropped connection;
+            - Case 3: An HTTP error (validated with `requests.Response.raise_for_status`)
+
+        To change the value of ``Case 1``, you can use the Request config (``requests_config``). Also,
+        to change the value of ``Case 2`` and ``Case 3``, you can use the Retry config (``retry_config``).
+
+        In the current version, only http(s) links are validated.
+    """
+    if session is None:
+        session = create_session(retry_config, cache_config)
 
-    return is_available
+    return check_link(url, requests_config, session)["is_available"]
@@ -0,0 +1,239 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Checker links status store module."""
+
+from datetime import datetime, timedelta
+
+from invenio_db import db
+from pydash import py_
+from sqlalchemy.exc import IntegrityError
+
+from geo_rdm_records.modules.checker.models import GEOLinkStatus
+
+STATUS_FIELDS = [
+    "is_available",
+    "etag",
+    "last_modified",
+    "last_checked",
+    "next_check",
+    "consecutive_failures",
+    "consecutive_successes",
+]
+"""Fields of the link status written by the store."""
+
+
+def _validator(value):
+    """Cache validator that can be stored (values too long are ignored)."""
+    return value if value and len(value) <= 255 else None
+
+
+class LinkStatusStore:
+    """Persistent store of the links status.
+
+    The store keeps the last status of each checked URL and defines when the URL
+    must be checked again, using adaptive intervals:
+
+        - Healthy links are checked less often each time they are found available;
+        - Broken links are checked more often, slowing down while they stay broken;
+        - Flapping links (status changed in the last check) are checked as soon as possible.
+
+    Note:
+        The store uses the database session, so it must be used only in the thread
+        running the application context.
+    """
+
+    default_config = dict(
+        healthy_interval=7,
+        max_healthy_interval=60,
+        failure_interval=1,
+        max_failure_interval=14,
+        flapping_interval=1,
+        chunk_size=1000,
+    )
+    """Default store configuration (intervals in days)."""
+
+    def __init__(self, config=None):
+        """Initializer.
+
+        Args:
+            config (dict): Store configuration (see ``default_config``).
+        """
+        self._config = {**self.default_config, **(config or {})}
+
+        self._entries = {}
+        self._pending = {}
+
+    #
+    # Auxiliary methods
+    #
+    def _interval(self, entry, flapped):
+        """Calculate the interval until the next check of an entry."""
+        if flapped:
+            return self._config["flapping_interval"]
+
+        if entry.is_available:
+            interval = self._config["healthy_interval"] * 2 ** min(
+                entry.consecutive_successes - 1, 10
+            )
+            return min(interval, self._config["max_healthy_interval"])
+
+        interval = self._config["failure_interval"] * 2 ** min(
+            entry.consecutive_failures - 1, 10
+        )
+        return min(interval, self._config["max_failure_interval"])
+
+    def _merge(self, url, values, retries=1):
+        """Write the status of a URL over the row stored by another process.
+
+        Args:
+            url (str): Checked URL.
+
+            values (dict): Status of the URL (see ``STATUS_FIELDS``).
+
+            retries (int): Number of retries when the row is inserted concurrently.
+        """
+        url_hash = GEOLinkStatus.hash_url(url)
+
+        for attempt in range(retries + 1):
+            try:
+                with db.session.begin_nested():
+                    entry = GEOLinkStatus.query.filter_by(
+                        url_hash=url_hash
+                    ).one_or_none()
+
+                    if entry is None:
+                        entry = GEOLinkStatus(url=url, url_hash=url_hash)
+
+                    for field, value in values.items():
+                        setattr(entry, field, value)
+
+                    db.session.add(entry)
+
+                self._entries[url] = entry
+                return
+
+            except IntegrityError:
+                if attempt == retries:
+                    raise
+
+    #
+    # High-level API
+    #
+    def load(self, urls):
+        """Load the status of many URLs.
+
+        Args:
+            urls (Iterable[str]): URLs to be loaded.
+        """
+        urls_hash = {
+            GEOLinkStatus.hash_url(url): url for url in urls if url not in self._entries
+        }
+
+        for chunk in py_.chunk(list(urls_hash.keys()), self._config["chunk_size"]):
+            entries = GEOLinkStatus.query.filter(GEOLinkStatus.url_hash.in_(chunk))
+
+            for entry in entries:
+                self._entries[entry.url] = entry
+
+    def is_due(self, url, now=None):
+        """Check if a URL must be checked.
+
+        Args:
+            url (str): URL (must be already loaded).
+
+            now (datetime.datetime): Reference date (UTC).
+
+        Returns:
+            bool: Flag indicating if the URL must be checked.
+        """
+        entry = self._entries.get(url)
+        now = now or datetime.utcnow()
+
+        return entry is None or entry.next_check <= now
+
+    def status(self, url):
+        """Get the last status of a URL.
+
+        Args:
+            url (str): URL (must be already loaded).
+
+        Returns:
+            dict: Last status of the URL (``is_available``, ``etag`` and ``last_modified``).
+                  If the URL was never checked, ``None`` is returned.
+        """
+        entry = self._entries.get(url)
+
+        if entry is None:
+            return None
+
+        return dict(
+            is_available=entry.is_available,
+            etag=entry.etag,
+            last_modified=entry.last_modified,
+        )
+
+    def update(self, url, result, now=None):
+        """Update the status of a URL.
+
+        Args:
+            url (str): Checked URL.
+
+            result (dict): Check result (``is_available``, ``etag`` and ``last_modified``).
+
+            now (datetime.datetime): Check date (UTC).
+        """
+        now = now or datetime.utcnow()
+        entry = self._entries.get(url)
+
+        flapped = entry is not None and entry.is_available != result["is_available"]
+
+        if entry is None:
+            entry = GEOLinkStatus(
+                url=url,
+                url_hash=GEOLinkStatus.hash_url(url),
+                consecutive_failures=0,
+                consecutive_successes=0,
+            )
+            self._entries[url] = entry
+
+        if result["is_available"]:
+            entry.consecutive_failures = 0
+            entry.consecutive_successes += 1
+        else:
+            entry.consecutive_failures += 1
+            entry.consecutive_successes = 0
+
+        entry.is_available = result["is_available"]
+        entry.etag = _validator(result.get("etag"))
+        entry.last_modified = _validator(result.get("last_modified"))
+        entry.last_checked = now
+        entry.next_check = now + timedelta(days=self._interval(entry, flapped))
+
+        db.session.add(entry)
+
+        self._pending[url] = {field: getattr(entry, field) for field in STATUS_FIELDS}
+
+    def commit(self):
+        """Commit the modified status.
+
+        Shards running in parallel can insert the same URL. In this case, the
+        transaction is rolled back and each modified status is written again
+        (row by row) over the rows stored by the other shards.
+        """
+        try:
+            db.session.commit()
+
+        except IntegrityError:
+            db.session.rollback()
+
+            for url, values in self._pending.items():
+                self._merge(url, values)
+
+            db.session.commit()
+
+        self._pending = {}
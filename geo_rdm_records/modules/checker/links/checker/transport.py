@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Checker HTTP transports module.
+
+A transport is any object with the ``head``, ``get`` and ``close`` methods of
+a ``requests.Session``. Besides the real transport (a session), offline
+transports are available to test and benchmark the checker without network.
+"""
+
+import hashlib
+import json
+import time
+
+from requests.exceptions import ConnectionError, HTTPError, Timeout
+from requests.structures import CaseInsensitiveDict
+
+from .network import create_session
+
+
+class TransportResponse:
+    """Minimal response returned by the offline transports."""
+
+    def __init__(self, url, status_code=200, headers=None):
+        """Initializer.
+
+        Args:
+            url (str): Requested URL.
+
+            status_code (int): HTTP status code.
+
+            headers (dict): Response headers.
+        """
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
+        self.from_cache = False
+
+    def raise_for_status(self):
+        """Raise an ``HTTPError`` for error status codes (same as ``requests``)."""
+        if 400 <= self.status_code < 600:
+            raise HTTPError(
+                f"{self.status_code} Error for url: {self.url}", response=self
+            )
+
+    def close(self):
+        """Close the response (nothing to release)."""
+
+
+class BaseOfflineTransport:
+    """Base class for the offline transports."""
+
+    def _response(self, method, url):
+        """Build the response of a request (must be implemented by subclasses)."""
+        raise NotImplementedError()
+
+    def head(self, url, **kwargs):
+        """Send a ``HEAD`` request."""
+        return self._response("head", url)
+
+    def get(self, url, **kwargs):
+        """Send a ``GET`` request."""
+        return self._response("get", url)
+
+    def close(self):
+        """Close the transport (nothing to release)."""
+
+
+class ReplayTransport(BaseOfflineTransport):
+    """Transport replaying recorded responses (fixtures).
+
+    Fixtures are indexed by the URL. Each fixture defines the ``status_code`` and,
+    optionally, the ``headers`` and a ``head_status_code`` (used when the server
+    answers ``HEAD`` requests differently). A fixture with ``error`` (``timeout``
+    or ``connection``) raises the corresponding ``requests`` exception. URLs
+    without a fixture raise a ``ConnectionError``.
+
+    Example of fixture:
+
+        ``{"https://example.org": {"status_code": 200, "head_status_code": 405}}``
+    """
+
+    def __init__(self, fixtures):
+        """Initializer.
+
+        Args:
+            fixtures (Union[dict, str]): Fixtures (or the path of a JSON file with them).
+        """
+        if isinstance(fixtures, str):
+            with open(fixtures) as fixtures_file:
+                fixtures = json.load(fixtures_file)
+
+        self._fixtures = fixtures
+
+    def _response(self, method, url):
+        """Build the response of a request using the fixtures."""
+        fixture = self._fixtures.get(url)
+
+        if fixture is None or fixture.get("error") == "connection":
+            raise ConnectionError(f"No route to {url}")
+
+        if fixture.get("error") == "timeout":
+            raise Timeout(f"Timeout for {url}")
+
+        status_code = fixture.get("status_code", 200)
+
+        if method == "head":
+            status_code = fixture.get("head_status_code", status_code)
+
+        return TransportResponse(url, status_code, fixture.get("headers"))
+
+
+class SimulatedTransport(BaseOfflineTransport):
+    """Transport simulating servers with synthetic latency and errors.
+
+    The behavior of each URL is derived from its hash (and the ``seed``), so
+    the same URLs always produce the same results, making benchmarks reproducible.
+    """
+
+    def __init__(
+        self,
+        latency=(0.05, 0.5),
+        error_rate=0.1,
+        timeout_rate=0.01,
+        head_unsupported_rate=0.1,
+        seed=0,
+    ):
+        """Initializer.
+
+        Args:
+            latency (tuple): Minimum and maximum latency (in seconds) of the requests.
+
+            error_rate (float): Fraction of URLs answering with ``404``.
+
+            timeout_rate (float): Fraction of URLs raising a ``Timeout``.
+
+            head_unsupported_rate (float): Fraction of hosts answering ``HEAD``
+                                           requests with ``405``.
+
+            seed (int): Seed used to derive the behavior of the URLs.
+        """
+        self._latency = latency
+        self._error_rate = error_rate
+        self._timeout_rate = timeout_rate
+        self._head_unsupported_rate = head_unsupported_rate
+        self._seed = seed
+
+    def _uniform(self, value, salt):
+        """Deterministic number in ``[0, 1)`` derived from a value."""
+        digest = hashlib.sha256(f"{self._seed}:{salt}:{value}".encode("utf-8"))
+        return int(digest.hexdigest()[:8], 16) / 0x100000000
+
+    def _response(self, method, url):
+        """Build the response of a request simulating the server."""
+        min_latency, max_latency = self._latency
+        time.sleep(
+            min_latency + (max_latency - min_latency) * self._uniform(url, "latency")
+        )
+
+        if self._uniform(url, "timeout") < self._timeout_rate:
+            raise Timeout(f"Timeout for {url}")
+
+        host = url.split("/")[2] if "://" in url else url.split("/")[0]
+
+        if (
+            method == "head"
+            and self._uniform(host, "head") < self._head_unsupported_rate
+        ):
+            return TransportResponse(url, 405)
+
+        if self._uniform(url, "error") < self._error_rate:
+            return TransportResponse(url, 404)
+
+        return TransportResponse(url, 200)
+
+
+def create_transport(
+    transport_config=None, retry_config=None, cache_config=None, pool_config=None
+):
+    """Create the transport used to check links.
+
+    Args:
+        transport_config (dict): Transport configuration. The ``type`` defines the
+                                 transport (``session``, ``replay`` or ``simulated``)
+                                 and the other values are passed to the transport.
+
+        retry_config (dict): Retry configurations (``session`` transport only).
+
+        cache_config (dict): ``requests_cache.CachedSession`` configurations
+                             (``session`` transport only).
+
+        pool_config (dict): Connection pool configurations (``session`` transport only).
+
+    Returns:
+        object: Transport (with the ``head``, ``get`` and ``close`` methods).
+    """
+    transport_config = dict(transport_config or {})
+    transport_type = transport_config.pop("type", "session")
+
+    if transport_type == "replay":
+        return ReplayTransport(**transport_config)
+
+    if transport_type == "simulated":
+        return SimulatedTransport(**transport_config)
+
+    if transport_type == "session":
+        return create_session(retry_config, cache_config, pool_config)
+
+    raise ValueError(f"Invalid transport type: {transport_type}")
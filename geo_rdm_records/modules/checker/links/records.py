@@ -12,8 +12,12 @@ from pydash import py_
 
 from geo_rdm_records.base.records.types import GEORecordTypes
 from geo_rdm_records.modules.checker.base import stats as checker_stats
-from geo_rdm_records.modules.checker.base.metadata import expand_record_metadata
-from geo_rdm_records.modules.checker.schema import EmailRecordJSONSerializer
+from geo_rdm_records.modules.checker.base.metadata import (
+    expand_record_metadata,
+    index_records_metadata,
+    load_records_metadata,
+)
+from geo_rdm_records.modules.checker.schema import email_record_serializer
 
 
 #
@@ -64,7 +68,7 @@ def _serialize_record(record):
     Returns:
         dict: Record with serialized fields.
     """
-    return EmailRecordJSONSerializer().dump_obj(record)
+    return email_record_serializer.dump_obj(record)
 
 
 def _enrich_harvester(record):
@@ -168,6 +172,25 @@ def _merge_metadata(records, cache):
     Yields:
         dict: Record metadata object.
     """
+    cache = index_records_metadata(cache)
+
+    # loading all missing metadata at once
+    packages_ids = [
+        record["package"]["id"] for record in records if "package" in record
+    ]
+    resources_ids = [
+        *[
+            resource["id"]
+            for record in records
+            if "package" in record
+            for resource in record["resources"]
+        ],
+        *[record["id"] for record in records if "package" not in record],
+    ]
+
+    load_records_metadata(packages_ids, cache["packages"], GEORecordTypes.package)
+    load_records_metadata(resources_ids, cache["resources"], GEORecordTypes.resource)
+
     for record in records:
         if "package" in record:
             # preparing package metadata
@@ -199,7 +222,7 @@ def _merge_metadata(records, cache):
 #
 # Records high-level functions.
 #
-def enrich_results(records_status_object, metadata_cache):
+def enrich_results(records_status_object, metadata_cache, number_of_records=None):
     """Inject extra metadata in the links status object.
 
     Args:
@@ -207,6 +230,9 @@ def enrich_results(records_status_object, metadata_cache):
 
         metadata_cache (dict): Already loaded metadata.
 
+        number_of_records (int): Number of records of the owner. If ``None``, the
+                                 records in ``metadata_cache`` are counted.
+
     Returns:
         dict: Records with extra metadata.
     """
@@ -225,7 +251,8 @@ def enrich_results(records_status_object, metadata_cache):
             resources.append(_enrich_resource(record_status_object))
 
     # summarizing some metrics
-    number_of_records = checker_stats.count_records(**metadata_cache)
+    if number_of_records is None:
+        number_of_records = checker_stats.count_records(**metadata_cache)
     number_of_errors = _summarize(packages, "nerrors") + _summarize(
         resources, "nerrors"
     )
@@ -7,125 +7,379 @@
 
 """Validation links module."""
 
-from invenio_access.models import User
+from invenio_rdm_records.proxies import current_rdm_records_service
 from invenio_search.engine import dsl
+from pydash import py_
 
 from geo_rdm_records.modules.checker.base import records as checker_records
 from geo_rdm_records.modules.checker.base import report as checker_reports
+from geo_rdm_records.modules.checker.base import stats as checker_stats
+from geo_rdm_records.modules.checker.base.metrics import RunMetrics
 from geo_rdm_records.modules.checker.links import records as record_utils
 from geo_rdm_records.modules.checker.links.checker import check
+from geo_rdm_records.modules.checker.links.checker.engine import LinkCheckerEngine
+from geo_rdm_records.modules.checker.schema import email_record_serializer
+from geo_rdm_records.proxies import current_geo_packages_service
 
+REPORTS_BATCH_SIZE = 100
+"""Number of owners whose records metadata is read at once to build the reports."""
 
-def _validate_packages_links(packages, checker_configuration):
-    """Validate links from Knowledge Packages.
 
-    Args:
-        packages (list): List of ``GEOPackageRecord``.
+def _select_packages(packages):
+    """Select the packages to be checked.
 
-        checker_configuration (dict): Extra configurations for the link checker.
+    Args:
+        packages (list): List of packages metadata (search hits).
 
     Returns:
-        list: List containing status of the links from the packages.
+        list: List of packages metadata to be checked.
     """
-    results = []
+    valid_packages = []
 
     for package in packages:
-        package_is_latest = package.versions.is_latest
-        package_is_published = package.is_published
+        package_is_latest = py_.get(package, "versions.is_latest")
+        package_is_published = package.get("is_published")
 
         # Check only the latest versions of published packages
         if package_is_latest and package_is_published:
-            # Extracting resources
-            package_resources = [r.resolve() for r in package.relationship.resources]
-
-            # Validating links from resources
-            package_resources_links_status = check.checker_validate_links(
-                package_resources
-            )
-
-            # Validating links from the package
-            package_links_status = check.checker_validate_links(
-                [package], **checker_configuration
-            )
+            valid_packages.append(package)
 
-            # Saving the result
-            results.append(
-                dict(
-                    package=package_links_status[0],
-                    resources=package_resources_links_status,
-                )
-            )
-
-    return results
+    return valid_packages
 
 
-def _validate_resources_links(resources, checker_configuration):
-    """Validate links from Knowledge Resources.
+def _select_resources(resources):
+    """Select the resources to be checked.
 
     Args:
-        resources (list): List of ``GEORecord``
-
-        checker_configuration (dict): Extra configurations for the link checker.
+        resources (list): List of resources metadata (search hits).
 
     Returns:
-        list: List containing status of the links from the resources.
+        list: List of resources metadata to be checked.
     """
     valid_resources = []
 
     for resource in resources:
-        resource_is_published = resource.is_published
-        resource_is_latest = resource.versions.is_latest
-        resource_is_managed = resource.parent.relationship.managed_by is None
+        resource_is_published = resource.get("is_published")
+        resource_is_latest = py_.get(resource, "versions.is_latest")
+        resource_is_managed = (
+            py_.get(resource, "parent.relationship.managed_by.id") is None
+        )
 
         # select only the latest versions of not-managed published resources
         if resource_is_latest and resource_is_published and resource_is_managed:
             valid_resources.append(resource)
 
-    return check.checker_validate_links(valid_resources, **checker_configuration)
+    return valid_resources
 
 
-def _validate_records_links(records, checker_configuration):
-    """Check links from records (Knowledge Packages and Knowledge Resources).
+def _read_packages_resources(packages, resources):
+    """Read the metadata of the packages resources.
 
     Args:
-        records (list): List of ``GEOPackageRecord`` and ``GEORecord``.
+        packages (list): List of packages metadata (search hits).
+
+        resources (list): List of resources metadata already available.
+
+    Returns:
+        dict: Resources metadata indexed by the resource id.
+    """
+    resources = {resource["id"]: resource for resource in resources}
+
+    packages_resources = py_.uniq(
+        [
+            resource["id"]
+            for package in packages
+            for resource in py_.get(package, "relationship.resources", [])
+        ]
+    )
+
+    # reading the resources not available in a single search
+    missing_resources = [rid for rid in packages_resources if rid not in resources]
+
+    if missing_resources:
+        resources.update(
+            {
+                resource["id"]: resource
+                for resource in checker_records.get_records_by_ids(
+                    current_rdm_records_service, missing_resources
+                )
+            }
+        )
+
+    return resources
+
+
+def _extract_records_links(records_metadata, links_fields=None):
+    """Extract links from records (Knowledge Packages and Knowledge Resources).
+
+    Args:
+        records_metadata (dict): Metadata (search hits) of packages and resources.
+
+        links_fields (list): Fields (dotted paths) where the links are searched.
+
+    Returns:
+        dict: Links of the records to be checked, organized by type.
+    """
+    packages = _select_packages(records_metadata["packages"])
+    resources = _select_resources(records_metadata["resources"])
+
+    packages_resources = _read_packages_resources(
+        packages, records_metadata["resources"]
+    )
+
+    return dict(
+        packages=[
+            dict(
+                package=check.extract_records_links([package], links_fields),
+                resources=check.extract_records_links(
+                    [
+                        packages_resources[resource["id"]]
+                        for resource in py_.get(package, "relationship.resources", [])
+                        if resource["id"] in packages_resources
+                    ],
+                    links_fields,
+                ),
+            )
+            for package in packages
+        ],
+        resources=check.extract_records_links(resources, links_fields),
+    )
+
+
+def _records_links(records_links):
+    """List all links from a records links object."""
+    for package in records_links["packages"]:
+        yield from py_.flatten(list(package["package"].values()))
+        yield from py_.flatten(list(package["resources"].values()))
+
+    yield from py_.flatten(list(records_links["resources"].values()))
+
+
+def _records_ids(records_links):
+    """List the IDs of the packages and of the resources from a records links object."""
+    packages = [
+        record_id
+        for package in records_links["packages"]
+        for record_id in package["package"]
+    ]
+    resources = [
+        *[
+            record_id
+            for package in records_links["packages"]
+            for record_id in package["resources"]
+        ],
+        *records_links["resources"],
+    ]
+
+    return packages, resources
 
-        checker_configuration (dict): Extra configurations for the link checker.
+
+def _read_records_metadata(owners_links):
+    """Read the metadata of the records of many owners.
+
+    Args:
+        owners_links (list): List of tuples with the owner ID, the links of its
+                             records and its number of records.
+
+    Returns:
+        dict: Metadata of ``packages`` and ``resources`` indexed by the record ID.
+    """
+    packages, resources = set(), set()
+
+    for _, records_links, _ in owners_links:
+        packages_ids, resources_ids = _records_ids(records_links)
+
+        packages.update(packages_ids)
+        resources.update(resources_ids)
+
+    return dict(
+        packages={
+            record["id"]: record
+            for record in checker_records.get_records_by_ids(
+                current_geo_packages_service, list(packages)
+            )
+        },
+        resources={
+            record["id"]: record
+            for record in checker_records.get_records_by_ids(
+                current_rdm_records_service, list(resources)
+            )
+        },
+    )
+
+
+def _owner_records_metadata(records_links, records_metadata):
+    """Select the metadata of the records of an owner.
+
+    Args:
+        records_links (dict): Links of the owner records, organized by type.
+
+        records_metadata (dict): Metadata of ``packages`` and ``resources`` indexed
+                                 by the record ID.
+
+    Returns:
+        dict: Metadata (list) of the owner ``packages`` and ``resources``.
+    """
+    packages_ids, resources_ids = _records_ids(records_links)
+
+    return dict(
+        packages=[
+            records_metadata["packages"][record_id]
+            for record_id in dict.fromkeys(packages_ids)
+            if record_id in records_metadata["packages"]
+        ],
+        resources=[
+            records_metadata["resources"][record_id]
+            for record_id in dict.fromkeys(resources_ids)
+            if record_id in records_metadata["resources"]
+        ],
+    )
+
+
+def _build_records_links_status(records_links, links_status):
+    """Build the links status of the records.
+
+    Args:
+        records_links (dict): Links of the records, organized by type.
+
+        links_status (dict): Status of the links (``link -> dict``).
 
     Returns:
         list: List containing status of the links from the records.
     """
-    # filtering the records by type.
-    packages = list(filter(lambda x: x.parent["type"] == "package", records))
-    resources = list(filter(lambda x: x.parent["type"] != "package", records))
 
-    # validating the links.
+    def _build(records):
+        return [
+            check.build_links_status(record_id, record_links, links_status)
+            for record_id, record_links in records.items()
+        ]
+
     return [
-        *_validate_packages_links(packages, checker_configuration),
-        *_validate_resources_links(resources, checker_configuration),
+        *[
+            dict(
+                package=_build(package["package"])[0],
+                resources=_build(package["resources"]),
+            )
+            for package in records_links["packages"]
+        ],
+        *_build(records_links["resources"]),
     ]
 
 
-def validate_records_links(checker_configuration, report_configuration):
-    """Validate links from GEO Knowledge Hub records (Knowledge Packages and Knowledge Resources)."""
-    for user in User.query.yield_per(1000):
-        records_owner_id = user.id
+def validate_records_links(
+    checker_configuration,
+    report_configuration,
+    run_id,
+    owners_filter=None,
+    metrics=None,
+):
+    """Validate links from GEO Knowledge Hub records (Knowledge Packages and Knowledge Resources).
 
-        # reading records associated with the current author (packages and resources)
-        records_obj, records_metadata = checker_records.get_records_by_owner(
-            records_owner_id, extra_filter=dsl.Q("term", **{"versions.is_latest": True})
-        )
+    Args:
+        checker_configuration (dict): Links checker configuration.
 
-        if not len(records_obj):
-            continue
+        report_configuration (dict): Report configuration.
+
+        run_id (int): ID of the checker run (used to store the reports).
+
+        owners_filter (invenio_search.engine.dsl.query.Query): Filter to select the
+                                                               owners to be checked.
+
+        metrics (RunMetrics): Metrics of the run. If not defined, a new object is created.
+
+    Returns:
+        dict: Statistics of the validation (``owners``, ``records``, ``links``,
+              ``broken_links`` and the run ``metrics`` summary).
 
-        # checking links
-        validation_results = _validate_records_links(records_obj, checker_configuration)
-        validation_results = record_utils.enrich_results(
-            validation_results, metadata_cache=records_metadata
+    Note:
+        The validation runs in three phases, so each unique link is checked only
+        once, even if it is used in records from many owners (of the same shard):
+
+            1. Extraction: links are extracted from the records of all owners;
+            2. Checking: each unique link is checked;
+            3. Fan-out: links status are distributed in the owners reports.
+
+        Only the records IDs and links are kept between the phases: the records
+        metadata is read again (in batches of owners) when the reports are built.
+    """
+    owners_links = []
+    links = set()
+
+    metrics = metrics or RunMetrics("links")
+
+    # records serialized in previous runs (of this process) may be outdated
+    email_record_serializer.clear()
+
+    links_fields = checker_configuration.get("links_fields")
+    engine_configuration = py_.omit(checker_configuration, "links_fields")
+
+    # 1. Extraction
+    # reading records metadata grouped by owner (packages and resources). Links
+    # are extracted directly from the indexed documents.
+    extra_filter = dsl.Q("term", **{"versions.is_latest": True})
+
+    if owners_filter is not None:
+        extra_filter &= owners_filter
+
+    owners_records = checker_records.iter_records_metadata_by_owner(
+        extra_filter=extra_filter
+    )
+
+    for records_owner_id, records_metadata in metrics.timed(owners_records, "search"):
+        with metrics.phase("extraction"):
+            records_links = _extract_records_links(records_metadata, links_fields)
+            links.update(_records_links(records_links))
+
+        owners_links.append(
+            (
+                records_owner_id,
+                records_links,
+                checker_stats.count_records(**records_metadata),
+            )
         )
 
+    # 2. Checking
+    with metrics.phase("network"):
+        with LinkCheckerEngine(metrics=metrics, **engine_configuration) as engine:
+            links_status = check.checker_check_links(links, engine)
+
+    # 3. Fan-out
+    # reports are built (and queued) by batch of owners.
+    number_of_records = 0
+
+    for owners_batch in py_.chunk(owners_links, REPORTS_BATCH_SIZE):
+        reports = []
+
+        with metrics.phase("enrichment"):
+            records_metadata = _read_records_metadata(owners_batch)
+
+        for records_owner_id, records_links, owner_records in owners_batch:
+            with metrics.phase("enrichment"):
+                validation_results = _build_records_links_status(
+                    records_links, links_status
+                )
+                validation_results = record_utils.enrich_results(
+                    validation_results,
+                    metadata_cache=_owner_records_metadata(
+                        records_links, records_metadata
+                    ),
+                    number_of_records=owner_records,
+                )
+
+            number_of_records += validation_results["total_records"]
+
+            reports.append((records_owner_id, validation_results))
+
         # reporting results
-        checker_reports.send_report(
-            validation_results, records_owner_id, report_configuration
-        )
+        with metrics.phase("reports"):
+            checker_reports.queue_reports(run_id, reports, report_configuration)
+
+    return dict(
+        owners=len(owners_links),
+        records=number_of_records,
+        links=len(links_status),
+        broken_links=len(
+            [status for status in links_status.values() if not status["is_available"]]
+        ),
+        metrics=metrics.summary(),
+    )
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Checker models."""
+
+import hashlib
+
+from invenio_db import db
+from sqlalchemy.dialects import mysql
+
+
+def _datetime_column(**kwargs):
+    """Datetime column (with microseconds support in MySQL)."""
+    return db.Column(
+        db.DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql"), **kwargs
+    )
+
+
+class GEOLinkStatus(db.Model):
+    """Last known status of a link checked by the Link Checker."""
+
+    __tablename__ = "geo_checker_links_status"
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    """Link status ID."""
+
+    url_hash = db.Column(db.String(64), nullable=False, unique=True)
+    """SHA-256 of the URL (URLs can be too long to be indexed)."""
+
+    url = db.Column(db.Text, nullable=False)
+    """Checked URL."""
+
+    is_available = db.Column(db.Boolean, nullable=False, default=False)
+    """Last status of the URL."""
+
+    last_checked = _datetime_column(nullable=False)
+    """Date of the last check."""
+
+    next_check = _datetime_column(nullable=False, index=True)
+    """Date from which the URL must be checked again."""
+
+    consecutive_failures = db.Column(db.Integer, nullable=False, default=0)
+    """Number of consecutive checks with the URL unavailable."""
+
+    consecutive_successes = db.Column(db.Integer, nullable=False, default=0)
+    """Number of consecutive checks with the URL available."""
+
+    etag = db.Column(db.String(255), nullable=True)
+    """Last ``ETag`` returned by the server."""
+
+    last_modified = db.Column(db.String(255), nullable=True)
+    """Last ``Last-Modified`` returned by the server."""
+
+    @staticmethod
+    def hash_url(url):
+        """Calculate the hash of an URL."""
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+class GEOCheckerRun(db.Model):
+    """Execution of a checker split in shards (used as checkpoint)."""
+
+    __tablename__ = "geo_checker_runs"
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    """Run ID."""
+
+    checker = db.Column(db.String(64), nullable=False, index=True)
+    """Name of the checker (e.g., ``links``)."""
+
+    created = _datetime_column(nullable=False)
+    """Date when the run was created."""
+
+    completed = _datetime_column(nullable=True)
+    """Date when all shards of the run were finished."""
+
+    stats = db.Column(db.JSON, nullable=True)
+    """Aggregated statistics of the run."""
+
+    shards = db.relationship(
+        "GEOCheckerShard",
+        back_populates="run",
+        order_by="GEOCheckerShard.shard",
+        cascade="all, delete-orphan",
+    )
+    """Shards of the run."""
+
+
+class GEOCheckerLock(db.Model):
+    """Lock of the runs of a checker (one row per checker).
+
+    The row is locked (``SELECT ... FOR UPDATE``) while a run is selected or
+    created, so concurrent dispatches of the same checker are serialized.
+    """
+
+    __tablename__ = "geo_checker_locks"
+
+    checker = db.Column(db.String(64), primary_key=True)
+    """Name of the checker (e.g., ``links``)."""
+
+
+class GEOCheckerShard(db.Model):
+    """Shard of a checker run (range of owners)."""
+
+    __tablename__ = "geo_checker_shards"
+
+    __table_args__ = (db.UniqueConstraint("run_id", "shard"),)
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    """Shard ID."""
+
+    run_id = db.Column(
+        db.Integer, db.ForeignKey(GEOCheckerRun.id, ondelete="CASCADE"), nullable=False
+    )
+    """Run ID."""
+
+    shard = db.Column(db.Integer, nullable=False)
+    """Shard number (inside the run)."""
+
+    first_owner = db.Column(db.Integer, nullable=True)
+    """First owner (user ID) of the shard. If ``None``, the range is open."""
+
+    last_owner = db.Column(db.Integer, nullable=True)
+    """Last owner (user ID) of the shard. If ``None``, the range is open."""
+
+    started = _datetime_column(nullable=True)
+    """Date when the shard processing was started."""
+
+    finished = _datetime_column(nullable=True)
+    """Date when the shard processing was finished."""
+
+    stats = db.Column(db.JSON, nullable=True)
+    """Statistics of the shard."""
+
+    run = db.relationship(GEOCheckerRun, back_populates="shards")
+    """Run of the shard."""
+
+
+class GEOCheckerOwnerState(db.Model):
+    """Last state of the records of an owner evaluated by a checker."""
+
+    __tablename__ = "geo_checker_owners_state"
+
+    __table_args__ = (db.UniqueConstraint("checker", "owner_id"),)
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    """Owner state ID."""
+
+    checker = db.Column(db.String(64), nullable=False)
+    """Name of the checker (e.g., ``outdated``)."""
+
+    owner_id = db.Column(db.Integer, nullable=False)
+    """Owner (user ID)."""
+
+    watermark = _datetime_column(nullable=False, index=True)
+    """Date of the last evaluation of the owner records."""
+
+    state_hash = db.Column(db.String(64), nullable=False)
+    """SHA-256 of the last state of the owner records."""
+
+
+class GEOCheckerReport(db.Model):
+    """Report of an owner waiting to be delivered."""
+
+    __tablename__ = "geo_checker_reports"
+
+    __table_args__ = (db.UniqueConstraint("run_id", "owner_id"),)
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    """Report ID."""
+
+    run_id = db.Column(
+        db.Integer, db.ForeignKey(GEOCheckerRun.id, ondelete="CASCADE"), nullable=False
+    )
+    """Run ID."""
+
+    owner_id = db.Column(db.Integer, nullable=False)
+    """Owner (user ID)."""
+
+    created = _datetime_column(nullable=False)
+    """Date when the report was created."""
+
+    payload = db.Column(db.JSON, nullable=False)
+    """Records of the owner (with the checker results) used to render the report."""
@@ -11,14 +11,7 @@
 import datetime
 
 
-def _is_outdated(record, threshold):
-    """Check if a record is outdated."""
-    date_threshold = datetime.datetime.now() - datetime.timedelta(threshold)
-
-    return not (record["last_update"] > date_threshold)
-
-
-def check_records_outdated(records, date_threshold=6 * 365 / 12):
+def check_records_outdated(records, date_threshold=6 * 365 / 12, now=None):
     """Check which record is outdated.
 
     Args:
@@ -26,10 +19,16 @@ def check_records_outdated(records, date_threshold=6 * 365 / 12):
 
         date_threshold (number): Number of days used as threshold (6 months by default).
 
+        now (datetime.datetime): Reference date (UTC). If ``None``, the current date is used.
+
     Returns:
         list: List of dicts containing records and flags indicating if they are outdated.
     """
+    # the threshold date is the same for all records
+    now = now or datetime.datetime.utcnow()
+    outdated_date = now - datetime.timedelta(date_threshold)
+
     for record in records:
-        record["is_outdated"] = _is_outdated(record, date_threshold)
+        record["is_outdated"] = record["last_update"] <= outdated_date
 
     return records
@@ -7,15 +7,40 @@
 
 """Records manipulation utility module."""
 
+from datetime import datetime, timezone
+
+from invenio_access.permissions import system_identity
+from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_search.engine import dsl
+from pydash import py_
+
 from geo_rdm_records.base.records.types import GEORecordTypes
 from geo_rdm_records.modules.checker.base import metadata as checker_metadata
 from geo_rdm_records.modules.checker.base import stats as checker_stats
-from geo_rdm_records.modules.checker.schema import EmailRecordJSONSerializer
+from geo_rdm_records.modules.checker.schema import email_record_serializer
+
+PACKAGES_FIELD = "relationship.packages.id"
+"""Field with the packages associated with a resource in the search index."""
 
 
 #
 # Utilities
 #
+def _from_isoformat(value):
+    """Convert an ISO date (as in the search hits) to a naive UTC datetime."""
+    value = datetime.fromisoformat(value)
+
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return value
+
+
+def _from_timestamp(value):
+    """Convert a timestamp in milliseconds (as in aggregations) to a naive UTC datetime."""
+    return datetime.fromtimestamp(value / 1000, timezone.utc).replace(tzinfo=None)
+
+
 def _count(records, key):
     """Count valid values into a list of dicts.
 
@@ -39,51 +64,118 @@ def _serialize_record(record):
     Returns:
         dict: Record with serialized fields.
     """
-    return EmailRecordJSONSerializer().dump_obj(record)
+    return email_record_serializer.dump_obj(record)
 
 
 #
 # Records high-level functions.
 #
-def get_update_date_from_records(records):
-    """Get last update date from records.
+def get_packages_resources_update_date(packages, chunk_size=1000):
+    """Get the minimum update date of the resources of many packages.
+
+    The dates are calculated in the search engine, using a terms aggregation
+    over the packages associated with the resources (``relationship.packages.id``).
+
+    Args:
+        packages (list): Packages IDs.
+
+        chunk_size (int): Maximum number of packages in each aggregation.
+
+    Returns:
+        dict: Minimum update date (UTC) of the resources of each package.
+    """
+    results = {}
+
+    for chunk in py_.chunk(list(dict.fromkeys(packages)), chunk_size):
+        search = current_rdm_records_service._search(
+            "search",
+            system_identity,
+            {"allversions": True},
+            None,
+            extra_filter=dsl.Q("terms", **{PACKAGES_FIELD: chunk}),
+        )[:0]
+
+        search.aggs.bucket(
+            "packages", "terms", field=PACKAGES_FIELD, size=len(chunk)
+        ).metric("last_update", "min", field="updated")
+
+        buckets = search.execute().aggregations.packages.buckets
+
+        for bucket in buckets:
+            if bucket.last_update.value is not None:
+                results[bucket.key] = _from_timestamp(bucket.last_update.value)
+
+    return results
+
+
+def get_resources_packages(extra_filter):
+    """Get the packages associated with the resources selected by a filter.
 
     Args:
-        records (list): List of records (Package or resource).
+        extra_filter (invenio_search.engine.dsl.query.Query): Resources filter.
+
+    Returns:
+        set: Packages IDs.
+    """
+    search = current_rdm_records_service._search(
+        "scan",
+        system_identity,
+        {},
+        None,
+        extra_filter=extra_filter & dsl.Q("exists", field=PACKAGES_FIELD),
+    )
+    search = search.source([PACKAGES_FIELD])
+
+    packages = set()
+
+    for hit in search.scan():
+        packages.update(
+            package["id"]
+            for package in py_.get(hit.to_dict(), "relationship.packages", [])
+        )
+
+    return packages
+
+
+def get_update_date_from_metadata(records_metadata, resources_update_dates):
+    """Get last update date from records metadata.
+
+    Args:
+        records_metadata (dict): Metadata (search hits) of packages and resources.
+
+        resources_update_dates (dict): Minimum update date of the resources of each
+                                       package (see ``get_packages_resources_update_date``).
 
     Returns:
         list: List of dicts containing the records and their last update dates.
     """
     records_update_dates = []
 
-    for record in records:
-        if record.parent.type == GEORecordTypes.package:
-            package_update_dates = [record.updated]
+    for package in records_metadata["packages"]:
+        package_update_dates = [_from_isoformat(package["updated"])]
 
-            for resource in record.relationship.resources:
-                package_update_dates.append(resource.resolve().updated)
+        if package["id"] in resources_update_dates:
+            package_update_dates.append(resources_update_dates[package["id"]])
 
-            # checking the minimum date
-            last_update_date = min(package_update_dates)
+        records_update_dates.append(
+            dict(
+                record=package,
+                last_update=min(package_update_dates),
+                type=GEORecordTypes.package,
+            )
+        )
 
+    for resource in records_metadata["resources"]:
+        # only resources not managed by packages are checked
+        if py_.get(resource, "parent.relationship.managed_by.id") is None:
             records_update_dates.append(
                 dict(
-                    record=record,
-                    last_update=last_update_date,
-                    type=GEORecordTypes.package,
+                    record=resource,
+                    last_update=_from_isoformat(resource["updated"]),
+                    type=GEORecordTypes.resource,
                 )
             )
 
-        else:
-            if record.parent.relationship.managed_by is None:
-                records_update_dates.append(
-                    dict(
-                        record=record,
-                        last_update=record.updated,
-                        type=GEORecordTypes.resource,
-                    )
-                )
-
     return records_update_dates
 
 
@@ -101,12 +193,33 @@ def enrich_results(results, metadata_cache):
     packages = []
     resources = []
 
+    # indexing the metadata and loading all missing records at once
+    cache = checker_metadata.index_records_metadata(metadata_cache)
+
+    packages_ids = [
+        result["record"]["id"]
+        for result in results
+        if result["type"] == GEORecordTypes.package
+    ]
+    resources_ids = [
+        result["record"]["id"]
+        for result in results
+        if result["type"] != GEORecordTypes.package
+    ]
+
+    checker_metadata.load_records_metadata(
+        packages_ids, cache["packages"], GEORecordTypes.package
+    )
+    checker_metadata.load_records_metadata(
+        resources_ids, cache["resources"], GEORecordTypes.resource
+    )
+
     for result in results:
         if result["type"] == GEORecordTypes.package:
             result["record"] = _serialize_record(
                 checker_metadata.expand_record_metadata(
                     result["record"]["id"],
-                    metadata_cache["packages"],
+                    cache["packages"],
                     GEORecordTypes.package,
                 )
             )
@@ -117,7 +230,7 @@ def enrich_results(results, metadata_cache):
             result["record"] = _serialize_record(
                 checker_metadata.expand_record_metadata(
                     result["record"]["id"],
-                    metadata_cache["resources"],
+                    cache["resources"],
                     GEORecordTypes.resource,
                 )
             )
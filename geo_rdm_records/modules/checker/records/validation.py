@@ -7,36 +7,250 @@
 
 """Validation records module."""
 
-from invenio_access.models import User
+from datetime import datetime, timedelta
+from itertools import islice
+
 from invenio_search.engine import dsl
+from pydash import py_
 
 from geo_rdm_records.modules.checker.base import records as checker_records
 from geo_rdm_records.modules.checker.base import report as checker_reports
+from geo_rdm_records.modules.checker.base.metrics import RunMetrics
+from geo_rdm_records.modules.checker.base.state import OwnersStateStore, hash_state
 from geo_rdm_records.modules.checker.records import records as record_utils
 from geo_rdm_records.modules.checker.records.checker import check
+from geo_rdm_records.modules.checker.schema import email_record_serializer
+
+OWNERS_BATCH_SIZE = 100
+"""Number of owners evaluated at once (e.g., in the packages resources aggregation)."""
+
+TERMS_CHUNK_SIZE = 1000
+"""Maximum number of values in each ``terms`` query (e.g., changed owners)."""
+
+
+def _batches(iterable, size):
+    """Split an iterable in lists of ``size`` items (consuming it lazily)."""
+    iterator = iter(iterable)
+
+    while True:
+        batch = list(islice(iterator, size))
+
+        if not batch:
+            return
+
+        yield batch
+
+
+def _terms_filter(field, values, chunk_size):
+    """Create a ``terms`` filter split in chunks (to respect the terms count limit)."""
+    if not values:
+        return dsl.Q("match_none")
+
+    return dsl.Q(
+        "bool",
+        should=[
+            dsl.Q("terms", **{field: chunk}) for chunk in py_.chunk(values, chunk_size)
+        ],
+        minimum_should_match=1,
+    )
+
+
+def _changed_owners(owners_filter, watermark, outdated_criteria, now):
+    """Get the owners with records changed since the watermark.
+
+    A record changed if it was updated after the watermark or if its update date
+    crossed the outdated threshold between the watermark and now. The owners of
+    the packages of changed resources are also selected, as the resources may be
+    changed by other users.
 
+    Args:
+        owners_filter (invenio_search.engine.dsl.query.Query): Filter to select the
+                                                               owners to be checked.
 
-def validate_records_outdated(outdated_criteria_configuration, report_configuration):
-    """Validate outdated records."""
-    for user in User.query.yield_per(1000):
-        records_owner_id = user.id
+        watermark (datetime.datetime): Date of the oldest evaluation.
 
-        records_obj, records_metadata = checker_records.get_records_by_owner(
-            records_owner_id, extra_filter=dsl.Q("term", **{"versions.is_latest": True})
+        outdated_criteria (number): Number of days used as threshold.
+
+        now (datetime.datetime): Evaluation date (UTC).
+
+    Returns:
+        list: Owners IDs.
+    """
+    threshold = timedelta(outdated_criteria)
+
+    changed_filter = dsl.Q("term", **{"versions.is_latest": True}) & (
+        dsl.Q("range", updated={"gt": watermark.isoformat()})
+        | dsl.Q(
+            "range",
+            updated={
+                "gt": (watermark - threshold).isoformat(),
+                "lte": (now - threshold).isoformat(),
+            },
         )
+    )
+
+    owners_filter = owners_filter if owners_filter is not None else dsl.Q("match_all")
 
-        if not len(records_obj):
-            continue
+    owners = checker_records.get_owners(changed_filter & owners_filter)
 
-        records_dates = record_utils.get_update_date_from_records(records_obj)
+    # packages of the changed resources (from any owner)
+    packages = sorted(record_utils.get_resources_packages(changed_filter))
 
-        # checking what are the outdated packages
-        records_dates = check.check_records_outdated(
-            records_dates, outdated_criteria_configuration["outdated_criteria"]
+    if packages:
+        owners |= checker_records.get_owners(
+            _terms_filter("id", packages, TERMS_CHUNK_SIZE) & owners_filter
         )
-        records_dates = record_utils.enrich_results(records_dates, records_metadata)
+
+    return sorted(owners)
+
+
+def _records_state(records_dates):
+    """State of the records of an owner (used to detect changes)."""
+    return hash_state(
+        [
+            [record["type"], record["record"]["id"], record["is_outdated"]]
+            for record in records_dates
+        ]
+    )
+
+
+def validate_records_outdated(
+    outdated_criteria_configuration,
+    report_configuration,
+    run_id,
+    owners_filter=None,
+    owners_range=None,
+    metrics=None,
+):
+    """Validate outdated records.
+
+    Args:
+        outdated_criteria_configuration (dict): Outdated records checker configuration.
+
+        report_configuration (dict): Report configuration.
+
+        run_id (int): ID of the checker run (used to store the reports).
+
+        owners_filter (invenio_search.engine.dsl.query.Query): Filter to select the
+                                                               owners to be checked.
+
+        owners_range (tuple): First and last owner selected by ``owners_filter``
+                              (``None`` for open ranges). Used to scope the owners
+                              state in the incremental mode.
+
+        metrics (RunMetrics): Metrics of the run. If not defined, a new object is created.
+
+    Returns:
+        dict: Statistics of the validation (``owners``, ``records``, ``outdated`` and
+              the run ``metrics`` summary).
+
+    Note:
+        In the incremental mode (``incremental`` in the checker configuration), only
+        owners with records updated, or that crossed the outdated threshold, since
+        the last evaluation are checked. Reports are sent only when the owner state
+        changes.
+    """
+    stats = dict(owners=0, records=0, outdated=0)
+
+    metrics = metrics or RunMetrics("outdated")
+
+    # records serialized in previous runs (of this process) may be outdated
+    email_record_serializer.clear()
+
+    now = datetime.utcnow()
+    outdated_criteria = outdated_criteria_configuration["outdated_criteria"]
+
+    extra_filter = dsl.Q("term", **{"versions.is_latest": True})
+
+    if owners_filter is not None:
+        extra_filter &= owners_filter
+
+    # incremental mode: selecting only the owners with changes since the last run
+    owners_state = None
+
+    if outdated_criteria_configuration.get("incremental"):
+        owners_state = OwnersStateStore("outdated", owners_range=owners_range)
+        watermark = owners_state.watermark()
+
+        # without a watermark (first run), all owners are evaluated
+        if watermark is not None:
+            with metrics.phase("selection"):
+                changed_owners = _changed_owners(
+                    owners_filter, watermark, outdated_criteria, now
+                )
+
+            # owners without changes are up-to-date until now
+            owners_state.touch(now, exclude=changed_owners)
+
+            extra_filter &= _terms_filter(
+                checker_records.OWNER_FIELD, changed_owners, TERMS_CHUNK_SIZE
+            )
+
+    # reading records metadata grouped by owner (packages and resources). The
+    # owners are evaluated in batches while the records are streamed.
+    owners_records = checker_records.iter_records_metadata_by_owner(
+        extra_filter=extra_filter
+    )
+
+    for owners_batch in _batches(
+        metrics.timed(owners_records, "search"), OWNERS_BATCH_SIZE
+    ):
+        reports = []
+
+        # calculating the update date of the packages resources of the batch at once
+        with metrics.phase("aggregation"):
+            resources_update_dates = record_utils.get_packages_resources_update_date(
+                [
+                    package["id"]
+                    for _, records_metadata in owners_batch
+                    for package in records_metadata["packages"]
+                ]
+            )
+
+        if owners_state is not None:
+            owners_state.load(
+                [records_owner_id for records_owner_id, _ in owners_batch]
+            )
+
+        for records_owner_id, records_metadata in owners_batch:
+            with metrics.phase("evaluation"):
+                records_dates = record_utils.get_update_date_from_metadata(
+                    records_metadata, resources_update_dates
+                )
+
+                # checking what are the outdated packages
+                records_dates = check.check_records_outdated(
+                    records_dates, outdated_criteria, now=now
+                )
+
+            # incremental mode: only owners with a new state are reported
+            if owners_state is not None:
+                state_changed = owners_state.update(
+                    records_owner_id, _records_state(records_dates), now
+                )
+
+                if not state_changed:
+                    continue
+
+            with metrics.phase("enrichment"):
+                records_dates = record_utils.enrich_results(
+                    records_dates, records_metadata
+                )
+
+            stats["owners"] += 1
+            stats["records"] += records_dates["total_records"]
+            stats["outdated"] += (
+                records_dates["total_packages_outdated"]
+                + records_dates["total_resources_outdated"]
+            )
+
+            reports.append((records_owner_id, records_dates))
 
         # reporting results
-        checker_reports.send_report(
-            records_dates, records_owner_id, report_configuration
-        )
+        with metrics.phase("reports"):
+            checker_reports.queue_reports(run_id, reports, report_configuration)
+
+    if owners_state is not None:
+        owners_state.commit()
+
+    return {**stats, "metrics": metrics.summary()}
@@ -7,6 +7,9 @@
 
 """Schema module."""
 
+import threading
+from collections import OrderedDict
+
 from flask_resources import BaseObjectSchema, MarshmallowSerializer
 from flask_resources.serializers import JSONSerializer
 from invenio_vocabularies.resources import VocabularyL10Schema
@@ -31,3 +34,58 @@ class EmailRecordJSONSerializer(MarshmallowSerializer):
             object_schema_cls=EmailRecordSchema,
             schema_context={"object_key": "ui"},
         )
+
+
+class EmailRecordSerializerCache:
+    """Cache of records serialized for e-mails.
+
+    A single serializer is used and each record (revision) is serialized only
+    once, even if it is included in the reports of many owners.
+    """
+
+    def __init__(self, maxsize=10000):
+        """Initializer.
+
+        Args:
+            maxsize (int): Maximum number of serialized records kept in the cache.
+        """
+        self._maxsize = maxsize
+        self._serializer = EmailRecordJSONSerializer()
+
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def dump_obj(self, record):
+        """Serialize a record (using the cache when possible).
+
+        Args:
+            record (dict): Record (Package or resource) with metadata to be serialized.
+
+        Returns:
+            dict: Record with serialized fields.
+        """
+        key = (record.get("id"), record.get("revision_id"))
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        result = self._serializer.dump_obj(record)
+
+        with self._lock:
+            self._cache[key] = result
+
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+        return result
+
+    def clear(self):
+        """Remove all serialized records from the cache (e.g., at the start of a run)."""
+        with self._lock:
+            self._cache.clear()
+
+
+email_record_serializer = EmailRecordSerializerCache()
+"""Shared serializer (and cache) of records for e-mails."""
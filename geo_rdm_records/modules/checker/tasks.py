@@ -7,30 +7,163 @@
 
 """Validation tasks module."""
 
-from celery import shared_task
+from celery import chord, shared_task
+from celery.utils.log import get_task_logger
+from flask import current_app
 
 from geo_rdm_records.modules.checker import config
+from geo_rdm_records.modules.checker.base import checkpoint
+from geo_rdm_records.modules.checker.base import report as checker_reports
+from geo_rdm_records.modules.checker.base.metrics import RunMetrics
 from geo_rdm_records.modules.checker.links.validation import validate_records_links
 from geo_rdm_records.modules.checker.records.validation import validate_records_outdated
 
+logger = get_task_logger(__name__)
+
+
+#
+# Runs
+#
+def _export_metrics(metrics):
+    """Export the metrics of a run as Prometheus counters (if enabled)."""
+    if config.get_metrics_config()["prometheus"]:
+        metrics.export_prometheus()
+
+
+def _dispatch_run(checker, shard_task):
+    """Dispatch the pending shards of a checker run as a chord.
+
+    Args:
+        checker (str): Name of the checker.
+
+        shard_task (celery.Task): Task used to process each shard.
+    """
+    runs_configuration = config.get_runs_config()
+
+    run = checkpoint.start_run(
+        checker, runs_configuration["shards"], runs_configuration["run_timeout"]
+    )
+    shards = checkpoint.pending_shards(run, runs_configuration["shard_timeout"])
+
+    # the statistics are aggregated from the checkpoints, so shards finished
+    # before a crash are also included.
+    callback = finish_checker_run.si(run.id)
+
+    if not shards:
+        # all shards are finished or still running in another chord
+        if all(shard.finished is not None for shard in run.shards):
+            callback.delay()
+
+        return
+
+    chord(shard_task.si(run.id, shard) for shard in shards)(callback)
+
 
 @shared_task(ignore_result=True)
-def check_records_links():
-    """Check records links."""
+def finish_checker_run(run_id):
+    """Finish a checker run, aggregating the statistics of its shards."""
+    metrics_configuration = config.get_metrics_config()
+
+    stats = checkpoint.finish_run(run_id, metrics_configuration["output_dir"])
+
+    logger.info("Checker run %s finished: %s", run_id, stats)
+
+
+#
+# Reports
+#
+@shared_task(bind=True, ignore_result=True)
+def send_checker_reports(self, run_id, owners, report_configuration):
+    """Deliver the reports of a batch of owners (only failed reports are retried)."""
+    delivery_configuration = current_app.config[
+        "GEO_RDM_CHECKER_REPORTS_DELIVERY_CONFIG"
+    ]
+
+    metrics = RunMetrics("reports")
+
+    with metrics.phase("mail"):
+        failed_owners = checker_reports.deliver_reports(
+            run_id, owners, report_configuration
+        )
+
+    metrics.incr("reports", len(owners))
+    metrics.incr("reports_failed", len(failed_owners))
+
+    logger.info("Checker reports batch delivered: %s", metrics.summary())
+    _export_metrics(metrics)
+
+    if failed_owners:
+        raise self.retry(
+            args=(run_id, failed_owners, report_configuration),
+            max_retries=delivery_configuration["max_retries"],
+            countdown=delivery_configuration["retry_delay"],
+        )
+
+
+#
+# Links checker
+#
+@shared_task
+def check_records_links_shard(run_id, shard):
+    """Check records links from the owners of a shard."""
     # reading configurations
     report_configuration = config.get_links_report_config()
     checker_configuration = config.get_links_checker_config()
 
     # validating links
-    validate_records_links(checker_configuration, report_configuration)
+    metrics = RunMetrics("links")
+    owners_filter = checkpoint.start_shard(run_id, shard)
+
+    stats = validate_records_links(
+        checker_configuration,
+        report_configuration,
+        run_id,
+        owners_filter=owners_filter,
+        metrics=metrics,
+    )
+
+    checkpoint.finish_shard(run_id, shard, stats)
+    _export_metrics(metrics)
+
+    return stats
 
 
 @shared_task(ignore_result=True)
-def check_records_outdated():
-    """Check for outdated records."""
+def check_records_links():
+    """Check records links."""
+    _dispatch_run("links", check_records_links_shard)
+
+
+#
+# Outdated records checker
+#
+@shared_task
+def check_records_outdated_shard(run_id, shard):
+    """Check for outdated records from the owners of a shard."""
     # reading configurations
     report_configuration = config.get_outdated_report_config()
     outdated_criteria_configuration = config.get_outdated_records_checker_config()
 
     # checking records
-    validate_records_outdated(outdated_criteria_configuration, report_configuration)
+    metrics = RunMetrics("outdated")
+    owners_filter = checkpoint.start_shard(run_id, shard)
+
+    stats = validate_records_outdated(
+        outdated_criteria_configuration,
+        report_configuration,
+        run_id,
+        owners_filter=owners_filter,
+        owners_range=checkpoint.get_shard_owners(run_id, shard),
+        metrics=metrics,
+    )
+
+    checkpoint.finish_shard(run_id, shard, stats)
+    _export_metrics(metrics)
+
+    return stats
+
+
+@shared_task(ignore_result=True)
+def check_records_outdated():
+    """Check for outdated records."""
+    _dispatch_run("outdated", check_records_outdated_shard)
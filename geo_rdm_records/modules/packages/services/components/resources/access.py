@@ -37,9 +37,7 @@ class PackageResourceAccessComponent(ServiceComponent):
         new_access_obj = data["access"]
 
         if new_access_obj["record"] == "restricted":
-            for resource in record.relationship.resources:
-                resource_obj = resource.resolve()
-
+            for resource_obj in record.relationship.resources.resolve_all():
                 if not resource_obj:
                     return
 
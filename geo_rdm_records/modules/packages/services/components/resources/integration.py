@@ -9,7 +9,6 @@
 
 from invenio_drafts_resources.services.records.components import ServiceComponent
 from invenio_rdm_records.proxies import current_rdm_records_service
-from invenio_records.dictutils import dict_lookup
 
 from geo_rdm_records.base.services.components.constraints import ConstrainedComponent
 from geo_rdm_records.modules.packages.errors import InvalidRelationshipError
@@ -97,18 +96,17 @@ class PackageResourceIntegrationComponent(ConstrainedComponent):
                     )
                 )
 
-        package_resources = list(
-            map(lambda x: x["id"], dict_lookup(package, "relationship.resources"))
-        )
-        resource_packages = list(
-            map(lambda x: x["id"], dict_lookup(resource, "relationship.packages"))
-        )
+        # the relationship containers are indexed by the record id, so membership
+        # tests and removals are constant-time. The record dicts are rewritten
+        # only once, when the records are committed (``pre_commit``).
+        package_resources = package.relationship.resources
+        resource_packages = resource.relationship.packages
 
-        if resource.pid.pid_value in package_resources:
-            package.relationship.resources.remove(resource)
+        if resource in package_resources:
+            package_resources.remove(resource)
 
-        if package.pid.pid_value in resource_packages:
-            resource.relationship.packages.remove(package)
+        if package in resource_packages:
+            resource_packages.remove(package)
 
 
 class PackageResourceCommunityComponent(ServiceComponent):
@@ -13,6 +13,8 @@ from invenio_rdm_records.services.secret_links.service import (
 )
 from invenio_records_resources.services.uow import RecordCommitOp, unit_of_work
 
+from geo_rdm_records.base.records.identity_map import records_identity_map
+
 from .service import get_context_manager
 
 
@@ -39,9 +41,7 @@ class SecretLinkService(BaseSecretLinkService):
         package, _ = self.get_parent_and_record_or_draft(id_)
 
         # Use the same link to the resources.
-        for resource in package.relationship.resources:
-            resource = resource.resolve()
-
+        for resource in package.relationship.resources.resolve_all(raise_error=True):
             # ToDo: In the first approach of the Packages API, the relations are classified
             #       Now, this classification is implicit and must be checked all the time.
             #       In a future version, we need to validate if this is the best approach
@@ -64,6 +64,7 @@ class SecretLinkService(BaseSecretLinkService):
                     )
                 )
 
+    @records_identity_map()
     @unit_of_work()
     def create(self, identity, id_, data, links_config=None, uow=None):
         """Create a secret link for a record (resp. its parent)."""
@@ -77,6 +78,7 @@ class SecretLinkService(BaseSecretLinkService):
 
         return op_result
 
+    @records_identity_map()
     @unit_of_work()
     def update(
         self,
@@ -98,6 +100,7 @@ class SecretLinkService(BaseSecretLinkService):
 
         return op_result
 
+    @records_identity_map()
     @unit_of_work()
     def delete(self, identity, id_, link_id, links_config=None, uow=None):
         """Delete a secret link for a record (resp. its parent)."""
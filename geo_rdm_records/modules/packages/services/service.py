@@ -9,6 +9,7 @@
 
 import enum
 
+from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_rdm_records.proxies import current_rdm_records_service
 from invenio_records_resources.services import ServiceSchemaWrapper
 from invenio_records_resources.services.uow import (
@@ -20,7 +21,10 @@ from invenio_records_resources.services.uow import (
 from marshmallow import ValidationError
 from sqlalchemy.orm.exc import NoResultFound
 
+from geo_rdm_records.base.records.identity_map import records_identity_map
+from geo_rdm_records.base.records.resolver import resolve_records
 from geo_rdm_records.base.services.search import BaseRelatedRecordsSearchService
+from geo_rdm_records.base.services.uow import RecordBulkIndexOp
 
 from ..errors import InvalidPackageError, InvalidPackageResourceError
 from ..records.api import PackageRelationship
@@ -161,6 +165,36 @@ class GEOPackageRecordService(BaseRelatedRecordsSearchService):
 
         return record
 
+    def _read_records(self, identity, ids, allow_draft=False):
+        """Read many bibliographic records (Drafts or Records) at once.
+
+        Bulk version of ``_read_record``: all records are resolved with one
+        query for the records and one for the drafts.
+
+        Returns:
+            dict: Records indexed by their PID value.
+        """
+        records = resolve_records(
+            ids,
+            self.resource_cls,
+            self.resource_draft_cls if allow_draft else None,
+        )
+
+        for id_ in ids:
+            if id_ not in records:
+                if not allow_draft:
+                    raise InvalidPackageResourceError(id_)
+
+                raise PIDDoesNotExistError(self.resource_cls.pid.field._pid_type, id_)
+
+        # Checking if user is able to read all records
+        for record in records.values():
+            current_rdm_records_service.require_permission(
+                identity, "read", record=record
+            )
+
+        return records
+
     def _handle_records(
         self, identity, id_, data, action, uow, revision_id=None, expand=False
     ):
@@ -182,10 +216,14 @@ class GEOPackageRecordService(BaseRelatedRecordsSearchService):
         records = data["records"]
         records_processed = []
 
+        records_obj = self._read_records(
+            identity, [record["id"] for record in records], allow_draft=True
+        )
+
         for record_id in records:
             record_id = record_id["id"]
 
-            record = self._read_record(identity, record_id, allow_draft=True)
+            record = records_obj[record_id]
 
             # only record without association with a package context
             # can be added to a context.
@@ -241,18 +279,22 @@ class GEOPackageRecordService(BaseRelatedRecordsSearchService):
         resources = data["resources"]
         resources_processed = []
 
+        # loading the resources metadata.
+        # for both ``Published`` and ``Draft`` records it is assumed
+        # that the permission verification is done in a specialized
+        # constrained component. This is done because this verification
+        # is combined with other properties of the record.
+        resources_obj = self._read_records(
+            identity, [resource["id"] for resource in resources], allow_draft=True
+        )
+
         for resource in resources:
             resource_obj = None
             resource_id = resource["id"]
 
             resource_errors = []
 
-            # loading the resource metadata.
-            # for both ``Published`` and ``Draft`` records it is assumed
-            # that the permission verification is done in a specialized
-            # constrained component. This is done because this verification
-            # is combined with other properties of the record.
-            resource_obj = self._read_record(identity, resource_id, allow_draft=True)
+            resource_obj = resources_obj[resource_id]
 
             # defining the relation type of the component with the package:
             #   - ``related``: It can't be loaded as a draft (it is out of package context);
@@ -316,15 +358,15 @@ class GEOPackageRecordService(BaseRelatedRecordsSearchService):
         # 2. Checking all resources can be published
         # We validate only the ``Managed`` resource once we
         # need to publish them with the package itself.
-        package_resources = package_draft.relationship.resources
+        package_resources = package_draft.relationship.resources.resolve_all(
+            raise_error=True
+        )
 
-        for package_resource in package_resources:
+        for package_resource_obj in package_resources:
             # Checking the resource
             # here, we are using an internal method from the `record service`.
             # This maybe is not a good approach. Is the future, we can return
             # to this implementation and evaluate if this is the best solution.
-            package_resource_obj = package_resource.resolve()
-
             if package_resource_obj.is_draft:
                 try:
                     current_rdm_records_service._validate_draft(
@@ -370,19 +412,67 @@ class GEOPackageRecordService(BaseRelatedRecordsSearchService):
             expand=expand,
         )
 
-    def _publish_resource(self, identity, package, resource_draft, uow, expand):
-        """Publish a package resource."""
-        if resource_draft.is_draft:
-            # Avoiding errors with ``Related`` and ``Managed`` resources.
-            record_manager = get_context_manager(resource_draft)
-            record_manager_id = record_manager.get("id")
+    def _select_managed_drafts(self, package, resources):
+        """Select the package resources that must be published with it."""
+        return [
+            resource
+            for resource in resources
+            if resource.is_draft
+            and get_context_manager(resource).get("id") == package.parent["id"]
+        ]
 
-            if record_manager_id == package.parent["id"]:
-                resource_pid = resource_draft.pid.pid_value
+    def _publish_resources(self, identity, package, resources, uow):
+        """Publish the ``Managed`` resources of a package in a single pass.
 
-                return current_rdm_records_service.publish(
-                    identity, resource_pid, uow=uow, expand=expand
-                )
+        This is a batched version of the ``current_rdm_records_service.publish``,
+        running the same steps (permission check, ``publish`` components, commit
+        and removal of the draft) for each resource. The draft resources are
+        validated by ``_validate_draft_package`` (with the same ``_validate_draft``
+        used by ``current_rdm_records_service.publish``) before the package is
+        published, so they aren't validated again. Also, all resources are indexed
+        using a single bulk operation.
+        """
+        service = current_rdm_records_service
+
+        resources_drafts = self._select_managed_drafts(package, resources)
+
+        if not resources_drafts:
+            return []
+
+        bulk_index_op = RecordBulkIndexOp(service.indexer)
+
+        records = []
+        latest_ids = []
+
+        for resource_draft in resources_drafts:
+            service.require_permission(identity, "publish", record=resource_draft)
+
+            latest_id = resource_draft.versions.latest_id
+            record = service.record_cls.publish(resource_draft)
+
+            service.run_components(
+                "publish", identity, draft=resource_draft, record=record, uow=uow
+            )
+
+            # commit only: indexing is done by the bulk operation
+            uow.register(RecordCommitOp(record))
+            uow.register(RecordDeleteOp(resource_draft, force=False))
+
+            bulk_index_op.index(record)
+            bulk_index_op.delete(resource_draft)
+
+            records.append(record)
+
+            if latest_id:
+                latest_ids.append(latest_id)
+
+        # reindexing the previous versions (``is_latest`` flag)
+        for latest_record in service.record_cls.get_records(latest_ids):
+            bulk_index_op.index(latest_record)
+
+        uow.register(bulk_index_op)
+
+        return records
 
     #
     # High-level Packages API.
@@ -407,6 +497,7 @@ class GEOPackageRecordService(BaseRelatedRecordsSearchService):
             identity, id_, data, action, uow, revision_id, expand
         )
 
+    @records_identity_map()
     @unit_of_work()
     def publish(self, identity, id_, uow=None, expand=False):
         """Publish a draft."""
@@ -421,13 +512,10 @@ class GEOPackageRecordService(BaseRelatedRecordsSearchService):
         # 2. publishing the package
         published_package = self._publish_package(identity, draft, uow, expand)
 
-        # 3. publish the resources
-        package_resources = draft.relationship.resources
+        # 3. publish the resources (reusing the resources loaded in the validation)
+        package_resources = draft.relationship.resources.resolve_all(raise_error=True)
 
-        for package_resource in package_resources:
-            self._publish_resource(
-                identity, draft, package_resource.resolve(), uow, expand
-            )
+        self._publish_resources(identity, draft, package_resources, uow)
 
         # 4. returning the projection of the published record.
         return published_package
@@ -522,6 +610,7 @@ class GEOPackageRecordService(BaseRelatedRecordsSearchService):
         #       visualize the content updated.
         return True
 
+    @records_identity_map()
     def validate_package(self, identity, id_):
         """Validate if package is ready to be published."""
         package_draft = self.draft_cls.pid.resolve(id_, registered_only=False)
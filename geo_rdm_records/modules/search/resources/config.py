@@ -7,6 +7,7 @@
 
 """GEO RDM Records Search resources configuration."""
 
+from geo_rdm_records.base.resources.args import GEOCursorSearchRequestArgsSchema
 from geo_rdm_records.base.resources.config import BaseGEOResourceConfig
 
 
@@ -22,3 +23,6 @@ class SearchRecordResourceConfig(BaseGEOResourceConfig):
         "user-prefix": "/user",
         "community-records": "/communities/<pid_value>/search",
     }
+
+    # Search arguments (with cursor-based pagination)
+    request_search_args = GEOCursorSearchRequestArgsSchema
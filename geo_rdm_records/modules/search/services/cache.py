@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Geo Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""GEO RDM Records Search result cache."""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from pydash import py_
+
+
+def _hash(value):
+    """Create a stable hash of a JSON-serializable value."""
+    value = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def normalize_params(params):
+    """Normalize the search parameters (used to create the cache keys).
+
+    Args:
+        params (dict): Search parameters.
+
+    Returns:
+        dict: Parameters without empty values and with sorted facets values.
+    """
+    normalized = {}
+
+    for key, value in params.items():
+        if value in (None, "", [], {}):
+            continue
+
+        if key == "q":
+            value = " ".join(str(value).split())
+
+        elif key == "facets":
+            value = {facet: sorted(values) for facet, values in value.items() if values}
+
+        normalized[key] = value
+
+    return normalized
+
+
+#
+# Backends
+#
+class LocalCacheBackend:
+    """In-memory (per process) LRU cache backend."""
+
+    def __init__(self, max_entries=1024):
+        """Initializer.
+
+        Args:
+            max_entries (int): Maximum number of entries stored.
+        """
+        self._max_entries = max_entries
+
+        self._entries = OrderedDict()
+        self._generation = (0, 0.0)
+
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Get a value (``None`` if it doesn't exist or is expired)."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+        # values are stored serialized: each reader gets its own copy.
+        return json.loads(value)
+
+    def set(self, key, value, ttl):
+        """Store a value for ``ttl`` seconds."""
+        value = json.dumps(value, default=str)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def generation(self):
+        """Get the current generation and its creation time."""
+        return self._generation
+
+    def next_generation(self):
+        """Create a new generation (old entries are no longer used)."""
+        with self._lock:
+            self._generation = (self._generation[0] + 1, time.time())
+            self._entries.clear()
+
+
+class RedisCacheBackend:
+    """Redis cache backend (shared by all processes)."""
+
+    def __init__(self, url, prefix="geo_rdm_records:search"):
+        """Initializer.
+
+        Args:
+            url (str): Redis URL.
+
+            prefix (str): Prefix of the keys.
+        """
+        import redis
+
+        self._client = redis.StrictRedis.from_url(url)
+
+        self._prefix = prefix
+        self._generation_key = f"{prefix}:generation"
+
+    def get(self, key):
+        """Get a value (``None`` if it doesn't exist or is expired)."""
+        value = self._client.get(f"{self._prefix}:{key}")
+
+        return json.loads(value) if value is not None else None
+
+    def set(self, key, value, ttl):
+        """Store a value for ``ttl`` seconds."""
+        self._client.set(
+            f"{self._prefix}:{key}", json.dumps(value, default=str), ex=int(ttl)
+        )
+
+    def generation(self):
+        """Get the current generation and its creation time."""
+        generation = self._client.hgetall(self._generation_key)
+
+        return (
+            int(generation.get(b"id", 0)),
+            float(generation.get(b"created", 0.0)),
+        )
+
+    def next_generation(self):
+        """Create a new generation (old entries are no longer used and expire)."""
+        pipeline = self._client.pipeline()
+
+        pipeline.hincrby(self._generation_key, "id", 1)
+        pipeline.hset(self._generation_key, "created", time.time())
+
+        pipeline.execute()
+
+
+#
+# Cache
+#
+class SearchResultCache:
+    """Cache of the serialized search results.
+
+    Entries are stored with a TTL and are indexed by the normalized search
+    parameters and the fingerprint of the permission filter used in the search.
+    Each time a published record is indexed, a new generation of the cache is
+    created, so the entries created before it are no longer used. To avoid
+    caching results from indices not refreshed yet, no entry is stored in the
+    first ``refresh_interval`` seconds of a generation.
+
+    Note:
+        With the ``local`` backend, each process has its own generation: only
+        the cache of the process that indexed the record is invalidated. The
+        other processes may return outdated results until their entries expire
+        (``ttl``). The ``redis`` backend shares the generation between processes.
+    """
+
+    default_config = dict(ttl=60, refresh_interval=1, max_entries=1024)
+    """Default cache configuration (times in seconds)."""
+
+    def __init__(self, backend, config=None, record_types=()):
+        """Initializer.
+
+        Args:
+            backend (Union[LocalCacheBackend, RedisCacheBackend]): Cache backend.
+
+            config (dict): Cache configuration (see ``default_config``).
+
+            record_types (tuple): Classes of the published records available in the
+                                  cached searches (see ``invalidate_record``).
+        """
+        self._backend = backend
+        self._config = {**self.default_config, **(config or {})}
+        self._record_types = tuple(record_types)
+
+    def key(self, params, fingerprint):
+        """Create the key of a search.
+
+        Args:
+            params (dict): Search parameters.
+
+            fingerprint (str): Fingerprint of the permission filter used in the search.
+
+        Returns:
+            str: Cache key.
+        """
+        generation, _ = self._backend.generation()
+
+        return _hash(
+            dict(
+                params=normalize_params(params),
+                fingerprint=fingerprint,
+                generation=generation,
+            )
+        )
+
+    def get(self, key):
+        """Get a search result (``None`` if not cached)."""
+        return self._backend.get(key)
+
+    def set(self, key, value):
+        """Store a search result (ignored while the indices may not be refreshed)."""
+        _, created = self._backend.generation()
+
+        if time.time() - created >= self._config["refresh_interval"]:
+            self._backend.set(key, value, self._config["ttl"])
+
+    def invalidate(self, *args, **kwargs):
+        """Invalidate all entries."""
+        self._backend.next_generation()
+
+    def invalidate_record(self, sender, record=None, **kwargs):
+        """Invalidate all entries when a published record is indexed.
+
+        This method is a receiver of the ``before_record_index`` signal. Drafts
+        and records not available in the searches don't invalidate the cache.
+        """
+        if isinstance(record, self._record_types):
+            self.invalidate()
+
+
+def create_search_cache(config, record_types=()):
+    """Create a search result cache.
+
+    Args:
+        config (dict): Cache configuration (``enabled``, ``backend``, ``redis_url``,
+                       ``ttl``, ``refresh_interval`` and ``max_entries``).
+
+        record_types (tuple): Classes of the published records available in the
+                              cached searches.
+
+    Returns:
+        SearchResultCache: Search result cache or ``None`` if it is not enabled.
+    """
+    config = config or {}
+
+    if not config.get("enabled"):
+        return None
+
+    backend_type = config.get("backend", "local")
+
+    if backend_type == "redis":
+        backend = RedisCacheBackend(config["redis_url"])
+
+    elif backend_type == "local":
+        backend = LocalCacheBackend(
+            config.get("max_entries", SearchResultCache.default_config["max_entries"])
+        )
+
+    else:
+        raise ValueError(f"Invalid search cache backend: {backend_type}")
+
+    return SearchResultCache(
+        backend,
+        py_.omit(config, "enabled", "backend", "redis_url"),
+        record_types,
+    )
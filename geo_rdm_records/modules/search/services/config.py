@@ -14,12 +14,22 @@ from invenio_rdm_records.services.config import (
     is_record_and_has_doi,
 )
 from invenio_records_resources.services import ConditionalLink, pagination_links
-from invenio_records_resources.services.base.config import FromConfig
+from invenio_records_resources.services.base.config import (
+    FromConfig,
+    FromConfigSearchOptions,
+)
 from invenio_records_resources.services.base.links import Link
 from invenio_records_resources.services.records.links import RecordLink
 
-from geo_rdm_records.base.services.config import BaseGEOServiceConfig
-from geo_rdm_records.base.services.links import LinksRegistryType
+from geo_rdm_records.base.services.config import (
+    BaseGEOServiceConfig,
+    GEOCursorSearchDraftsOptions,
+    GEOCursorSearchOptions,
+)
+from geo_rdm_records.base.services.links import (
+    LinksRegistryType,
+    cursor_pagination_links,
+)
 from geo_rdm_records.base.services.permissions import BaseGEOPermissionPolicy
 from geo_rdm_records.base.services.results import MutableRecordList, ResultRegistryType
 from geo_rdm_records.base.services.schemas import ParentSchema
@@ -55,6 +65,20 @@ class SearchRecordServiceConfig(BaseGEOServiceConfig):
         GEOMarketplaceItemDraft.index.search_alias,
     ]
 
+    # Search configuration (with cursor-based pagination)
+    search = FromConfigSearchOptions(
+        "RDM_SEARCH",
+        "RDM_SORT_OPTIONS",
+        "RDM_FACETS",
+        search_option_cls=GEOCursorSearchOptions,
+    )
+    search_drafts = FromConfigSearchOptions(
+        "RDM_SEARCH_DRAFTS",
+        "RDM_SORT_OPTIONS",
+        "RDM_FACETS",
+        search_option_cls=GEOCursorSearchDraftsOptions,
+    )
+
     # Schemas
     schema = GEORecordSchema
     schema_parent = ParentSchema
@@ -148,3 +172,12 @@ class SearchRecordServiceConfig(BaseGEOServiceConfig):
     links_search_community_records = pagination_links(
         "{+api}/communities/{id}/search{?args*}"
     )
+
+    # Cursor-based pagination (``cursor`` parameter)
+    links_search_cursor = cursor_pagination_links("{+api}/search{?args*}")
+
+    links_search_drafts_cursor = cursor_pagination_links("{+api}/user/search{?args*}")
+
+    links_search_community_records_cursor = cursor_pagination_links(
+        "{+api}/communities/{id}/search{?args*}"
+    )
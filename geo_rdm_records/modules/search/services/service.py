@@ -7,16 +7,78 @@
 
 """GEO RDM Records Services."""
 
+import hashlib
+import json
+
+from flask_principal import AnonymousIdentity
+from invenio_access.permissions import any_user
+from invenio_records_permissions.api import permission_filter
 from invenio_records_resources.services import LinksTemplate
 from invenio_search.engine import dsl
 
 from geo_rdm_records.base.services.links import MutableLinksTemplate
+from geo_rdm_records.base.services.results import CachedRecordList
 from geo_rdm_records.base.services.search import BaseSearchMultiIndexService
 
 
+def _anonymous_identity():
+    """Create an identity with public access only."""
+    identity = AnonymousIdentity()
+    identity.provides.add(any_user)
+
+    return identity
+
+
 class SearchRecordService(BaseSearchMultiIndexService):
     """Search record specialized service."""
 
+    def __init__(self, config, cache=None, **kwargs):
+        """Initializer.
+
+        Args:
+            config (SearchRecordServiceConfig): Service configuration.
+
+            cache (SearchResultCache): Cache of the public search results. If ``None``,
+                                       the results are not cached.
+        """
+        super().__init__(config, **kwargs)
+
+        self._cache = cache
+
+    #
+    # Auxiliary methods
+    #
+    def _public_search_fingerprint(self, identity):
+        """Get the fingerprint of the permission filter of a public-only identity.
+
+        Returns:
+            str: Fingerprint of the identity permission filter or ``None`` if the
+                 identity can access more than the public content.
+        """
+        identity_filter, public_filter = [
+            permission_filter(
+                self.permission_policy(action_name="read", identity=identity_)
+            )
+            for identity_ in (identity, _anonymous_identity())
+        ]
+
+        if identity_filter != public_filter:
+            return None
+
+        identity_filter = json.dumps(identity_filter.to_dict(), sort_keys=True)
+        return hashlib.sha256(identity_filter.encode("utf-8")).hexdigest()
+
+    def _links_search_tpl(self, links, links_cursor, params, **context):
+        """Create the links template of a search.
+
+        In the cursor mode, the cursor links (``self`` and ``next``) are used.
+        """
+        if params.get("cursor") is not None:
+            links = links_cursor
+            params = {key: value for key, value in params.items() if key != "page"}
+
+        return LinksTemplate(links, context={"args": params, **context})
+
     #
     # Properties
     #
@@ -51,8 +113,26 @@ class SearchRecordService(BaseSearchMultiIndexService):
         """Search for records matching the querystring."""
         self.require_permission(identity, "search")
 
-        # Prepare and execute the search
         params = params or {}
+
+        # Public searches can be loaded from the cache
+        cache_key = None
+
+        # (cursors aren't cached: they are bound to a point in time)
+        if self._cache is not None and params.get("cursor") is None:
+            fingerprint = self._public_search_fingerprint(identity)
+
+            if fingerprint is not None:
+                cache_key = self._cache.key(
+                    {**params, **kwargs, "expand": expand}, fingerprint
+                )
+
+                cached_result = self._cache.get(cache_key)
+
+                if cached_result is not None:
+                    return CachedRecordList(cached_result)
+
+        # Prepare and execute the search
         search = self._search(
             "search",
             identity,
@@ -61,19 +141,29 @@ class SearchRecordService(BaseSearchMultiIndexService):
             indices=self.indices,
             **kwargs,
         )
-        search_result = search.execute()
+        search_result = self._execute_search(search, params)
 
-        return self.result_list(
+        result = self.result_list(
             self,
             identity,
             search_result,
             params,
-            links_tpl=LinksTemplate(self.config.links_search, context={"args": params}),
+            links_tpl=self._links_search_tpl(
+                self.config.links_search, self.config.links_search_cursor, params
+            ),
             links_item_tpl=self.links_item_tpl,
             expandable_fields=self.expandable_fields,
             expand=expand,
         )
 
+        if cache_key is not None:
+            result = result.to_dict()
+            self._cache.set(cache_key, result)
+
+            result = CachedRecordList(result)
+
+        return result
+
     def search_drafts(
         self, identity, params=None, search_preference=None, expand=False, **kwargs
     ):
@@ -83,7 +173,7 @@ class SearchRecordService(BaseSearchMultiIndexService):
         # Prepare and execute the search
         params = params or {}
 
-        search_result = self._search(
+        search = self._search(
             "search_drafts",
             identity,
             params,
@@ -97,15 +187,18 @@ class SearchRecordService(BaseSearchMultiIndexService):
             permission_action="read_draft",
             indices=self.indices_draft,
             **kwargs,
-        ).execute()
+        )
+        search_result = self._execute_search(search, params)
 
         return self.result_list(
             self,
             identity,
             search_result,
             params,
-            links_tpl=LinksTemplate(
-                self.config.links_search_drafts, context={"args": params}
+            links_tpl=self._links_search_tpl(
+                self.config.links_search_drafts,
+                self.config.links_search_drafts_cursor,
+                params,
             ),
             links_item_tpl=self.links_item_tpl,
             expandable_fields=self.expandable_fields,
@@ -121,7 +214,7 @@ class SearchRecordService(BaseSearchMultiIndexService):
         # Prepare and execute the search
         params = params or {}
 
-        search_result = self._search(
+        search = self._search(
             "search",
             identity,
             params,
@@ -130,20 +223,21 @@ class SearchRecordService(BaseSearchMultiIndexService):
             extra_filter=dsl.Q("term", **{"parent.communities.ids": str(community_id)}),
             permission_action="read",
             indices=self.indices,
+            track_total_hits=self.track_total_hits("search_community_records"),
             **kwargs,
-        ).execute()
+        )
+        search_result = self._execute_search(search, params)
 
         return self.result_list(
             self,
             identity,
             search_result,
             params,
-            links_tpl=LinksTemplate(
+            links_tpl=self._links_search_tpl(
                 self.config.links_search_community_records,
-                context={
-                    "args": params,
-                    "id": community_id,
-                },
+                self.config.links_search_community_records_cursor,
+                params,
+                id=community_id,
             ),
             links_item_tpl=self.links_item_tpl,
         )
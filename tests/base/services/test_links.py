@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Geo Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the mutable links templates."""
+
+from invenio_records_resources.services.base.links import (
+    ConditionalLink,
+    Link,
+    LinksTemplate,
+)
+
+from geo_rdm_records.base.services.links import CompiledLink, MutableLinksTemplate
+
+
+class FakeRecord:
+    """Record with the values used by the links."""
+
+    def __init__(self, id_, is_draft):
+        """Initializer."""
+        self.id = id_
+        self.is_draft = is_draft
+
+
+class FakeTypesRegistry:
+    """Registry with a single type."""
+
+    @classmethod
+    def guess_type(cls, obj, error=True):
+        """Guess object type."""
+        return "records"
+
+
+class IdLink(Link):
+    """Link with the record id (as the ``RecordLink``)."""
+
+    @staticmethod
+    def vars(record, vars):
+        """Variables for the URI template."""
+        vars.update({"id": record.id})
+
+
+class PublicLink:
+    """Link implementing only the public methods."""
+
+    def should_render(self, obj, ctx):
+        """Determine if the link should be rendered."""
+        return not obj.is_draft
+
+    def expand(self, obj, ctx):
+        """Expand the link."""
+        return f"{ctx['api']}/public/{obj.id}"
+
+
+LINKS = {
+    "self": ConditionalLink(
+        cond=lambda record, ctx: record.is_draft,
+        if_=IdLink("{+api}/{entity}/{id}/draft"),
+        else_=IdLink("{+api}/{entity}/{id}"),
+    ),
+    "latest": IdLink("{+api}/{entity}/{id}/versions/latest", when=lambda r, c: True),
+    "publish": IdLink(
+        "{+api}/{entity}/{id}/draft/actions/publish",
+        when=lambda record, ctx: record.is_draft,
+    ),
+    "public": PublicLink(),
+}
+
+
+def test_expand_many():
+    """Test that the batched expansion is the same of the default templates."""
+    records = [FakeRecord(f"record-{idx}", idx % 2 == 0) for idx in range(4)]
+
+    template = MutableLinksTemplate(LINKS, FakeTypesRegistry, context=dict(api="/api"))
+    default_template = LinksTemplate(LINKS, context=dict(api="/api", entity="records"))
+
+    assert template.expand_many(None, records) == [
+        default_template.expand(None, record) for record in records
+    ]
+    assert template.expand(None, records[0]) == {
+        "self": "/api/records/record-0/draft",
+        "latest": "/api/records/record-0/versions/latest",
+        "publish": "/api/records/record-0/draft/actions/publish",
+    }
+
+
+def test_compiled_link_fallback():
+    """Test the links expanded with their public methods."""
+    record = FakeRecord("record-1", False)
+
+    # links without the compiled attributes
+    link = IdLink("{+api}/records/{id}")
+    del link._uritemplate
+
+    link.expand = lambda obj, ctx: f"{ctx['api']}/custom/{obj.id}"
+
+    assert CompiledLink(link).expand(record, dict(api="/api")) == (
+        "/api/custom/record-1"
+    )
+    assert CompiledLink(PublicLink()).expand(record, dict(api="/api")) == (
+        "/api/public/record-1"
+    )
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Geo Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the mutable search results."""
+
+import pytest
+
+from geo_rdm_records.base.records.types import GEORecordTypes
+from geo_rdm_records.base.services.results import (
+    MutableRecordList,
+    ResultRegistryType,
+)
+from geo_rdm_records.modules.packages.records.api import (
+    GEOPackageDraft,
+    GEOPackageRecord,
+)
+from geo_rdm_records.modules.rdm.records.api import GEORecord
+
+
+class FakeHits(list):
+    """Hits of a search result."""
+
+    def __init__(self, hits, total=None):
+        """Initializer."""
+        super().__init__(hits)
+
+        if total is not None:
+            self.total = total
+
+
+class FakeResults:
+    """Search result."""
+
+    def __init__(self, hits):
+        """Initializer."""
+        self.hits = hits
+
+
+def _record_list(hits, total, params):
+    """Create a result with ``hits`` hits in the page."""
+    return MutableRecordList(
+        None,
+        None,
+        FakeResults(FakeHits(range(hits), total)),
+        params=params,
+        schema=object(),
+    )
+
+
+@pytest.mark.parametrize(
+    "hits,total,params,expected",
+    [
+        # exact total
+        (10, dict(value=25, relation="eq"), dict(page=1, size=10), (25, True, True)),
+        (5, dict(value=25, relation="eq"), dict(page=3, size=10), (25, True, False)),
+        # total capped: the pages are full while there are more hits
+        (10, dict(value=10, relation="gte"), dict(page=3, size=10), (30, False, True)),
+        (4, dict(value=10, relation="gte"), dict(page=3, size=10), (24, False, False)),
+        # total not tracked
+        (10, None, dict(page=2, size=10), (20, False, True)),
+        # page not defined (first page)
+        (10, None, dict(size=10), (10, False, True)),
+    ],
+)
+def test_mutable_record_list_total(hits, total, params, expected):
+    """Test the totals and the pagination without the exact hits count."""
+    result = _record_list(hits, total, params)
+
+    assert (result.total, result.is_total_exact, result.pagination.has_next) == (
+        expected
+    )
+
+
+@pytest.mark.parametrize(
+    "obj,expected",
+    [
+        # type defined by the ``parent.type``
+        (dict(parent=dict(type=GEORecordTypes.package)), GEOPackageDraft),
+        (
+            dict(parent=dict(type=GEORecordTypes.package), is_published=True),
+            GEOPackageRecord,
+        ),
+        # documents without the ``parent.type`` use the ``$schema``
+        (
+            {
+                "$schema": "local://records/geordmrecords-records-record-v1.0.0.json",
+                "is_published": True,
+            },
+            GEORecord,
+        ),
+    ],
+)
+def test_result_registry_type(obj, expected):
+    """Test the class of the hits defined by their type."""
+    assert ResultRegistryType.guess_class(obj) is expected
+
+
+def test_result_registry_type_not_supported():
+    """Test the hits with types not supported."""
+    assert ResultRegistryType.guess_class(dict(parent={}), error=False) is None
+
+    with pytest.raises(RuntimeError):
+        ResultRegistryType.guess_class({"$schema": "local://users/user-v1.0.0.json"})
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Geo Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the search params interpreters."""
+
+import pytest
+from invenio_records_resources.services.errors import QuerystringValidationError
+from invenio_search.engine import dsl
+
+from geo_rdm_records.base.services.params import (
+    CursorParam,
+    TrackTotalHitsParam,
+    decode_cursor,
+    encode_cursor,
+)
+from geo_rdm_records.base.services.params import search as search_params
+from geo_rdm_records.base.services.params.search import (
+    clamp_track_total_hits,
+    parse_track_total_hits,
+)
+
+
+@pytest.mark.parametrize(
+    "value,expected", [("true", True), ("False", False), ("1000", 1000), (50, 50)]
+)
+def test_parse_track_total_hits(value, expected):
+    """Test the hits tracking policies parsed from the query string."""
+    assert parse_track_total_hits(value) == expected
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "all"])
+def test_parse_track_total_hits_invalid(value):
+    """Test the invalid hits tracking policies."""
+    with pytest.raises(QuerystringValidationError):
+        parse_track_total_hits(value)
+
+
+@pytest.mark.parametrize(
+    "value,maximum,expected",
+    [
+        (True, True, True),
+        (500, True, 500),
+        (True, 10000, 10000),
+        (500, 10000, 500),
+        (20000, 10000, 10000),
+        (False, 10000, False),
+        (True, False, False),
+        (500, False, False),
+    ],
+)
+def test_clamp_track_total_hits(value, maximum, expected):
+    """Test the hits tracking requested limited by the endpoint policy."""
+    result = clamp_track_total_hits(value, maximum)
+
+    assert result == expected and type(result) == type(expected)
+
+
+def test_track_total_hits_param():
+    """Test the request parameter limited by the endpoint policy."""
+    interpreter = TrackTotalHitsParam(None)
+    search = dsl.Search().extra(track_total_hits=10000)
+
+    def _apply(params):
+        return interpreter.apply(None, search, params).to_dict().get("track_total_hits")
+
+    assert _apply({}) == 10000
+    assert _apply(dict(track_total_hits="true")) == 10000
+    assert _apply(dict(track_total_hits="100")) == 100
+    assert _apply(dict(track_total_hits="false")) is False
+
+
+def test_decode_cursor():
+    """Test the cursor tokens read back (and the invalid ones)."""
+    assert decode_cursor(encode_cursor("pit-1", [1.5, "a"])) == ("pit-1", [1.5, "a"])
+
+    invalid_cursors = [
+        "not-a-cursor",
+        encode_cursor(None, [1]),  # only ``*`` opens a new PIT
+        encode_cursor("", [1]),
+        encode_cursor("pit-1", "a"),
+    ]
+
+    for cursor in invalid_cursors:
+        with pytest.raises(QuerystringValidationError):
+            decode_cursor(cursor)
+
+
+def test_cursor_param(app, monkeypatch):
+    """Test the PIT opened only by the first cursor of a walk."""
+    opened = []
+
+    class FakeClient:
+        def create_point_in_time(self, index, keep_alive):
+            opened.append(index)
+            return dict(pit_id="pit-1")
+
+    monkeypatch.setattr(search_params, "current_search_client", FakeClient())
+
+    interpreter = CursorParam(None)
+    search = dsl.Search(index=["records", "packages"]).sort("-created")
+
+    # 1. First page
+    first_page = interpreter.apply(None, search, dict(cursor="*", size=10)).to_dict()
+
+    assert opened == ["records,packages"]
+    assert first_page["pit"]["id"] == "pit-1"
+    assert first_page["size"] == 10 and "search_after" not in first_page
+
+    # 2. Next page (with the same PIT)
+    next_page = interpreter.apply(
+        None, search, dict(cursor=encode_cursor("pit-1", [1, "a"]), size=10)
+    ).to_dict()
+
+    assert opened == ["records,packages"]
+    assert next_page["pit"]["id"] == "pit-1"
+    assert next_page["search_after"] == [1, "a"]
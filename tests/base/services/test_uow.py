@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Geo Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the unit of work operations."""
+
+import uuid
+
+from geo_rdm_records.base.services import uow as uow_module
+from geo_rdm_records.base.services.uow import RecordBulkIndexOp
+
+
+class FakeRecord:
+    """Record stored in an index."""
+
+    def __init__(self, id_, index, revision_id=1):
+        """Initializer."""
+        self.id = id_
+        self.index = index
+        self.revision_id = revision_id
+
+
+class FakeIndexer:
+    """Indexer selecting the index from the record."""
+
+    _version_type = "external_gte"
+
+    def record_to_index(self, record):
+        """Get the index of a record."""
+        return record.index
+
+    def _prepare_record(self, record, index):
+        """Prepare the document of a record."""
+        return {"id": str(record.id), "index": index}
+
+
+def test_record_bulk_index_op(app, monkeypatch):
+    """Test that a record and its draft (same id) are handled independently."""
+    requests = []
+
+    monkeypatch.setattr(
+        uow_module.search.helpers,
+        "bulk",
+        lambda client, actions, **kwargs: requests.append(list(actions)) or (0, []),
+    )
+
+    id_ = uuid.uuid4()
+
+    draft = FakeRecord(id_, "rdmrecords-drafts")
+    record = FakeRecord(id_, "rdmrecords-records", revision_id=2)
+    previous_version = FakeRecord(uuid.uuid4(), "rdmrecords-records")
+
+    operation = RecordBulkIndexOp(FakeIndexer())
+
+    operation.index(draft)
+    operation.index(record)
+    operation.index(previous_version)
+    operation.delete(draft)
+
+    operation.on_commit(None)
+
+    (actions,) = requests
+
+    # the draft removal doesn't cancel the record indexing (and is sent first)
+    assert [(action["_op_type"], action["_id"]) for action in actions] == [
+        ("delete", str(id_)),
+        ("index", str(id_)),
+        ("index", str(previous_version.id)),
+    ]
+    assert actions[0]["_index"].endswith("rdmrecords-drafts")
+    assert actions[1]["_index"].endswith("rdmrecords-records")
+    assert actions[1]["_version"] == 2
+    assert actions[1]["_source"] == {"id": str(id_), "index": "rdmrecords-records"}
+
+
+def test_record_bulk_index_op_without_records(monkeypatch):
+    """Test that no request is sent without records."""
+    requests = []
+
+    monkeypatch.setattr(
+        uow_module.search.helpers,
+        "bulk",
+        lambda client, actions, **kwargs: requests.append(actions) or (0, []),
+    )
+
+    RecordBulkIndexOp(FakeIndexer()).on_commit(None)
+
+    assert requests == []
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the checkers runs (shards and checkpoints)."""
+
+import json
+import re
+from datetime import datetime, timedelta
+
+import pytest
+
+from geo_rdm_records.modules.checker.base import checkpoint
+from geo_rdm_records.modules.checker.base.records import OWNER_FIELD
+from geo_rdm_records.modules.checker.models import GEOCheckerLock
+
+
+def _matches(query, value):
+    """Evaluate a (bool, regexp and range) query over a keyword value."""
+    ((type_, body),) = query.items()
+
+    if type_ == "bool":
+        must = all(_matches(item, value) for item in body.get("must", []))
+        should = [_matches(item, value) for item in body.get("should", [])]
+
+        return must and (not should or any(should))
+
+    condition = body[OWNER_FIELD]
+
+    if type_ == "regexp":
+        return re.fullmatch(condition, value) is not None
+
+    if type_ == "range":
+        return ("gte" not in condition or value >= condition["gte"]) and (
+            "lte" not in condition or value <= condition["lte"]
+        )
+
+    raise ValueError(type_)
+
+
+@pytest.mark.parametrize(
+    "first_owner,last_owner",
+    [(None, None), (None, 9), (None, 120), (5, 1200), (99, 100), (10, None)],
+)
+def test_owners_filter(first_owner, last_owner):
+    """Test that the owners filter compares the keyword IDs as numbers."""
+    query = checkpoint._owners_filter(first_owner, last_owner).to_dict()
+
+    for owner in range(0, 3000):
+        expected = (first_owner is None or owner >= first_owner) and (
+            last_owner is None or owner <= last_owner
+        )
+
+        assert _matches(query, str(owner)) == expected, owner
+
+
+def test_merge_stats():
+    """Test the statistics of many shards merged."""
+    assert checkpoint._merge_stats(
+        [
+            dict(owners=1, metrics=dict(phases=dict(search=1.5))),
+            None,
+            dict(owners=2, metrics=dict(phases=dict(search=0.5, mail=1))),
+        ]
+    ) == dict(owners=3, metrics=dict(phases=dict(search=2.0, mail=1)))
+
+
+def test_checker_run(running_app, db, tmp_path):
+    """Test a checker run processed in shards (with checkpoints)."""
+    run = checkpoint.start_run("links", shards=1, run_timeout=60)
+
+    assert checkpoint.pending_shards(run, shard_timeout=60) == [0]
+
+    # 1. A started shard is pending only after its timeout
+    checkpoint.start_shard(run.id, 0)
+
+    assert checkpoint.pending_shards(run, shard_timeout=60) == []
+    assert checkpoint.pending_shards(run, shard_timeout=-1) == [0]
+
+    # 2. The run is resumed while it is not completed
+    assert checkpoint.start_run("links", shards=1, run_timeout=60).id == run.id
+
+    checkpoint.finish_shard(run.id, 0, dict(owners=2))
+
+    stats = checkpoint.finish_run(run.id, output_dir=str(tmp_path))
+
+    assert stats == dict(owners=2)
+    assert json.loads((tmp_path / f"links-{run.id}.json").read_text())["stats"] == (
+        stats
+    )
+
+    # 3. Completed runs are not resumed
+    assert checkpoint.start_run("links", shards=1, run_timeout=60).id != run.id
+
+
+def test_checker_run_timeout(running_app, db):
+    """Test that stale runs are not resumed."""
+    run = checkpoint.start_run("outdated", shards=1, run_timeout=60)
+
+    run.created = datetime.utcnow() - timedelta(seconds=120)
+    db.session.commit()
+
+    new_run = checkpoint.start_run("outdated", shards=1, run_timeout=60)
+
+    assert new_run.id != run.id
+    assert checkpoint.start_run("outdated", shards=1, run_timeout=60).id == new_run.id
+
+
+def test_checker_run_after_completed_run(running_app, db):
+    """Test that dispatches after a completed run share the same new run."""
+    run = checkpoint.start_run("links", shards=1, run_timeout=60)
+
+    checkpoint.finish_shard(run.id, 0, dict(owners=1))
+    checkpoint.finish_run(run.id)
+
+    new_run = checkpoint.start_run("links", shards=1, run_timeout=60)
+
+    assert new_run.id != run.id
+    assert checkpoint.start_run("links", shards=1, run_timeout=60).id == new_run.id
+
+    # the runs of the checker are serialized by a single lock row
+    assert GEOCheckerLock.query.filter_by(checker="links").count() == 1
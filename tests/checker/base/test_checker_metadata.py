@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the metadata cache of the checkers."""
+
+from geo_rdm_records.base.records.types import GEORecordTypes
+from geo_rdm_records.modules.checker.base import metadata as checker_metadata
+
+
+def test_index_records_metadata():
+    """Test the metadata indexed by the record ID."""
+    assert checker_metadata.index_records_metadata(
+        dict(packages=[{"id": "a"}], resources=[{"id": "b"}, {"id": "c"}])
+    ) == dict(
+        packages={"a": {"id": "a"}},
+        resources={"b": {"id": "b"}, "c": {"id": "c"}},
+    )
+
+
+def test_load_records_metadata(monkeypatch):
+    """Test that only the missing records are read, in a single batch."""
+    calls = []
+
+    def _get_records_by_ids(service, ids):
+        calls.append(ids)
+        return [{"id": id_, "loaded": True} for id_ in ids]
+
+    monkeypatch.setattr(checker_metadata, "get_records_by_ids", _get_records_by_ids)
+
+    cache = {"a": {"id": "a"}}
+
+    checker_metadata.load_records_metadata(
+        ["a", "b", "c", "b"], cache, GEORecordTypes.resource
+    )
+
+    assert calls == [["b", "c"]]
+    assert cache == {
+        "a": {"id": "a"},
+        "b": {"id": "b", "loaded": True},
+        "c": {"id": "c", "loaded": True},
+    }
+
+    # everything is cached: no search is made
+    checker_metadata.load_records_metadata(["a", "c"], cache, GEORecordTypes.resource)
+
+    assert len(calls) == 1
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the metrics of the checkers runs."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from geo_rdm_records.modules.checker.base.metrics import RunMetrics
+
+
+def test_run_metrics_counters_and_hosts():
+    """Test the counters and the hosts latency histograms."""
+    metrics = RunMetrics("links")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: metrics.incr("urls"), range(100)))
+
+    metrics.incr("cache_hits", 0)
+
+    metrics.observe_host("a.org", 0.05)
+    metrics.observe_host("a.org", 0.3)
+    metrics.observe_host("a.org", 60)
+
+    summary = metrics.summary()
+
+    assert summary["counters"] == dict(urls=100, cache_hits=0)
+    assert summary["hosts"] == {"a.org": {"0.1": 1, "0.5": 1, "+Inf": 1}}
+
+
+def test_run_metrics_phases():
+    """Test the time accumulated in the phases of a run."""
+    metrics = RunMetrics("outdated")
+
+    metrics.add_time("search", 1.0)
+
+    with metrics.phase("search"):
+        pass
+
+    # the time of each item produced by an iterable is measured
+    assert list(metrics.timed(iter([1, 2]), "extraction")) == [1, 2]
+
+    summary = metrics.summary()
+
+    assert set(summary["phases"]) == {"search", "extraction"}
+    assert summary["phases"]["search"] >= 1.0
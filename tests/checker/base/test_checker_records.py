@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the records streaming of the checkers."""
+
+from invenio_rdm_records.proxies import current_rdm_records_service
+from invenio_search.engine import dsl
+
+from geo_rdm_records.modules.checker.base import records as checker_records
+from geo_rdm_records.modules.rdm.records.api import GEORecord
+
+
+def test_iter_records_metadata_by_owner(owner_records):
+    """Test the records (packages and resources) grouped by owner."""
+    owners_records = list(
+        checker_records.iter_records_metadata_by_owner(
+            extra_filter=dsl.Q("term", **{"versions.is_latest": True})
+        )
+    )
+
+    # all records are from a single owner: packages and resources are merged.
+    assert len(owners_records) == 1
+
+    owner_id, records_metadata = owners_records[0]
+
+    assert owner_id == owner_records["owner"]
+    assert [package["id"] for package in records_metadata["packages"]] == [
+        owner_records["package"]
+    ]
+    assert sorted(resource["id"] for resource in records_metadata["resources"]) == (
+        sorted([owner_records["managed_resource"], owner_records["resource"]])
+    )
+
+    # the hits are projected as in the service search
+    assert all("links" in hit for hit in records_metadata["resources"])
+
+
+def test_iter_records_metadata_by_owner_filter(owner_records):
+    """Test the owners filter of the records streaming."""
+    owners_filter = dsl.Q("terms", **{checker_records.OWNER_FIELD: ["-1"]})
+
+    assert list(checker_records.iter_records_metadata_by_owner(owners_filter)) == []
+
+
+def test_get_owners(owner_records):
+    """Test the owners of the records selected by a filter."""
+    assert checker_records.get_owners() == {str(owner_records["owner"])}
+
+
+def test_get_records_by_ids(running_app, owner_records, minimal_record):
+    """Test the metadata of records read by ID (in any version)."""
+    superuser_identity = running_app.superuser_identity
+
+    resource_id = owner_records["resource"]
+
+    # creating a new version: the original record is no longer the latest one
+    new_version = current_rdm_records_service.new_version(
+        superuser_identity, resource_id
+    )
+    current_rdm_records_service.update_draft(
+        superuser_identity, new_version["id"], minimal_record
+    )
+    current_rdm_records_service.publish(superuser_identity, new_version["id"])
+
+    GEORecord.index.refresh()
+
+    records = checker_records.get_records_by_ids(
+        current_rdm_records_service, [resource_id, "not-found"]
+    )
+
+    assert [record["id"] for record in records] == [resource_id]
+    assert records[0]["versions"]["is_latest"] is False
@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the delivery of the checkers reports."""
+
+import smtplib
+from datetime import datetime
+
+import pytest
+from flask_mail import Message
+from jinja2 import DictLoader
+
+from geo_rdm_records.modules.checker import tasks
+from geo_rdm_records.modules.checker.base import report as checker_reports
+from geo_rdm_records.modules.checker.models import GEOCheckerReport, GEOCheckerRun
+
+REPORT_CONFIGURATION = dict(
+    report_title="Records status",
+    report_template="geo_rdm_records/reports/outdated-records-report.html",
+)
+
+
+class FakeConnection:
+    """SMTP connection refusing the messages of some recipients."""
+
+    def __init__(self, failed_recipients):
+        """Initializer."""
+        self.failed_recipients = failed_recipients
+        self.sent = []
+
+    def send(self, message):
+        """Send a message."""
+        if message.recipients[0] in self.failed_recipients:
+            raise smtplib.SMTPServerDisconnected()
+
+        self.sent.append(message)
+
+    def __enter__(self):
+        """Open the connection."""
+        return self
+
+    def __exit__(self, *args):
+        """Close the connection."""
+
+
+@pytest.fixture()
+def checker_run(running_app, db):
+    """Checker run used to store the reports."""
+    run = GEOCheckerRun(checker="outdated", created=datetime.utcnow())
+
+    db.session.add(run)
+    db.session.commit()
+
+    return run
+
+
+@pytest.fixture()
+def delivery(app, monkeypatch):
+    """Fake the owners profiles, the rendering and the SMTP connection."""
+    profiles = {
+        str(owner): dict(
+            id=owner, email=f"owner{owner}@geo.org", active=True, confirmed=True
+        )
+        for owner in [1, 2, 3]
+    }
+    profiles["3"]["confirmed"] = False
+
+    def _render(reports, profiles_, report_configuration, max_workers):
+        return [
+            (
+                report,
+                Message(
+                    subject=report_configuration["report_title"],
+                    recipients=[profiles_[str(report[0])]["email"]],
+                    html=str(report[1]["total_records"]),
+                ),
+            )
+            for report in reports
+        ]
+
+    connection = FakeConnection({"owner2@geo.org"})
+
+    monkeypatch.setattr(
+        checker_reports,
+        "_read_owners_profiles",
+        lambda owners: {str(owner): profiles[str(owner)] for owner in owners},
+    )
+    monkeypatch.setattr(checker_reports, "_render_report_messages", _render)
+    monkeypatch.setattr(app.extensions["mail"], "connect", lambda: connection)
+
+    return connection
+
+
+def test_queue_reports(checker_run, monkeypatch):
+    """Test that only the owners IDs are sent to the delivery task."""
+    queued = []
+
+    monkeypatch.setattr(
+        tasks.send_checker_reports, "delay", lambda *args: queued.append(args)
+    )
+
+    checker_reports.queue_reports(
+        checker_run.id,
+        [(1, dict(total_records=1, updated=datetime(2024, 1, 1))), (2, {})],
+        REPORT_CONFIGURATION,
+    )
+
+    assert queued == [(checker_run.id, [1, 2], REPORT_CONFIGURATION)]
+
+    # the payloads are stored (values not supported in JSON as strings)
+    assert checker_reports._read_reports(checker_run.id, [1, 2]) == [
+        (1, dict(total_records=1, updated="2024-01-01 00:00:00")),
+        (2, {}),
+    ]
+
+    # reports of the same owners are replaced when queued again
+    checker_reports.queue_reports(
+        checker_run.id, [(1, dict(total_records=3))], REPORT_CONFIGURATION
+    )
+
+    assert checker_reports._read_reports(checker_run.id, [1]) == [
+        (1, dict(total_records=3))
+    ]
+
+
+def test_deliver_reports(checker_run, delivery, monkeypatch):
+    """Test the delivery of the reports rebuilt from the database."""
+    monkeypatch.setattr(tasks.send_checker_reports, "delay", lambda *args: None)
+
+    checker_reports.queue_reports(
+        checker_run.id,
+        [(owner, dict(total_records=owner)) for owner in [1, 2, 3]],
+        REPORT_CONFIGURATION,
+    )
+
+    failed_owners = checker_reports.deliver_reports(
+        checker_run.id, [1, 2, 3], REPORT_CONFIGURATION
+    )
+
+    # owner 1 received its report, owner 2 failed and owner 3 can't receive it
+    assert failed_owners == [2]
+    assert [message.html for message in delivery.sent] == ["1"]
+
+    # only the failed reports are kept to be retried
+    remaining = GEOCheckerReport.query.filter_by(run_id=checker_run.id)
+
+    assert [report.owner_id for report in remaining] == [2]
+
+    # retrying the failed reports
+    delivery.failed_recipients = set()
+
+    assert (
+        checker_reports.deliver_reports(
+            checker_run.id, failed_owners, REPORT_CONFIGURATION
+        )
+        == []
+    )
+    assert [message.html for message in delivery.sent] == ["1", "2"]
+    assert GEOCheckerReport.query.filter_by(run_id=checker_run.id).count() == 0
+
+
+def test_render_report_messages(app, monkeypatch):
+    """Test the messages rendered (in threads) with the application templates."""
+    monkeypatch.setattr(
+        app.jinja_env,
+        "loader",
+        DictLoader({"report.html": "{{ total_records }} - {{ report_date }}"}),
+    )
+
+    reports = [(owner, dict(total_records=owner)) for owner in range(10)]
+    profiles = {str(owner): dict(email=f"owner{owner}@geo.org") for owner in range(10)}
+
+    messages = checker_reports._render_report_messages(
+        reports,
+        profiles,
+        dict(report_title="Records status", report_template="report.html"),
+        max_workers=4,
+    )
+
+    assert [report for report, _ in messages] == reports
+    assert [message.recipients for _, message in messages] == [
+        [f"owner{owner}@geo.org"] for owner in range(10)
+    ]
+    assert all(
+        message.html.startswith(f"{owner} - ")
+        for owner, (_, message) in enumerate(messages)
+    )
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the owners state store of the checkers."""
+
+from datetime import datetime, timedelta
+
+from geo_rdm_records.modules.checker.base.state import OwnersStateStore, hash_state
+from geo_rdm_records.modules.checker.models import GEOCheckerOwnerState
+
+
+def test_hash_state():
+    """Test that the order of the state items is not relevant."""
+    assert hash_state([["a", 1], ["b", 2]]) == hash_state([["b", 2], ["a", 1]])
+    assert hash_state([["a", 1]]) != hash_state([["a", 2]])
+
+
+def test_owners_state_store(running_app, db):
+    """Test the owners state updates and the watermarks of a shard."""
+    before = datetime.utcnow() - timedelta(days=1)
+    now = datetime.utcnow()
+
+    store = OwnersStateStore("outdated")
+    store.load([1, 2, 10])
+
+    assert store.watermark() is None
+
+    # 1. New owners are always changed
+    assert all(store.update(owner, "state", before) for owner in [1, 2, 10])
+    store.commit()
+
+    assert store.watermark() == before
+
+    # 2. Only owners with a new state are changed
+    store = OwnersStateStore("outdated", owners_range=(None, 2))
+    store.load([1, 2])
+
+    assert not store.update(1, "state", now)
+    assert store.update(2, "new-state", now)
+    store.commit()
+
+    # 3. The watermarks are moved only for the owners of the shard
+    store.touch(now, exclude=[2])
+    store.commit()
+
+    watermarks = {
+        entry.owner_id: entry.watermark
+        for entry in GEOCheckerOwnerState.query.filter_by(checker="outdated")
+    }
+
+    assert watermarks == {1: now, 2: now, 10: before}
+
+    assert OwnersStateStore("outdated", owners_range=(None, 2)).watermark() == now
+    assert OwnersStateStore("outdated", owners_range=(3, None)).watermark() == before
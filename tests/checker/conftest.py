@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Pytest configuration for the checkers."""
+
+from copy import deepcopy
+
+import pytest
+from invenio_rdm_records.proxies import current_rdm_records_service
+
+from geo_rdm_records.modules.packages import GEOPackageRecord
+from geo_rdm_records.proxies import current_geo_packages_service
+
+
+@pytest.fixture()
+def owner_records(
+    running_app, db, minimal_package, minimal_record, refresh_index, es_clear
+):
+    """Published records of a single owner (a package and two resources).
+
+    The package manages one of the resources, so only the package and the
+    other (not managed) resource are evaluated by the checkers.
+    """
+    superuser_identity = running_app.superuser_identity
+
+    # 1. Creating the resources
+    managed_resource = current_rdm_records_service.create(
+        superuser_identity, deepcopy(minimal_record)
+    )
+
+    resource = current_rdm_records_service.create(
+        superuser_identity, deepcopy(minimal_record)
+    )
+    resource = current_rdm_records_service.publish(superuser_identity, resource["id"])
+
+    # 2. Creating the package with the resources
+    package = current_geo_packages_service.create(
+        superuser_identity, deepcopy(minimal_package)
+    )
+
+    current_geo_packages_service.context_associate(
+        superuser_identity,
+        package["id"],
+        dict(records=[{"id": managed_resource["id"]}]),
+    )
+
+    current_geo_packages_service.resource_add(
+        superuser_identity,
+        package["id"],
+        dict(resources=[{"id": managed_resource["id"]}, {"id": resource["id"]}]),
+    )
+
+    package = current_geo_packages_service.publish(superuser_identity, package["id"])
+
+    refresh_index()
+    GEOPackageRecord.index.refresh()
+
+    return dict(
+        owner=int(superuser_identity.id),
+        package=package["id"],
+        managed_resource=managed_resource["id"],
+        resource=resource["id"],
+    )
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the concurrent link checker engine."""
+
+import threading
+import time
+
+from geo_rdm_records.modules.checker.links.checker.engine import (
+    HostThrottle,
+    LinkCheckerEngine,
+)
+from geo_rdm_records.modules.checker.links.checker.transport import ReplayTransport
+
+FIXTURES = {
+    "https://available.org/a": {"status_code": 200},
+    "https://available.org/b": {"status_code": 200},
+    "https://broken.org/a": {"status_code": 404},
+    "https://nohead.org/a": {"status_code": 200, "head_status_code": 405},
+    "https://nohead.org/b": {"status_code": 200, "head_status_code": 405},
+    "https://timeout.org/a": {"error": "timeout"},
+}
+
+
+class RecordingTransport(ReplayTransport):
+    """Replay transport recording the requests and the concurrency by host."""
+
+    def __init__(self, fixtures, latency=0.0):
+        """Initializer."""
+        super().__init__(fixtures)
+
+        self.latency = latency
+        self.requests = []
+
+        self.active = {}
+        self.max_active = {}
+
+        self._lock = threading.Lock()
+
+    def _response(self, method, url):
+        """Record the request before replaying its response."""
+        host = url.split("/")[2]
+
+        with self._lock:
+            self.requests.append((method, url))
+
+            self.active[host] = self.active.get(host, 0) + 1
+            self.max_active[host] = max(self.max_active.get(host, 0), self.active[host])
+
+        try:
+            time.sleep(self.latency)
+            return super()._response(method, url)
+
+        finally:
+            with self._lock:
+                self.active[host] -= 1
+
+
+def _engine(transport, **engine_config):
+    """Create an engine using the given transport."""
+    engine = LinkCheckerEngine(
+        transport_config=dict(type="replay", fixtures=FIXTURES),
+        engine_config=engine_config,
+    )
+    engine._session = transport
+
+    return engine
+
+
+def test_engine_check_links():
+    """Test the status of the links checked by the engine."""
+    with LinkCheckerEngine(
+        transport_config=dict(type="replay", fixtures=FIXTURES)
+    ) as engine:
+        results = engine.check_links(FIXTURES.keys())
+
+    assert results == {
+        "https://available.org/a": True,
+        "https://available.org/b": True,
+        "https://broken.org/a": False,
+        "https://nohead.org/a": True,
+        "https://nohead.org/b": True,
+        "https://timeout.org/a": False,
+    }
+
+
+def test_engine_checks_each_url_once():
+    """Test that duplicated URLs (in the same or in later calls) are checked once."""
+    transport = RecordingTransport(FIXTURES)
+    engine = _engine(transport)
+
+    urls = ["https://available.org/a", "https://available.org/a"]
+
+    assert engine.check_links(urls) == {"https://available.org/a": True}
+    assert engine.check_links(urls) == {"https://available.org/a": True}
+
+    assert transport.requests == [("head", "https://available.org/a")]
+
+
+def test_engine_remembers_hosts_without_head_support():
+    """Test that hosts rejecting ``HEAD`` are checked directly with ``GET``."""
+    transport = RecordingTransport(FIXTURES)
+    engine = _engine(transport, max_workers=1)
+
+    engine.check_links(["https://nohead.org/a"])
+    engine.check_links(["https://nohead.org/b"])
+
+    assert transport.requests == [
+        ("head", "https://nohead.org/a"),
+        ("get", "https://nohead.org/a"),
+        ("get", "https://nohead.org/b"),
+    ]
+
+
+def test_engine_limits_connections_per_host():
+    """Test the maximum number of concurrent requests to a host."""
+    fixtures = {f"https://host.org/{idx}": {"status_code": 200} for idx in range(12)}
+
+    transport = RecordingTransport(fixtures, latency=0.02)
+    engine = _engine(transport, max_workers=8, max_connections_per_host=2)
+
+    results = engine.check_links(fixtures.keys())
+
+    assert all(results.values())
+    assert transport.max_active["host.org"] == 2
+
+
+def test_host_throttle_politeness_delay():
+    """Test the minimum delay between two requests to the same host."""
+    throttle = HostThrottle(max_connections=4, delay=0.05)
+
+    start = time.monotonic()
+
+    for _ in range(3):
+        with throttle:
+            pass
+
+    assert time.monotonic() - start >= 0.1
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the extraction of links from the records metadata."""
+
+from geo_rdm_records.modules.checker.links.checker.check import _link_candidates
+from geo_rdm_records.modules.checker.links.checker.metadata import (
+    extract_links_from_record,
+)
+
+RECORD = {
+    "metadata": {
+        "title": "Not checked: https://title.org",
+        "description": (
+            '<p>See <a href="https://Example.ORG/data#top">this</a> and '
+            "WWW.example.org/docs.</p>"
+        ),
+        "related_identifiers": [
+            {"identifier": "https://example.org/data"},
+            {"identifier": "10.1234/foo.bar"},
+        ],
+        "locations": {
+            "features": [{"place": "https://place.org/a;", "description": "-"}]
+        },
+    }
+}
+
+
+def test_extract_links_from_record_fields():
+    """Test the links extracted from the given fields."""
+    assert extract_links_from_record(
+        RECORD, ["metadata.description", "metadata.related_identifiers.identifier"]
+    ) == ["https://example.org/data", "WWW.example.org/docs"]
+
+
+def test_extract_links_from_record_configured_fields(app, monkeypatch):
+    """Test the links extracted from the fields defined in the configuration."""
+    monkeypatch.setitem(
+        app.config, "GEO_RDM_CHECKER_LINKS_FIELDS", ["metadata.locations.features"]
+    )
+
+    assert extract_links_from_record(RECORD) == ["https://place.org/a"]
+
+
+def test_link_candidates():
+    """Test the URLs used to test a link."""
+    assert _link_candidates("https://example.org") == ["https://example.org"]
+    assert _link_candidates("ftp://example.org") == []
+    assert _link_candidates("WWW.example.org") == [
+        "http://WWW.example.org",
+        "https://WWW.example.org",
+    ]
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the network functions of the link checker."""
+
+from geo_rdm_records.modules.checker.links.checker.network import (
+    _create_retry,
+    check_link,
+)
+from geo_rdm_records.modules.checker.links.checker.transport import (
+    ReplayTransport,
+    TransportResponse,
+)
+
+
+class RecordingTransport(ReplayTransport):
+    """Replay transport recording the requests (method and headers)."""
+
+    def __init__(self, fixtures):
+        """Initializer."""
+        super().__init__(fixtures)
+        self.requests = []
+
+    def head(self, url, **kwargs):
+        """Send a ``HEAD`` request."""
+        self.requests.append(("head", kwargs))
+        return super().head(url, **kwargs)
+
+    def get(self, url, **kwargs):
+        """Send a ``GET`` request."""
+        self.requests.append(("get", kwargs))
+        return super().get(url, **kwargs)
+
+
+def test_check_link_head():
+    """Test a link available with a ``HEAD`` request."""
+    transport = RecordingTransport(
+        {"https://a.org": {"status_code": 200, "headers": {"ETag": '"v1"'}}}
+    )
+
+    result = check_link("https://a.org", session=transport)
+
+    assert result == dict(
+        is_available=True,
+        etag='"v1"',
+        last_modified=None,
+        head_supported=True,
+        from_cache=False,
+    )
+    assert [method for method, _ in transport.requests] == ["head"]
+
+    # the body is never downloaded
+    assert transport.requests[0][1]["stream"] is True
+
+
+def test_check_link_get_fallback():
+    """Test the ``GET`` fallback of hosts rejecting ``HEAD`` requests."""
+    transport = RecordingTransport(
+        {"https://a.org": {"status_code": 200, "head_status_code": 405}}
+    )
+
+    result = check_link("https://a.org", session=transport)
+
+    assert result["is_available"] and result["head_supported"] is False
+    assert [method for method, _ in transport.requests] == ["head", "get"]
+
+    # hosts known to not support ``HEAD`` are checked directly with ``GET``
+    transport.requests.clear()
+
+    result = check_link("https://a.org", session=transport, head=False)
+
+    assert result["is_available"] and result["head_supported"] is None
+    assert [method for method, _ in transport.requests] == ["get"]
+
+
+def test_check_link_unavailable():
+    """Test unavailable links (HTTP and network errors)."""
+    transport = ReplayTransport(
+        {
+            "https://broken.org": {"status_code": 404},
+            "https://t.org": {"error": "timeout"},
+        }
+    )
+
+    assert not check_link("https://broken.org", session=transport)["is_available"]
+    assert not check_link("https://t.org", session=transport)["is_available"]
+    assert not check_link("https://unknown.org", session=transport)["is_available"]
+
+
+def test_check_link_conditional_request():
+    """Test the conditional requests made with the cache validators."""
+
+    class NotModifiedTransport(RecordingTransport):
+        def _response(self, method, url):
+            return TransportResponse(url, 304)
+
+    transport = NotModifiedTransport({})
+
+    result = check_link(
+        "https://a.org",
+        session=transport,
+        validators=dict(etag='"v1"', last_modified="Mon, 01 Jan 2024 00:00:00 GMT"),
+    )
+
+    assert result["is_available"]
+    assert result["etag"] == '"v1"'
+    assert transport.requests[0][1]["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+
+
+def test_create_retry_budgets():
+    """Test the retry budgets of each kind of error."""
+    retry = _create_retry(retries=3, connect_retries=1, status_to_retry=(503,))
+
+    assert retry.total == 3
+    assert retry.connect == 1
+    assert retry.read == 3 and retry.status == 3
+    assert 503 in retry.status_forcelist and 404 not in retry.status_forcelist
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the links status store."""
+
+from datetime import datetime, timedelta
+
+from geo_rdm_records.modules.checker.links.checker.store import LinkStatusStore
+from geo_rdm_records.modules.checker.models import GEOLinkStatus
+
+URL = "https://example.org/dataset"
+
+
+def _available(is_available, etag=None):
+    """Create a check result."""
+    return dict(is_available=is_available, etag=etag, last_modified=None)
+
+
+def test_store_adaptive_intervals(running_app, db):
+    """Test the intervals until the next check of a URL."""
+    now = datetime(2024, 1, 1)
+    store = LinkStatusStore(dict(healthy_interval=7, failure_interval=1))
+
+    store.load([URL])
+    assert store.is_due(URL, now) and store.status(URL) is None
+
+    # 1. Healthy links are checked less often each time
+    store.update(URL, _available(True, etag='"v1"'), now)
+    store.commit()
+
+    assert not store.is_due(URL, now + timedelta(days=6))
+    assert store.is_due(URL, now + timedelta(days=7))
+
+    store.update(URL, _available(True), now)
+    assert not store.is_due(URL, now + timedelta(days=13))
+
+    # 2. Flapping links are checked as soon as possible
+    store.update(URL, _available(False), now)
+    assert store.is_due(URL, now + timedelta(days=1))
+
+    store.commit()
+
+    # 3. The status is persisted
+    store = LinkStatusStore()
+    store.load([URL])
+
+    assert store.status(URL) == dict(is_available=False, etag=None, last_modified=None)
+
+
+def test_store_concurrent_inserts(running_app, db):
+    """Test the status of a URL inserted by two shards at the same time."""
+    now = datetime(2024, 1, 1)
+
+    shard_a = LinkStatusStore()
+    shard_b = LinkStatusStore()
+
+    # both shards load the URL before any of them stores its status
+    shard_a.load([URL])
+    shard_b.load([URL])
+
+    shard_a.update(URL, _available(True), now)
+    shard_a.commit()
+
+    # the insertion of the second shard conflicts with the first one
+    shard_b.update(URL, _available(False), now + timedelta(hours=1))
+    shard_b.commit()
+
+    entries = GEOLinkStatus.query.filter_by(url_hash=GEOLinkStatus.hash_url(URL))
+
+    assert entries.count() == 1
+    assert entries.one().is_available is False
+    assert entries.one().last_checked == now + timedelta(hours=1)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the offline transports and the benchmark of the link checker."""
+
+import pytest
+from requests.exceptions import Timeout
+
+from geo_rdm_records.modules.checker.links.checker import benchmark
+from geo_rdm_records.modules.checker.links.checker.transport import (
+    ReplayTransport,
+    SimulatedTransport,
+    create_transport,
+)
+
+URLS = [f"https://host-{idx % 20}.org/record/{idx}" for idx in range(500)]
+
+
+def _outcomes(transport, method="get"):
+    """Status code (or ``timeout``) of each URL."""
+    outcomes = []
+
+    for url in URLS:
+        try:
+            outcomes.append(getattr(transport, method)(url).status_code)
+        except Timeout:
+            outcomes.append("timeout")
+
+    return outcomes
+
+
+def test_simulated_transport_is_deterministic():
+    """Test that the simulated servers behavior depends only on the seed."""
+    options = dict(
+        latency=(0, 0), error_rate=0.2, timeout_rate=0.1, head_unsupported_rate=0.5
+    )
+
+    outcomes = _outcomes(SimulatedTransport(seed=42, **options))
+
+    assert outcomes == _outcomes(SimulatedTransport(seed=42, **options))
+    assert outcomes != _outcomes(SimulatedTransport(seed=7, **options))
+
+    # the rates are respected (approximately)
+    assert 50 <= outcomes.count(404) <= 150
+    assert 20 <= outcomes.count("timeout") <= 80
+    assert set(outcomes) == {200, 404, "timeout"}
+
+    # ``HEAD`` support is defined per host
+    head_outcomes = _outcomes(SimulatedTransport(seed=42, **options), "head")
+    hosts = {}
+
+    for url, outcome in zip(URLS, head_outcomes):
+        if outcome != "timeout":
+            hosts.setdefault(url.split("/")[2], set()).add(outcome == 405)
+
+    assert all(len(value) == 1 for value in hosts.values())
+
+
+def test_create_transport():
+    """Test the transports created from the configuration."""
+    assert isinstance(create_transport(dict(type="simulated")), SimulatedTransport)
+    assert isinstance(
+        create_transport(dict(type="replay", fixtures={})), ReplayTransport
+    )
+
+    with pytest.raises(ValueError):
+        create_transport(dict(type="invalid"))
+
+
+def test_run_benchmark():
+    """Test the benchmark reproducible with a fixed seed."""
+    records = benchmark.generate_records(records=20, links=3, hosts=5, seed=1)
+
+    assert records == benchmark.generate_records(records=20, links=3, hosts=5, seed=1)
+
+    transport_config = dict(type="simulated", latency=(0, 0), error_rate=0.3, seed=1)
+
+    results = benchmark.run_benchmark(
+        records, dict(max_workers=4), dict(transport_config)
+    )
+
+    assert results["records"] == 20
+    assert results["broken_links"] > 0
+    assert (
+        benchmark.run_benchmark(records, dict(max_workers=2), dict(transport_config))[
+            "broken_links"
+        ]
+        == results["broken_links"]
+    )
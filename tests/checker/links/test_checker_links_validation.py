@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the links validation of many owners."""
+
+from geo_rdm_records.modules.checker.links import validation
+from geo_rdm_records.modules.checker.links.checker import check
+from geo_rdm_records.modules.checker.links.checker.engine import LinkCheckerEngine
+
+OWNERS_LINKS = [
+    (
+        1,
+        dict(
+            packages=[
+                dict(
+                    package={"pkg-1": ["https://shared.org", "https://pkg.org"]},
+                    resources={"res-1": ["https://shared.org"]},
+                )
+            ],
+            resources={"res-2": ["https://broken.org"]},
+        ),
+        3,
+    ),
+    (
+        2,
+        dict(packages=[], resources={"res-3": ["https://shared.org"]}),
+        1,
+    ),
+]
+
+
+def test_links_validation_records_ids():
+    """Test the records IDs listed from a records links object."""
+    packages, resources = validation._records_ids(OWNERS_LINKS[0][1])
+
+    assert packages == ["pkg-1"]
+    assert resources == ["res-1", "res-2"]
+
+
+def test_links_validation_owner_records_metadata():
+    """Test the selection of the metadata of an owner from a batch of owners."""
+    records_metadata = dict(
+        packages={"pkg-1": {"id": "pkg-1"}},
+        resources={
+            "res-1": {"id": "res-1"},
+            "res-2": {"id": "res-2"},
+            "res-3": {"id": "res-3"},
+        },
+    )
+
+    assert validation._owner_records_metadata(
+        OWNERS_LINKS[0][1], records_metadata
+    ) == dict(
+        packages=[{"id": "pkg-1"}],
+        resources=[{"id": "res-1"}, {"id": "res-2"}],
+    )
+
+    # records not found in the index are ignored
+    assert validation._owner_records_metadata(
+        OWNERS_LINKS[1][1], dict(packages={}, resources={})
+    ) == dict(packages=[], resources=[])
+
+
+def test_links_validation_checks_unique_links_once():
+    """Test that links shared by many owners are checked once."""
+    links = set()
+
+    for _, records_links, _ in OWNERS_LINKS:
+        links.update(validation._records_links(records_links))
+
+    fixtures = {
+        "https://shared.org": {"status_code": 200},
+        "https://pkg.org": {"status_code": 200},
+    }
+
+    with LinkCheckerEngine(
+        transport_config=dict(type="replay", fixtures=fixtures)
+    ) as engine:
+        links_status = check.checker_check_links(links, engine)
+
+    assert len(links_status) == 3
+    assert links_status["https://shared.org"]["is_available"]
+    assert not links_status["https://broken.org"]["is_available"]
+
+    # the status of the links is distributed to the records of each owner
+    results = validation._build_records_links_status(OWNERS_LINKS[1][1], links_status)
+
+    assert results == [
+        dict(
+            id="res-3",
+            links_status=[
+                dict(link="https://shared.org", is_available=True, is_tested=True)
+            ],
+        )
+    ]
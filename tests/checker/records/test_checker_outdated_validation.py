@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the outdated records validation."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from invenio_search.engine import dsl
+from pydash import py_
+
+from geo_rdm_records.modules.checker.base import report as checker_reports
+from geo_rdm_records.modules.checker.records import records as record_utils
+from geo_rdm_records.modules.checker.records import validation
+
+REPORT_CONFIGURATION = dict(
+    report_title="Records status",
+    report_template="geo_rdm_records/reports/outdated-records-report.html",
+)
+
+
+@pytest.fixture()
+def queued_reports(monkeypatch):
+    """Capture the reports queued by the validation."""
+    reports = []
+
+    monkeypatch.setattr(
+        checker_reports,
+        "queue_reports",
+        lambda run_id, reports_, report_configuration: reports.extend(reports_),
+    )
+
+    return reports
+
+
+def test_batches():
+    """Test the batches created from a stream (consumed lazily)."""
+    consumed = []
+
+    def _stream():
+        for item in range(5):
+            consumed.append(item)
+            yield item
+
+    batches = validation._batches(_stream(), 2)
+
+    assert next(batches) == [0, 1]
+    assert consumed == [0, 1]
+
+    assert list(batches) == [[2, 3], [4]]
+
+
+def test_terms_filter():
+    """Test the terms filter split in chunks."""
+    assert validation._terms_filter("id", [1, 2, 3], 2).to_dict() == {
+        "bool": {
+            "should": [{"terms": {"id": [1, 2]}}, {"terms": {"id": [3]}}],
+            "minimum_should_match": 1,
+        }
+    }
+
+    assert validation._terms_filter("id", [], 2) == dsl.Q("match_none")
+
+
+@pytest.mark.parametrize("outdated_criteria,outdated", [(0, 2), (365, 0)])
+def test_validate_records_outdated(
+    owner_records, queued_reports, monkeypatch, outdated_criteria, outdated
+):
+    """Test the outdated records evaluated in batches of owners."""
+    monkeypatch.setattr(validation, "OWNERS_BATCH_SIZE", 1)
+
+    stats = validation.validate_records_outdated(
+        dict(outdated_criteria=outdated_criteria, incremental=False),
+        REPORT_CONFIGURATION,
+        run_id=1,
+    )
+
+    # the managed resource is evaluated with its package
+    assert py_.omit(stats, "metrics") == dict(owners=1, records=3, outdated=outdated)
+
+    assert len(queued_reports) == 1
+
+    owner_id, results = queued_reports[0]
+
+    assert owner_id == owner_records["owner"]
+    assert [result["record"]["id"] for result in results["packages"]] == [
+        owner_records["package"]
+    ]
+    assert [result["record"]["id"] for result in results["resources"]] == [
+        owner_records["resource"]
+    ]
+
+
+def test_changed_owners(owner_records, monkeypatch):
+    """Test the owners selected by the changes in their records."""
+    owner = str(owner_records["owner"])
+    now = datetime.utcnow()
+
+    assert validation._changed_owners(None, now - timedelta(days=1), 365, now) == [
+        owner
+    ]
+    assert validation._changed_owners(None, now, 365, now) == []
+
+    # the packages of the changed resources are found
+    assert record_utils.get_resources_packages(dsl.Q("match_all")) == {
+        owner_records["package"]
+    }
+
+    # resources changed by other owners select the owner of the package
+    monkeypatch.setattr(
+        record_utils,
+        "get_resources_packages",
+        lambda extra_filter: {owner_records["package"]},
+    )
+
+    assert validation._changed_owners(None, now, 365, now) == [owner]
+    assert (
+        validation._changed_owners(
+            dsl.Q("term", **{"parent.access.owned_by.user": "0"}), now, 365, now
+        )
+        == []
+    )
+
+
+def test_validate_records_outdated_incremental(owner_records, queued_reports):
+    """Test that only owners with changes are reported in the incremental mode."""
+    configuration = dict(outdated_criteria=0, incremental=True)
+
+    # 1. First run: all owners are evaluated
+    stats = validation.validate_records_outdated(
+        configuration, REPORT_CONFIGURATION, run_id=1, owners_range=(None, None)
+    )
+
+    assert stats["owners"] == 1
+    assert len(queued_reports) == 1
+
+    # 2. Without changes, the owners are not reported again
+    stats = validation.validate_records_outdated(
+        configuration, REPORT_CONFIGURATION, run_id=2, owners_range=(None, None)
+    )
+
+    assert stats["owners"] == 0
+    assert len(queued_reports) == 1
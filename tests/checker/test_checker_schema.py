@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022-2024 GEO Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the records serializer of the checkers reports."""
+
+from geo_rdm_records.modules.checker.schema import EmailRecordSerializerCache
+
+
+class CountingSerializer:
+    """Serializer counting the serialized records."""
+
+    def __init__(self):
+        """Initializer."""
+        self.calls = 0
+
+    def dump_obj(self, record):
+        """Serialize a record."""
+        self.calls += 1
+        return dict(record)
+
+
+def test_email_record_serializer_cache():
+    """Test the records serialized only once (by revision) and the cache clean."""
+    serializer = EmailRecordSerializerCache(maxsize=2)
+    serializer._serializer = CountingSerializer()
+
+    record = dict(id="abc", revision_id=1)
+
+    assert serializer.dump_obj(record) == record
+    assert serializer.dump_obj(record) == record
+    assert serializer._serializer.calls == 1
+
+    # new revisions are serialized again
+    serializer.dump_obj(dict(id="abc", revision_id=2))
+    assert serializer._serializer.calls == 2
+
+    # the oldest records are removed from the cache
+    serializer.dump_obj(dict(id="def", revision_id=1))
+    serializer.dump_obj(record)
+    assert serializer._serializer.calls == 4
+
+    serializer.clear()
+    serializer.dump_obj(dict(id="def", revision_id=1))
+    assert serializer._serializer.calls == 5
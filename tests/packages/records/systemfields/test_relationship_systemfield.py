@@ -62,3 +62,59 @@ def test_package_relationship_from_dict(running_app):
     assert relationship_entity_obj.dump() == dict(
         resources=relationship_managed,
     )
+
+
+def test_package_relationship_resources_container(running_app):
+    """Test the list semantics of the ``resources`` container."""
+    resources = PackageRelationship.resources_cls(
+        [{"id": "abcd-123"}, "efgh-456", {"id": "abcd-123"}]
+    )
+
+    # 1. Duplicated records are ignored and the order is preserved.
+    assert len(resources) == 2
+    assert resources.dump() == [{"id": "abcd-123"}, {"id": "efgh-456"}]
+
+    # 2. Membership and hashing
+    assert "abcd-123" in resources
+    assert {"id": "efgh-456"} in resources
+    assert "ijkl-789" not in resources
+
+    assert len(set(resources) | set(resources)) == 2
+
+    # 3. Positional access and removal
+    resources.append({"id": "ijkl-789"})
+
+    assert resources[-1].record_id == "ijkl-789"
+
+    resources.remove("abcd-123")
+
+    assert resources.dump() == [{"id": "efgh-456"}, {"id": "ijkl-789"}]
+
+
+def test_package_relationship_resources_positional_access(running_app):
+    """Test the positional operations of the ``resources`` container."""
+    resources = PackageRelationship.resources_cls(["a", "b", "c"])
+
+    # 1. Reading by position (after removals, the order is rebuilt once)
+    resources.remove("b")
+
+    assert [resources[0].record_id, resources[1].record_id] == ["a", "c"]
+    assert [record.record_id for record in resources[::-1]] == ["c", "a"]
+
+    # 2. Positional changes keep the dictionary and the order in sync
+    resources.insert(1, "d")
+    resources[0] = "e"
+
+    assert resources.dump() == [{"id": "e"}, {"id": "d"}, {"id": "c"}]
+    assert "a" not in resources and "e" in resources
+
+    del resources[1]
+
+    assert resources.dump() == [{"id": "e"}, {"id": "c"}]
+
+    # 3. Overridden mixins
+    resources.reverse()
+
+    assert resources.index("e") == 1
+    assert resources.pop(0).record_id == "c"
+    assert resources.dump() == [{"id": "e"}]
@@ -7,7 +7,11 @@
 
 """Test Package API integration."""
 
+from geo_rdm_records.base.records.identity_map import records_identity_map
 from geo_rdm_records.modules.packages.records.api import GEOPackageDraft
+from geo_rdm_records.modules.packages.records.systemfields.relationship import (
+    PackageRelationship,
+)
 from geo_rdm_records.modules.rdm.records.api import GEODraft, GEORecord
 
 
@@ -54,3 +58,58 @@ def test_package_integration_with_resources(
     package_draft.relationship.resources.remove(resource_record)
 
     assert len(package_draft.relationship.resources) == 0
+
+
+def test_package_resources_bulk_resolve(
+    db, running_app, minimal_package, minimal_record, es_clear
+):
+    """Test the bulk resolution of the package resources."""
+    package_draft = GEOPackageDraft.create(minimal_package)
+    resource_draft = GEODraft.create(minimal_record)
+    resource_draft_2 = GEODraft.create(minimal_record)
+
+    package_draft.commit()
+    resource_draft.commit()
+    resource_draft_2.commit()
+
+    db.session.commit()
+
+    # Publishing one of the resources
+    resource_record = GEORecord.publish(resource_draft_2)
+    resource_record.commit()
+
+    db.session.commit()
+
+    # Linking the resources with the package (using only the ids)
+    package_draft.relationship.resources.add(resource_draft.pid.pid_value)
+    package_draft.relationship.resources.add(resource_record.pid.pid_value)
+
+    # 1. Resolving all resources at once
+    with records_identity_map() as identity_map:
+        resources = package_draft.relationship.resources.resolve_all()
+
+        assert len(resources) == 2
+        assert resources[0].is_draft
+        assert resources[0].id == resource_draft.id
+        assert not resources[1].is_draft
+        assert resources[1].id == resource_record.id
+
+        # 2. Resolved records are shared through the identity map
+        assert len(identity_map) == 2
+
+        resources_proxy = PackageRelationship.resources_cls(
+            [resource_draft.pid.pid_value]
+        )
+
+        assert resources_proxy[0].resolve() is resources[0]
+
+
+def test_package_resources_remove_while_iterating():
+    """Test the resources removed while iterating over the package resources."""
+    resources = PackageRelationship.resources_cls(["a", "b", "c"])
+
+    for resource in resources:
+        if resource.record_id != "b":
+            resources.remove(resource)
+
+    assert [resource.record_id for resource in resources] == ["b"]
@@ -7,12 +7,15 @@
 
 """Test Package API Services."""
 
+from copy import deepcopy
+
 import pytest
 from invenio_pidstore.errors import PIDDoesNotExistError
 from invenio_rdm_records.proxies import current_rdm_records_service
 from sqlalchemy.orm.exc import NoResultFound
 
 from geo_rdm_records.modules.packages import GEOPackageDraft
+from geo_rdm_records.modules.packages.errors import InvalidPackageResourceError
 from geo_rdm_records.proxies import current_geo_packages_service
 
 
@@ -711,3 +714,168 @@ def test_package_validation(
     )
 
     assert len(result["errors"]) == 0
+
+
+def test_package_bulk_read_records(
+    running_app, db, draft_resource_record, published_resource_record
+):
+    """Test the bulk read of package resources (Drafts and Records)."""
+    superuser_identity = running_app.superuser_identity
+
+    draft_pid = draft_resource_record.pid.pid_value
+    record_pid = published_resource_record.pid.pid_value
+
+    # 1. Reading drafts and records at once.
+    records = current_geo_packages_service._read_records(
+        superuser_identity, [draft_pid, record_pid], allow_draft=True
+    )
+
+    assert records[draft_pid].is_draft
+    assert not records[record_pid].is_draft
+    assert records[record_pid].id == published_resource_record.id
+
+    # 2. Drafts are not loaded when they are not allowed.
+    with pytest.raises(InvalidPackageResourceError):
+        current_geo_packages_service._read_records(
+            superuser_identity, [draft_pid, record_pid], allow_draft=False
+        )
+
+    # 3. Invalid identifiers.
+    with pytest.raises(PIDDoesNotExistError):
+        current_geo_packages_service._read_records(
+            superuser_identity, [record_pid, "invalid-pid"], allow_draft=True
+        )
+
+
+def test_package_bulk_delete_resources(
+    running_app, db, minimal_package, minimal_record, es_clear
+):
+    """Test the removal of many resources from a package at once."""
+    superuser_identity = running_app.superuser_identity
+
+    # 1. Creating a package with many published resources
+    resources = []
+    for _ in range(5):
+        resource = current_rdm_records_service.create(
+            superuser_identity, deepcopy(minimal_record)
+        )
+        resource = current_rdm_records_service.publish(
+            superuser_identity, resource["id"]
+        )
+
+        resources.append(resource["id"])
+
+    package = current_geo_packages_service.create(
+        superuser_identity, deepcopy(minimal_package)
+    )
+    package_pid = package["id"]
+
+    current_geo_packages_service.resource_add(
+        superuser_identity,
+        package_pid,
+        dict(resources=[{"id": resource} for resource in resources]),
+    )
+
+    # 2. Removing many resources in a single request
+    deleted_resources = resources[1::2] + [resources[-1]]
+
+    result = current_geo_packages_service.resource_delete(
+        superuser_identity,
+        package_pid,
+        dict(resources=[{"id": resource} for resource in deleted_resources]),
+    )
+
+    assert len(result["errors"]) == 0
+
+    # 3. Checking the package (the order of the resources is kept)
+    package_draft = current_geo_packages_service.read_draft(
+        superuser_identity, package_pid
+    )
+
+    assert [
+        resource["id"] for resource in package_draft["relationship"]["resources"]
+    ] == [resources[0], resources[2]]
+
+    # 4. Checking the resources
+    for resource in resources:
+        resource_relationship = current_rdm_records_service.read(
+            superuser_identity, resource
+        )["relationship"]
+
+        expected_packages = [] if resource in deleted_resources else [package_pid]
+
+        assert [
+            package["id"] for package in resource_relationship["packages"]
+        ] == expected_packages
+
+
+def test_package_publishing_indexes_resources(
+    running_app, db, draft_resource_record, minimal_package, refresh_index, es_clear
+):
+    """Test the managed resources indexed when the package is published."""
+    superuser_identity = running_app.superuser_identity
+
+    resource_pid = draft_resource_record.pid.pid_value
+
+    # 1. Creating a package managing the draft resource
+    package = current_geo_packages_service.create(
+        superuser_identity, deepcopy(minimal_package)
+    )
+    package_pid = package["id"]
+
+    current_geo_packages_service.context_associate(
+        superuser_identity, package_pid, dict(records=[{"id": resource_pid}])
+    )
+    current_geo_packages_service.resource_add(
+        superuser_identity, package_pid, dict(resources=[{"id": resource_pid}])
+    )
+
+    # 2. Publishing the package (and its resources)
+    current_geo_packages_service.publish(superuser_identity, package_pid)
+
+    refresh_index()
+
+    # 3. The resource is available in the records index
+    resources = current_rdm_records_service.search(
+        superuser_identity, params=dict(q=f"id:{resource_pid}")
+    ).to_dict()
+
+    assert resources["hits"]["total"] == 1
+
+    resource = resources["hits"]["hits"][0]
+
+    assert resource["is_published"]
+    assert resource["versions"]["is_latest"]
+    assert [package["id"] for package in resource["relationship"]["packages"]] == [
+        package_pid
+    ]
+
+
+def test_package_publishing_with_deleted_resource(
+    running_app, db, draft_resource_record, minimal_package, es_clear
+):
+    """Test that packages with deleted resources are not published."""
+    superuser_identity = running_app.superuser_identity
+
+    package_pid = current_geo_packages_service.create(
+        superuser_identity, minimal_package
+    )["id"]
+
+    resource_pid = draft_resource_record.pid.pid_value
+
+    current_geo_packages_service.context_associate(
+        superuser_identity, package_pid, dict(records=[{"id": resource_pid}])
+    )
+    current_geo_packages_service.resource_add(
+        superuser_identity, package_pid, dict(resources=[{"id": resource_pid}])
+    )
+
+    # deleting the resource PID (the package keeps the dangling resource)
+    draft_resource_record.pid.delete()
+    db.session.commit()
+
+    with pytest.raises(PIDDoesNotExistError):
+        current_geo_packages_service.validate_package(superuser_identity, package_pid)
+
+    with pytest.raises(PIDDoesNotExistError):
+        current_geo_packages_service.publish(superuser_identity, package_pid)
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Geo Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the search result cache."""
+
+import time
+
+import pytest
+
+from geo_rdm_records.modules.search.services.cache import (
+    LocalCacheBackend,
+    SearchResultCache,
+    create_search_cache,
+    normalize_params,
+)
+
+
+class PublishedRecord:
+    """Published record available in the searches."""
+
+
+class DraftRecord:
+    """Draft record (not available in the public searches)."""
+
+
+@pytest.fixture()
+def search_cache():
+    """Search result cache (without the refresh interval)."""
+    return SearchResultCache(
+        LocalCacheBackend(max_entries=2),
+        dict(ttl=60, refresh_interval=0),
+        record_types=[PublishedRecord],
+    )
+
+
+def test_normalize_params():
+    """Test the params normalized (same searches with the same params)."""
+    assert normalize_params(
+        dict(q="  forest   fires ", page=1, sort="", facets=dict(type=["b", "a"], x=[]))
+    ) == dict(q="forest fires", page=1, facets=dict(type=["a", "b"]))
+
+
+def test_search_result_cache(search_cache):
+    """Test the entries indexed by the params and the permission filter."""
+    key = search_cache.key(dict(q="forest"), "public")
+
+    assert key == search_cache.key(dict(q=" forest ", page=None), "public")
+    assert key != search_cache.key(dict(q="forest"), "other")
+
+    search_cache.set(key, dict(hits=dict(total=1)))
+
+    assert search_cache.get(key) == dict(hits=dict(total=1))
+
+    # least recently used entries are removed
+    search_cache.set(search_cache.key(dict(q="a"), "public"), {})
+    search_cache.set(search_cache.key(dict(q="b"), "public"), {})
+
+    assert search_cache.get(key) is None
+
+
+def test_search_result_cache_invalidation(search_cache):
+    """Test that only published records invalidate the cache."""
+    key = search_cache.key(dict(q="forest"), "public")
+    search_cache.set(key, {})
+
+    search_cache.invalidate_record(None, record=DraftRecord(), json={})
+
+    assert search_cache.key(dict(q="forest"), "public") == key
+    assert search_cache.get(key) == {}
+
+    search_cache.invalidate_record(None, record=PublishedRecord(), json={})
+
+    assert search_cache.key(dict(q="forest"), "public") != key
+    assert search_cache.get(key) is None
+
+
+def test_search_result_cache_refresh_interval():
+    """Test that no entry is stored until the indices are refreshed."""
+    search_cache = SearchResultCache(LocalCacheBackend(), dict(refresh_interval=60))
+
+    search_cache.invalidate()
+
+    key = search_cache.key(dict(q="forest"), "public")
+    search_cache.set(key, {})
+
+    assert search_cache.get(key) is None
+
+
+def test_local_cache_backend_ttl():
+    """Test the expired entries."""
+    backend = LocalCacheBackend()
+    backend.set("key", {"a": 1}, ttl=0.01)
+
+    assert backend.get("key") == {"a": 1}
+
+    time.sleep(0.02)
+
+    assert backend.get("key") is None
+
+
+def test_create_search_cache():
+    """Test the cache created from the configuration (disabled by default)."""
+    assert create_search_cache({}) is None
+    assert create_search_cache(dict(enabled=False, backend="local")) is None
+    assert isinstance(
+        create_search_cache(dict(enabled=True, backend="local")), SearchResultCache
+    )
+
+    with pytest.raises(ValueError):
+        create_search_cache(dict(enabled=True, backend="invalid"))
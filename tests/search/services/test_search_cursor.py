@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2022 Geo Secretariat.
+#
+# geo-rdm-records is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Test the cursor-based searches (points in time)."""
+
+import pytest
+from flask_principal import AnonymousIdentity
+from invenio_access.permissions import any_user
+from invenio_records_resources.services.errors import PermissionDeniedError
+
+from geo_rdm_records.base.services import search as search_services
+from geo_rdm_records.base.services.params import encode_cursor
+from geo_rdm_records.base.services.params import search as search_params
+from geo_rdm_records.proxies import current_geo_rdm_records
+
+
+class FakeSearch:
+    """Search returning a fixed number of hits."""
+
+    def __init__(self, hits, pit_id="pit-1"):
+        """Initializer."""
+        self.hits = hits
+        self.pit_id = pit_id
+
+    def execute(self):
+        """Execute the search."""
+        return self
+
+    def to_dict(self):
+        """Search request body."""
+        return dict(pit=dict(id=self.pit_id))
+
+
+@pytest.fixture()
+def closed_pits(monkeypatch):
+    """Capture the points in time deleted."""
+    pits = []
+
+    monkeypatch.setattr(search_services, "close_point_in_time", pits.append)
+
+    return pits
+
+
+def test_search_cursor_anonymous(running_app, monkeypatch):
+    """Test that anonymous users can't open new points in time."""
+    opened = []
+
+    class FakeClient:
+        def create_point_in_time(self, index, keep_alive):
+            opened.append(index)
+            return dict(pit_id="pit-1")
+
+    monkeypatch.setattr(search_params, "current_search_client", FakeClient())
+
+    identity = AnonymousIdentity()
+    identity.provides.add(any_user)
+
+    service = current_geo_rdm_records.service_search
+
+    with pytest.raises(PermissionDeniedError):
+        service.search(identity, params=dict(cursor="*"))
+
+    assert opened == []
+
+
+def test_search_cursor_last_page(running_app, closed_pits):
+    """Test the point in time deleted when the last page is returned."""
+    service = current_geo_rdm_records.service_search
+    params = dict(cursor=encode_cursor("pit-1", [1]), size=2)
+
+    # 1. Full page: the walk continues
+    service._execute_search(FakeSearch([1, 2]), params)
+
+    assert closed_pits == []
+
+    # 2. Last page
+    service._execute_search(FakeSearch([3]), params)
+
+    assert closed_pits == ["pit-1"]
+
+    # 3. Searches outside the cursor mode don't use PITs
+    service._execute_search(FakeSearch([]), dict(size=2))
+
+    assert closed_pits == ["pit-1"]
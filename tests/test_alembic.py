@@ -40,6 +40,12 @@ def test_alembic(base_app, database):
                 "geo_marketplace_items_metadata",
                 "geo_marketplace_items_files",
                 "geo_marketplace_drafts_metadata",
+                "geo_checker_links_status",
+                "geo_checker_runs",
+                "geo_checker_shards",
+                "geo_checker_owners_state",
+                "geo_checker_reports",
+                "geo_checker_locks",
             ]
         ]
     )